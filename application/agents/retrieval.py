@@ -2,10 +2,20 @@ from asyncio import Queue
 import asyncio
 import json
 import logging
-from typing import List
+import math
+import time
+from typing import List, Tuple
+import httpx
+from fastapi import HTTPException
 from pydantic import BaseModel, Field
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.messages import HumanMessage, SystemMessage
+from common.cache import TieredCache
+from common.circuit_breaker import CircuitOpenError
+from common.resilience import LatencyTracker, hedged, retry_with_jitter
+from common.tracing import traced
+from config import get_settings
+from domain.api.exceptions import ExternalApiError
 from domain.api.models import RerankOutput, RerankSchema, SearchResponse
 from domain.api.rerank_repository import IRerankRepository
 from domain.api.studio_repository import IStudioRepository
@@ -13,6 +23,9 @@ from domain.chats.models.control import ControlSignal
 from domain.plans.observation_item import ObservationItem
 from domain.plans.sub_step import SubStepInfo
 from infra.wrapper.haiqv_chat_ollama import HaiqvChatOllama
+from utils.str_utils import dedupe_keywords, keyword_key
+
+retrieval_settings = get_settings().retrieval
 
 _KEYWORD_EXTRACTION_SYSTEM_PROMPT = """
 The user needs to query the documents based on a given question.
@@ -29,11 +42,16 @@ class RetrievalAgent:
         studio_repository: IStudioRepository,
         rerank_repository: IRerankRepository,
         llm: HaiqvChatOllama,
+        search_latency: LatencyTracker,
+        search_cache: TieredCache[tuple, tuple[List[SearchResponse], float]],
     ):
         self.studio_repository = studio_repository
         self.rerank_repository = rerank_repository
         self.llm = llm
+        self.search_latency = search_latency
+        self.search_cache = search_cache
 
+    @traced("retrieval.keyword")
     async def get_keyword_from_query(
         self,
         user_query: str,
@@ -63,6 +81,155 @@ class RetrievalAgent:
 
         return keyword_string_list
 
+    def _hedge_delay(self) -> float:
+        p = self.search_latency.percentile(retrieval_settings.search_hedge_percentile)
+        if p is None:
+            return retrieval_settings.search_hedge_default_delay
+        return max(retrieval_settings.search_hedge_min_delay, p)
+
+    @traced("retrieval.search_keyword")
+    async def _search_keyword(
+        self,
+        user_id: str,
+        app_id: str,
+        keyword: str,
+        top_k: int,
+        report: dict,
+    ) -> List[SearchResponse]:
+        """키워드 1건 검색: 캐시 조회 후 p95 지연 이후 hedge 요청, 실패 시 jitter 재시도"""
+
+        async def _call() -> List[SearchResponse]:
+            started = time.perf_counter()
+            docs = await self.studio_repository.get_similar_documents(
+                user_id=user_id,
+                app_id=app_id,
+                query=keyword,
+                top_k=top_k,
+            )
+            self.search_latency.record(time.perf_counter() - started)
+            return docs
+
+        def _on_hedge() -> None:
+            report["hedged"] += 1
+
+        def _on_retry(attempt: int, e: BaseException) -> None:
+            report["retried"] += 1
+            logging.warning(f"'{keyword}' 검색 재시도 ({attempt}): {e}")
+
+        loaded = False
+
+        async def _load() -> tuple[List[SearchResponse], float]:
+            nonlocal loaded
+            loaded = True
+            started = time.perf_counter()
+            docs = await retry_with_jitter(
+                lambda: hedged(_call, delay=self._hedge_delay(), on_hedge=_on_hedge),
+                max_retries=retrieval_settings.search_max_retries,
+                base_delay=retrieval_settings.search_retry_base_delay,
+                max_delay=retrieval_settings.search_retry_max_delay,
+                retry_on=(ExternalApiError,),
+                on_retry=_on_retry,
+            )
+            return docs, time.perf_counter() - started
+
+        # (app, 키워드, top_k) 단위 캐시. 값에 원 검색 소요 시간을 함께 보관
+        # (다른 워커가 검색한 결과를 공유 계층에서 가져온 경우도 캐시 히트)
+        # 다른 요청이 같은 키를 적재 중이면 그 검색을 끝까지 기다리므로 히트로 세지 않는다
+        cache_key = (app_id.upper(), keyword_key(keyword), top_k)
+        joined = self.search_cache.get(
+            cache_key
+        ) is None and self.search_cache.is_loading(cache_key)
+        docs, seconds = await self.search_cache.get_or_load(cache_key, _load)
+        if joined:
+            report["coalesced"] += 1
+        elif not loaded:
+            report["cache_hits"] += 1
+            report["saved_ms"] += round(seconds * 1000)
+        return docs
+
+    @traced("retrieval.search")
+    async def search_documents(
+        self,
+        user_id: str,
+        app_id: str,
+        keyword_list: List[str],
+        top_k: int,
+    ) -> Tuple[List[SearchResponse], dict]:
+        """
+        키워드별 유사도 검색을 병렬 수행.
+        정족수(quorum) 이상의 키워드가 응답하면 deadline 까지만 나머지를 기다리고
+        부분 결과로 진행한다("partial" 모드). 모든 검색이 실패한 경우에만 예외.
+        """
+        report = {
+            "mode": "complete",
+            "keywords": len(keyword_list),
+            "succeeded": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "hedged": 0,
+            "retried": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+            "cache_hit_rate": 0.0,
+            "saved_ms": 0,
+        }
+        if not keyword_list:
+            return [], report
+
+        tasks = {
+            asyncio.create_task(
+                self._search_keyword(user_id, app_id, keyword, top_k, report)
+            ): keyword
+            for keyword in keyword_list
+        }
+        quorum = max(
+            1, math.ceil(len(keyword_list) * retrieval_settings.search_quorum_ratio)
+        )
+        deadline = time.monotonic() + retrieval_settings.search_deadline
+
+        total_documents: List[SearchResponse] = []
+        errors: List[BaseException] = []
+        pending = set(tasks)
+        try:
+            while pending:
+                timeout = None
+                if report["succeeded"] >= quorum:
+                    timeout = max(0.0, deadline - time.monotonic())
+
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+
+                for task in done:
+                    if task.exception() is None:
+                        report["succeeded"] += 1
+                        total_documents.extend(task.result())
+                    else:
+                        report["failed"] += 1
+                        errors.append(task.exception())
+                        logging.warning(
+                            f"'{tasks[task]}' 검색 실패: {task.exception()}"
+                        )
+        finally:
+            for task in pending:
+                task.cancel()
+
+        report["timed_out"] = len(pending)
+
+        if report["succeeded"] == 0:
+            raise ExternalApiError(
+                f"유사도 검색 전체 실패: {errors[-1] if errors else ''}"
+            )
+
+        if report["failed"] or report["timed_out"]:
+            report["mode"] = "partial"
+        report["cache_hit_rate"] = round(report["cache_hits"] / len(keyword_list), 2)
+
+        return total_documents, report
+
+    @traced("retrieval.rerank")
     async def rerank_documents(
         self,
         documents: List[SearchResponse],
@@ -117,6 +284,7 @@ class RetrievalAgent:
             user_query=user_query,
             keyword_num_to_extract=keyword_num_to_extract,
         )
+        keyword_list = dedupe_keywords(keyword_list)
 
         if verbose:
             logging.info(f"keywords: {keyword_list}")
@@ -134,28 +302,21 @@ class RetrievalAgent:
         sub_status.status = "processing"
         yield sub_status
 
-        total_documents: List[SearchResponse] = []
-
-        tasks = [
-            self.studio_repository.get_similar_documents(
-                user_id=user_id,
-                app_id=app_id,
-                query=keyword,
-                top_k=top_k,
-            )
-            for keyword in keyword_list
-        ]
-
-        results = await asyncio.gather(*tasks)
+        total_documents, search_report = await self.search_documents(
+            user_id=user_id,
+            app_id=app_id,
+            keyword_list=keyword_list,
+            top_k=top_k,
+        )
 
-        total_documents = []
-        for docs in results:
-            total_documents.extend(docs)
+        if verbose:
+            logging.info(f"search: {search_report}")
 
         unique_documents_dict = {doc.chunk_id: doc for doc in total_documents}
         unique_documents = list(unique_documents_dict.values())
 
         sub_status.status = "complete"
+        sub_status.observation = ObservationItem(type="key_value", value=search_report)
         if not unique_documents:
             sub_status.observation = ObservationItem(
                 type="string",
@@ -173,11 +334,23 @@ class RetrievalAgent:
         sub_status.status = "processing"
         yield sub_status
 
-        rerank_documents = await self.rerank_documents(
-            documents=unique_documents,
-            query=user_query,
-            top_n=top_n,
-        )
+        try:
+            rerank_documents = await self.rerank_documents(
+                documents=unique_documents,
+                query=user_query,
+                top_n=top_n,
+            )
+        except (CircuitOpenError, TimeoutError, HTTPException, httpx.HTTPError) as e:
+            # 리랭크 업스트림 불가(차단 / 응답 지연 / 오류 응답 / 전송 오류) 시 벡터 검색 순서를 유지한 채 진행
+            # 그 외 예외(코드 오류 등)는 숨기지 않고 전파
+            logging.warning(f"리랭크 생략 (검색 순서 유지): {e}")
+            rerank_documents = unique_documents[:top_n]
+            await queue.put(
+                ControlSignal(
+                    control_signal="degraded",
+                    detail="rerank",
+                ).model_dump_json()
+            )
 
         rerank_list = []
 
@@ -6,11 +6,6 @@ from domain.plans.observation_item import ObservationItem
 from infra.wrapper.haiqv_chat_ollama import HaiqvChatOllama
 
 logger = logging.getLogger("summarization agent")
-logging.basicConfig(
-    format="[%(asctime)s.%(msecs)03d] %(levelname)-8s %(message)s",
-    level=logging.INFO,
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 
 from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_core.prompts import PromptTemplate
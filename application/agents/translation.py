@@ -7,11 +7,6 @@ from infra.wrapper.haiqv_chat_ollama import HaiqvChatOllama
 from utils.prompt_utils import step_info_to_str, step_list_to_str
 
 logger = logging.getLogger("translation agent")
-logging.basicConfig(
-    format="[%(asctime)s.%(msecs)03d] %(levelname)-8s %(message)s",
-    level=logging.INFO,
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 
 
 from langchain_core.output_parsers import PydanticOutputParser
@@ -1,7 +1,14 @@
 import asyncio
 import json
+from contextlib import aclosing
 from typing import AsyncGenerator, Optional
 
+from application.messages.frames import (
+    coalesce_plans,
+    coalesce_tokens,
+    plan_payload,
+    token_payload,
+)
 from application.service.chat_service import ChatService
 from application.service.executor import ExecutorService
 from application.service.generator import GeneratorService
@@ -12,9 +19,13 @@ from application.service.title_service import TitleService
 from application.service.tts_service import TTSService
 from application.service.validator import Validator
 from common import handle_exceptions
+from common.circuit_breaker import CircuitBreaker
+from common.drain import DrainController
+from common.tracing import Tracer, span
 from domain.api.models import RerankOutput
 from domain.chats.models.control import ControlSignal
 from domain.chats.models.identifiers import ChatId
+from domain.chats.models.stream_options import StreamOptions, StreamOptionsOverride
 from domain.messages.models.message import AIMessage, HumanMessage
 from domain.plans.plan import PlanInfo
 
@@ -36,6 +47,10 @@ class AudioGenerator:
         generator: GeneratorService,
         stt_service: STTService,
         tts_service: TTSService,
+        llm_breaker: CircuitBreaker,
+        tracer: Tracer,
+        drain: DrainController,
+        stream_options: StreamOptions,
     ):
         self.validator = validator
         self.chat_service = chat_service
@@ -46,6 +61,10 @@ class AudioGenerator:
         self.generator = generator
         self.stt_service = stt_service
         self.tts_service = tts_service
+        self.llm_breaker = llm_breaker
+        self.tracer = tracer
+        self.drain = drain
+        self.stream_options = stream_options
 
     @staticmethod
     def _extract_primary_page(signal_data: str) -> Optional[int]:
@@ -69,175 +88,266 @@ class AudioGenerator:
         app_id: str,
         flush_every: int = 20,
         verbose: bool = True,
+        stream_options: Optional[StreamOptionsOverride] = None,
+    ) -> AsyncGenerator[str, None]:
+        with self.tracer.trace("audio_turn", chat_id=chat_id, app_id=app_id):
+            # 스트림이 중간에 닫히면 내부 제너레이터도 바로 닫아 stalled 처리가 실행되게 한다
+            async with aclosing(
+                self._generate(
+                    chat_id=chat_id,
+                    user_id=user_id,
+                    user_query=user_query,
+                    audio_path=audio_path,
+                    app_id=app_id,
+                    flush_every=flush_every,
+                    verbose=verbose,
+                    options=self.stream_options.merge(stream_options),
+                )
+            ) as frames:
+                async for frame in frames:
+                    yield frame
+
+    async def _generate(
+        self,
+        *,
+        chat_id: ChatId,
+        user_id: str,
+        user_query: str | None,
+        audio_path: str | None,
+        app_id: str,
+        flush_every: int,
+        verbose: bool,
+        options: StreamOptions,
     ) -> AsyncGenerator[str, None]:
         # 1. 유효성 검사
-        await self.validator.chat_validator(chat_id=chat_id, user_id=user_id)
+        with span("validate"):
+            await self.validator.chat_validator(chat_id=chat_id, user_id=user_id)
+
+        # LLM 차단 중이면 STT 부터 생략하고 즉시 종료
+        if self.llm_breaker.is_open:
+            yield f"data:{ControlSignal(control_signal='error_occurred', detail='llm_unavailable').model_dump_json()}\n\n"
+            return
 
         # 2. 음성 → 텍스트
         if user_query is None:
-            stt_response = await self.stt_service.transcribe(audio_path)
+            with span("stt"):
+                stt_response = await self.stt_service.transcribe(audio_path)
             user_query = stt_response.text
             yield f"data:{ControlSignal(control_signal='stt_completed', detail=user_query).model_dump_json()}\n\n"
 
         # 3. 메시지 저장
-        user_msg: HumanMessage = await self.chat_service.save_user_message(
-            chat_id, user_query
-        )
-        assistant_msg: AIMessage = await self.chat_service.save_ai_message(
-            chat_id, "progressing"
-        )
-
-        # 4. 히스토리 조회
-        chat_history, _ = await self.chat_service.get_message_history(chat_id)
-
-        # 5. 제목 생성 태스크
-        sub_queue: asyncio.Queue = asyncio.Queue()
-        title_task: Optional[asyncio.Task] = None
-
-        if await self.chat_service.need_title_generation(chat_id):
-
-            async def _produce_title_signal() -> None:
-                async for sig in self.title_service.generate_chat_title(
-                    chat_id=chat_id, user_message=user_msg, verbose=verbose
-                ):
-                    await sub_queue.put(("sub", sig))
-                await sub_queue.put(("sub", None))
-
-            title_task = asyncio.create_task(_produce_title_signal())
-
-        # 6. Plan 초기화 및 상태 업데이트
-        plan = PlanInfo()
-        await self.handler.persist_plan(assistant_msg, plan)
-        yield f"data:{plan.model_dump_json(exclude_none=True)}\n\n"
-
-        plan.status = "processing"
-        await self.handler.persist_plan(assistant_msg, plan)
-        yield f"data:{plan.model_dump_json(exclude_none=True)}\n\n"
-
-        # 7. 플래닝
-        plan.step_list = await self.planner.create_plan(
-            user_msg=user_msg,
-            chat_history=chat_history,
-            app_id=app_id,
-            user_id=user_id,
-            verbose=verbose,
-        )
-        await self.handler.persist_plan(assistant_msg, plan)
-        yield f"data:{plan.model_dump_json(exclude_none=True)}\n\n"
-
-        # 8. 플랜 실행
-        signal_queue: asyncio.Queue = asyncio.Queue()
-        primary_page_raw = None
-
-        async for state in self.executor.execute_plan(
-            plan=plan,
-            chat_history=chat_history,
-            user_msg=user_msg,
-            app_id=app_id,
-            user_id=user_id,
-            signal_queue=signal_queue,
-            verbose=verbose,
-        ):
-            await self.handler.persist_plan(assistant_msg, state)
-            yield f"data:{state.model_dump_json(exclude_none=True)}\n\n"
-
-            # 제목 시그널 즉시 전달
-            while not sub_queue.empty():
-                _, sig = await sub_queue.get()
-                if sig:
-                    yield f"data:{sig}\n\n"
-
-        while not signal_queue.empty():
-            primary_page_raw: list[RerankOutput] = await signal_queue.get()
-
-        # primary page 업데이트
-        if primary_page_raw is not None and len(primary_page_raw) > 0:
-            try:
-                pp = primary_page_raw[0].page
+        with span("save_messages"):
+            user_msg: HumanMessage = await self.chat_service.save_user_message(
+                chat_id, user_query
+            )
+            assistant_msg: AIMessage = await self.chat_service.save_ai_message(
+                chat_id, "progressing"
+            )
 
-                if pp is not None:
-                    await self.chat_service.update_primary_page(
-                        chat_id=chat_id, primary_page=pp
+        # 이후 중단(드레인 / 연결 종료 / 오류)되면 받은 내용까지 저장하고 stalled 로 표시
+        title_task: Optional[asyncio.Task] = None
+        try:
+            # 4. 히스토리 조회
+            with span("history") as history_span:
+                chat_history, _ = await self.chat_service.get_message_history(chat_id)
+                history_span.set("messages", len(chat_history))
+
+            # 5. 제목 생성 태스크
+            sub_queue: asyncio.Queue = asyncio.Queue()
+
+            if await self.chat_service.need_title_generation(chat_id):
+
+                async def _produce_title_signal() -> None:
+                    with span("title"):
+                        async for sig in self.title_service.generate_chat_title(
+                            chat_id=chat_id, user_message=user_msg, verbose=verbose
+                        ):
+                            await sub_queue.put(("sub", sig))
+                    await sub_queue.put(("sub", None))
+
+                title_task = asyncio.create_task(_produce_title_signal())
+
+            # 6. Plan 초기화 및 상태 업데이트
+            plan = PlanInfo()
+            await self.handler.persist_plan(assistant_msg, plan)
+            yield f"data:{plan.model_dump_json(exclude_none=True)}\n\n"
+
+            plan.status = "processing"
+            await self.handler.persist_plan(assistant_msg, plan)
+            yield f"data:{plan.model_dump_json(exclude_none=True)}\n\n"
+
+            # 7. 플래닝
+            with span("planner") as planner_span:
+                plan.step_list = await self.planner.create_plan(
+                    user_msg=user_msg,
+                    chat_history=chat_history,
+                    app_id=app_id,
+                    user_id=user_id,
+                    verbose=verbose,
+                )
+                planner_span.set("steps", len(plan.step_list.root))
+            await self.handler.persist_plan(assistant_msg, plan)
+            yield f"data:{plan.model_dump_json(exclude_none=True)}\n\n"
+
+            # 8. 플랜 실행
+            signal_queue: asyncio.Queue = asyncio.Queue()
+            primary_page_raw = None
+
+            with span("executor"):
+                async with aclosing(
+                    coalesce_plans(
+                        self.executor.execute_plan(
+                            plan=plan,
+                            chat_history=chat_history,
+                            user_msg=user_msg,
+                            app_id=app_id,
+                            user_id=user_id,
+                            signal_queue=signal_queue,
+                            verbose=verbose,
+                        ),
+                        options,
                     )
-                    assistant_msg.primary_page_list = primary_page_raw
-                    yield f"data:{ControlSignal(control_signal='primary_page', detail=str(pp)).model_dump_json()}\n\n"
-
-            except Exception as e:
-                yield f"data:{ControlSignal(control_signal='error_occurred', detail=str(e)).model_dump_json()}\n\n"
-
-        # 9. TTS 및 답변 생성
-        output_queue: asyncio.Queue = asyncio.Queue()
-
-        tts_summary = await self.tts_service.summary(
-            chat_history=chat_history,
-            user_query=user_query,
-            plan=plan,
-        )
-
-        tts_ready = asyncio.Event()
-
-        async def _produce_tts_signal() -> None:
-            first = True
-            async for sig in self.tts_service.convert(text=tts_summary):
-                await output_queue.put(("tts", sig))
-                if first:
+                ) as states:
+                    async for batch in states:
+                        await self.handler.persist_plan(assistant_msg, batch[-1])
+                        yield f"data:{plan_payload(batch)}\n\n"
+
+                        # 제목 시그널 즉시 전달
+                        while not sub_queue.empty():
+                            _, sig = await sub_queue.get()
+                            if sig:
+                                yield f"data:{sig}\n\n"
+
+            while not signal_queue.empty():
+                signal = await signal_queue.get()
+                if isinstance(signal, str):  # 제어 신호 (degraded 등)
+                    yield f"data:{signal}\n\n"
+                else:
+                    primary_page_raw: list[RerankOutput] = signal
+
+            # primary page 업데이트
+            if primary_page_raw is not None and len(primary_page_raw) > 0:
+                try:
+                    pp = primary_page_raw[0].page
+
+                    if pp is not None:
+                        await self.chat_service.update_primary_page(
+                            chat_id=chat_id, primary_page=pp
+                        )
+                        assistant_msg.primary_page_list = primary_page_raw
+                        yield f"data:{ControlSignal(control_signal='primary_page', detail=str(pp)).model_dump_json()}\n\n"
+
+                except Exception as e:
+                    yield f"data:{ControlSignal(control_signal='error_occurred', detail=str(e)).model_dump_json()}\n\n"
+
+            # 9. TTS 및 답변 생성
+            output_queue: asyncio.Queue = asyncio.Queue()
+
+            with span("tts_summary"):
+                tts_summary = await self.tts_service.summary(
+                    chat_history=chat_history,
+                    user_query=user_query,
+                    plan=plan,
+                )
+
+            tts_ready = asyncio.Event()
+
+            async def _produce_tts_signal() -> None:
+                try:
+                    with span("tts") as tts_span:
+                        async for sig in self.tts_service.convert(text=tts_summary):
+                            tts_span.mark("first_audio")
+                            await output_queue.put(("tts", sig))
+                            tts_ready.set()
+                except Exception:
+                    # TTS 불가 시 텍스트 스트림만 전달
+                    await output_queue.put(
+                        (
+                            "tts",
+                            ControlSignal(
+                                control_signal="degraded", detail="tts"
+                            ).model_dump_json(),
+                        )
+                    )
+                finally:
                     tts_ready.set()
-                    first = False
-            await output_queue.put(("tts", None))
-
-        async def _produce_gen_signal() -> None:
-            async for token_json in self.generator.stream_answer(
-                app_id=app_id,
-                user_id=user_id,
-                chat_history=chat_history,
-                user_msg=user_msg,
-                assistant_msg=assistant_msg,
-                tts_summary=tts_summary,
-                plan=plan,
-                flush_every=flush_every,
-            ):
-                await output_queue.put(("gen", token_json))
-            await output_queue.put(("gen", None))
-
-        # 태스크 시작
-        tts_task = asyncio.create_task(_produce_tts_signal())
-        gen_task = asyncio.create_task(_produce_gen_signal())
-
-        # 첫 오디오 청크 대기
-        await tts_ready.wait()
-
-        # 10. 스트림 출력
-        gen_done = tts_done = False
-        try:
-            while not (gen_done and tts_done):
-                src, payload = await output_queue.get()
-
-                if payload is None:
-                    if src == "gen":
-                        gen_done = True
-                    elif src == "tts":
-                        tts_done = True
-                    continue
-
-                yield f"data:{payload}\n\n"
-
-                # 제목 시그널 처리
-                while not sub_queue.empty():
-                    _, sig = await sub_queue.get()
-                    if sig:
-                        yield f"data:{sig}\n\n"
-
-        finally:
-            # 태스크 정리
-            for task in (tts_task, gen_task, title_task):
-                if task and not task.done():
-                    task.cancel()
-            await asyncio.gather(
-                *(t for t in (tts_task, gen_task, title_task) if t),
-                return_exceptions=True,
-            )
+                    await output_queue.put(("tts", None))
+
+            async def _produce_gen_signal() -> None:
+                # 답변 생성이 실패해도 출력 루프가 끝나도록 종료 신호는 항상 넣는다 (예외는 루프 후 전파)
+                try:
+                    with span("answer") as answer_span:
+                        async with aclosing(
+                            coalesce_tokens(
+                                self.generator.stream_answer(
+                                    app_id=app_id,
+                                    user_id=user_id,
+                                    chat_history=chat_history,
+                                    user_msg=user_msg,
+                                    assistant_msg=assistant_msg,
+                                    tts_summary=tts_summary,
+                                    plan=plan,
+                                    flush_every=flush_every,
+                                ),
+                                options,
+                            )
+                        ) as answer:
+                            async for batch in answer:
+                                answer_span.mark("first_token")
+                                await output_queue.put(("gen", token_payload(batch)))
+                finally:
+                    await output_queue.put(("gen", None))
+
+            # 태스크 시작
+            tts_task = asyncio.create_task(_produce_tts_signal())
+            gen_task = asyncio.create_task(_produce_gen_signal())
+
+            # 첫 오디오 청크 대기
+            await tts_ready.wait()
+
+            # 10. 스트림 출력
+            gen_done = tts_done = False
+            try:
+                while not (gen_done and tts_done):
+                    src, payload = await output_queue.get()
+
+                    if payload is None:
+                        if src == "gen":
+                            gen_done = True
+                        elif src == "tts":
+                            tts_done = True
+                        continue
+
+                    yield f"data:{payload}\n\n"
+
+                    # 제목 시그널 처리
+                    while not sub_queue.empty():
+                        _, sig = await sub_queue.get()
+                        if sig:
+                            yield f"data:{sig}\n\n"
+
+                # 답변 생성 실패 시 예외 전파 (메시지는 stalled 로 저장)
+                await gen_task
+            finally:
+                # 태스크 정리
+                for task in (tts_task, gen_task, title_task):
+                    if task and not task.done():
+                        task.cancel()
+                await asyncio.gather(
+                    *(t for t in (tts_task, gen_task, title_task) if t),
+                    return_exceptions=True,
+                )
 
             # 상태 업데이트
             assistant_msg.status = "complete"
+            self.handler.attach_trace(assistant_msg)
 
             await self.handler.message_repository.update(assistant_msg)
+        except BaseException as e:
+            if title_task and not title_task.done():
+                title_task.cancel()
+            if assistant_msg.status != "complete":
+                await self.handler.mark_stalled(
+                    assistant_msg, self.drain.stall_reason(e)
+                )
+            raise
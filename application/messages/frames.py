@@ -0,0 +1,43 @@
+from typing import AsyncGenerator, List
+
+from common.metrics import SSE_FRAME_ITEMS, SSE_FRAMES
+from domain.chats.models.stream_options import StreamOptions
+from domain.chats.models.token_chunk import TokenChunk
+from domain.plans.plan import PlanInfo
+from utils.async_utils import coalesce
+
+
+def _utf8_len(token: str) -> int:
+    return len(token.encode())
+
+
+def coalesce_tokens(
+    tokens: AsyncGenerator[str, None], options: StreamOptions
+) -> AsyncGenerator[List[str], None]:
+    """답변 토큰을 token_window_ms / token_max_bytes 단위로 묶음"""
+    return coalesce(
+        tokens,
+        window=options.token_window_ms / 1000,
+        max_size=options.token_max_bytes,
+        size=_utf8_len,
+    )
+
+
+def coalesce_plans(
+    states: AsyncGenerator[PlanInfo, None], options: StreamOptions
+) -> AsyncGenerator[List[PlanInfo], None]:
+    """플랜 갱신을 plan_window_ms 단위로 묶음 (마지막 상태만 전송 / 저장하면 된다)"""
+    return coalesce(states, window=options.plan_window_ms / 1000)
+
+
+def token_payload(batch: List[str]) -> str:
+    """묶인 토큰을 TokenChunk 하나로 직렬화"""
+    SSE_FRAMES.inc(kind="token")
+    SSE_FRAME_ITEMS.inc(len(batch), kind="token")
+    return TokenChunk(v="".join(batch)).model_dump_json()
+
+
+def plan_payload(batch: List[PlanInfo]) -> str:
+    SSE_FRAMES.inc(kind="plan")
+    SSE_FRAME_ITEMS.inc(len(batch), kind="plan")
+    return batch[-1].model_dump_json(exclude_none=True)
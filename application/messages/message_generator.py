@@ -1,6 +1,13 @@
 import asyncio
-from typing import AsyncGenerator
-
+from contextlib import aclosing
+from typing import AsyncGenerator, Optional
+
+from application.messages.frames import (
+    coalesce_plans,
+    coalesce_tokens,
+    plan_payload,
+    token_payload,
+)
 from application.service.chat_service import ChatService
 from application.service.executor import ExecutorService
 from application.service.generator import GeneratorService
@@ -9,7 +16,12 @@ from application.service.planner import PlannerService
 from application.service.title_service import TitleService
 from application.service.validator import Validator
 from common import handle_exceptions
+from common.circuit_breaker import CircuitBreaker
+from common.drain import DrainController
+from common.tracing import Tracer, span
+from domain.chats.models.control import ControlSignal
 from domain.chats.models.identifiers import ChatId
+from domain.chats.models.stream_options import StreamOptions, StreamOptionsOverride
 from domain.plans.plan import PlanInfo
 from domain.messages.models.message import AIMessage, HumanMessage
 
@@ -29,6 +41,10 @@ class MessageGenerator:
         handler: HandlerService,
         executor: ExecutorService,
         generator: GeneratorService,
+        llm_breaker: CircuitBreaker,
+        tracer: Tracer,
+        drain: DrainController,
+        stream_options: StreamOptions,
     ):
         self.validator = validator
         self.chat_service = chat_service
@@ -37,6 +53,10 @@ class MessageGenerator:
         self.handler = handler
         self.executor = executor
         self.generator = generator
+        self.llm_breaker = llm_breaker
+        self.tracer = tracer
+        self.drain = drain
+        self.stream_options = stream_options
 
     @handle_exceptions
     async def __call__(
@@ -48,103 +68,175 @@ class MessageGenerator:
         app_id: str,
         flush_every: int = 20,
         verbose: bool = True,
+        stream_options: Optional[StreamOptionsOverride] = None,
+    ) -> AsyncGenerator[str, None]:
+        with self.tracer.trace("message_turn", chat_id=chat_id, app_id=app_id):
+            # 스트림이 중간에 닫히면 내부 제너레이터도 바로 닫아 stalled 처리가 실행되게 한다
+            async with aclosing(
+                self._generate(
+                    chat_id=chat_id,
+                    user_id=user_id,
+                    user_query=user_query,
+                    app_id=app_id,
+                    flush_every=flush_every,
+                    verbose=verbose,
+                    options=self.stream_options.merge(stream_options),
+                )
+            ) as frames:
+                async for frame in frames:
+                    yield frame
+
+    async def _generate(
+        self,
+        *,
+        chat_id: ChatId,
+        user_id: str,
+        user_query: str,
+        app_id: str,
+        flush_every: int,
+        verbose: bool,
+        options: StreamOptions,
     ) -> AsyncGenerator[str, None]:
 
         #  1. 유효성 검사
-        await self.validator.chat_validator(chat_id=chat_id, user_id=user_id)
+        with span("validate"):
+            await self.validator.chat_validator(chat_id=chat_id, user_id=user_id)
+
+        # LLM 차단 중이면 메시지를 남기지 않고 즉시 종료
+        if self.llm_breaker.is_open:
+            yield f"data:{ControlSignal(control_signal='error_occurred', detail='llm_unavailable').model_dump_json()}\n\n"
+            return
 
         #  2. 메시지 저장
-        user_msg: HumanMessage = await self.chat_service.save_user_message(
-            chat_id, user_query
-        )
-        assistant_msg: AIMessage = await self.chat_service.save_ai_message(
-            chat_id, "progressing"
-        )
-
-        #  3. 히스토리 조회
-        chat_history, _ = await self.chat_service.get_message_history(chat_id)
-
-        #  4. 제목 생성 서브 태스크
-        sub_queue: asyncio.Queue[str] = asyncio.Queue()
+        with span("save_messages"):
+            user_msg: HumanMessage = await self.chat_service.save_user_message(
+                chat_id, user_query
+            )
+            assistant_msg: AIMessage = await self.chat_service.save_ai_message(
+                chat_id, "progressing"
+            )
+
+        # 이후 중단(드레인 / 연결 종료 / 오류)되면 받은 내용까지 저장하고 stalled 로 표시
         title_task = None
-
-        if await self.chat_service.need_title_generation(chat_id):
-
-            async def _produce_title_signal() -> None:
-                async for sig in self.title_service.generate_chat_title(
-                    chat_id=chat_id,
-                    user_message=user_msg,
+        try:
+            #  3. 히스토리 조회
+            with span("history") as history_span:
+                chat_history, _ = await self.chat_service.get_message_history(chat_id)
+                history_span.set("messages", len(chat_history))
+
+            #  4. 제목 생성 서브 태스크
+            sub_queue: asyncio.Queue[str] = asyncio.Queue()
+
+            if await self.chat_service.need_title_generation(chat_id):
+
+                async def _produce_title_signal() -> None:
+                    with span("title"):
+                        async for sig in self.title_service.generate_chat_title(
+                            chat_id=chat_id,
+                            user_message=user_msg,
+                            verbose=verbose,
+                        ):
+                            if sig:
+                                await sub_queue.put(sig)
+
+                title_task = asyncio.create_task(_produce_title_signal())
+
+            #  5. Plan 초기 상태 emit
+            plan = PlanInfo()
+            await self.handler.persist_plan(assistant_msg, plan)
+            yield f"data:{plan.model_dump_json(exclude_none=True)}\n\n"
+
+            # processing 상태
+            plan.status = "processing"
+            await self.handler.persist_plan(assistant_msg, plan)
+            yield f"data:{plan.model_dump_json(exclude_none=True)}\n\n"
+
+            #  6. 플래너
+            with span("planner") as planner_span:
+                plan.step_list = await self.planner.create_plan(
+                    user_msg=user_msg,
+                    chat_history=chat_history,
+                    app_id=app_id,
+                    user_id=user_id,
                     verbose=verbose,
-                ):
-                    if sig:
-                        await sub_queue.put(sig)
-
-            title_task = asyncio.create_task(_produce_title_signal())
-
-        #  5. Plan 초기 상태 emit
-        plan = PlanInfo()
-        await self.handler.persist_plan(assistant_msg, plan)
-        yield f"data:{plan.model_dump_json(exclude_none=True)}\n\n"
-
-        # processing 상태
-        plan.status = "processing"
-        await self.handler.persist_plan(assistant_msg, plan)
-        yield f"data:{plan.model_dump_json(exclude_none=True)}\n\n"
-
-        #  6. 플래너
-        plan.step_list = await self.planner.create_plan(
-            user_msg=user_msg,
-            chat_history=chat_history,
-            app_id=app_id,
-            user_id=user_id,
-            verbose=verbose,
-        )
-        await self.handler.persist_plan(assistant_msg, plan)
-        yield f"data:{plan.model_dump_json(exclude_none=True)}\n\n"
-
-        signal_queue: asyncio.Queue[str] = asyncio.Queue()
-
-        #  7. Executor (중간 Plan 상태 스트림)
-        async for state in self.executor.execute_plan(
-            plan=plan,
-            chat_history=chat_history,
-            user_msg=user_msg,
-            app_id=app_id,
-            user_id=user_id,
-            signal_queue=signal_queue,
-            verbose=verbose,
-        ):
-            await self.handler.persist_plan(assistant_msg, state)
-            yield f"data:{state.model_dump_json(exclude_none=True)}\n\n"
-            while not sub_queue.empty():  # 제목 신호 즉시 전달
-                yield f"data:{await sub_queue.get()}\n\n"
+                )
+                planner_span.set("steps", len(plan.step_list.root))
+            await self.handler.persist_plan(assistant_msg, plan)
+            yield f"data:{plan.model_dump_json(exclude_none=True)}\n\n"
+
+            signal_queue: asyncio.Queue[str] = asyncio.Queue()
+
+            #  7. Executor (중간 Plan 상태 스트림, plan_window_ms 단위로 최신 상태만 전송)
+            with span("executor"):
+                async with aclosing(
+                    coalesce_plans(
+                        self.executor.execute_plan(
+                            plan=plan,
+                            chat_history=chat_history,
+                            user_msg=user_msg,
+                            app_id=app_id,
+                            user_id=user_id,
+                            signal_queue=signal_queue,
+                            verbose=verbose,
+                        ),
+                        options,
+                    )
+                ) as states:
+                    async for batch in states:
+                        await self.handler.persist_plan(assistant_msg, batch[-1])
+                        yield f"data:{plan_payload(batch)}\n\n"
+                        while not sub_queue.empty():  # 제목 신호 즉시 전달
+                            yield f"data:{await sub_queue.get()}\n\n"
+
+                        while not signal_queue.empty():
+                            yield f"data:{await signal_queue.get()}\n\n"
 
             while not signal_queue.empty():
                 yield f"data:{await signal_queue.get()}\n\n"
 
-        while not signal_queue.empty():
-            yield f"data:{await signal_queue.get()}\n\n"
-
-        #  9. Generator (최종 답변 토큰 스트림)
-        async for token_json in self.generator.stream_answer(
-            app_id=app_id,
-            user_id=user_id,
-            chat_history=chat_history,
-            user_msg=user_msg,
-            assistant_msg=assistant_msg,
-            plan=plan,
-            flush_every=flush_every,
-        ):
-            yield f"data:{token_json}\n\n"
-
-            while not sub_queue.empty():  # 토큰 중에도 전달
-                yield f"data:{await sub_queue.get()}\n\n"
-
-        assistant_msg.status = "complete"
-        await self.handler.message_repository.update(assistant_msg)
-
-        #  11. 제목 태스크 마무리
-        if title_task:
-            await title_task
-            while not sub_queue.empty():
-                yield f"data:{await sub_queue.get()}\n\n"
+            #  9. Generator (최종 답변 토큰 스트림, token_window_ms / token_max_bytes 단위 프레임)
+            with span("answer") as answer_span:
+                tokens = frames = 0
+                async with aclosing(
+                    coalesce_tokens(
+                        self.generator.stream_answer(
+                            app_id=app_id,
+                            user_id=user_id,
+                            chat_history=chat_history,
+                            user_msg=user_msg,
+                            assistant_msg=assistant_msg,
+                            plan=plan,
+                            flush_every=flush_every,
+                        ),
+                        options,
+                    )
+                ) as answer:
+                    async for batch in answer:
+                        if tokens == 0:
+                            answer_span.mark("first_token")
+                        tokens += len(batch)
+                        frames += 1
+                        yield f"data:{token_payload(batch)}\n\n"
+
+                        while not sub_queue.empty():  # 토큰 중에도 전달
+                            yield f"data:{await sub_queue.get()}\n\n"
+                answer_span.set("tokens", tokens)
+                answer_span.set("frames", frames)
+
+            assistant_msg.status = "complete"
+            self.handler.attach_trace(assistant_msg)
+            await self.handler.message_repository.update(assistant_msg)
+
+            #  11. 제목 태스크 마무리
+            if title_task:
+                await title_task
+                while not sub_queue.empty():
+                    yield f"data:{await sub_queue.get()}\n\n"
+        except BaseException as e:
+            if title_task and not title_task.done():
+                title_task.cancel()
+            if assistant_msg.status != "complete":
+                await self.handler.mark_stalled(
+                    assistant_msg, self.drain.stall_reason(e)
+                )
+            raise
@@ -1,16 +1,23 @@
 from common import handle_exceptions
+from common.cache import AsyncTTLCache
 from domain.prompts.models import Prompt
 from domain.prompts.repository import IPromptRepository
 
 
 class CreatePrompt:
-    def __init__(self, prompt_repository: IPromptRepository):
+    def __init__(
+        self,
+        prompt_repository: IPromptRepository,
+        prompt_cache: AsyncTTLCache[str, str],
+    ):
         self.prompt_repository = prompt_repository
+        self.prompt_cache = prompt_cache
 
     @handle_exceptions
     async def __call__(self, prompt: Prompt) -> Prompt:
 
         prompt_id = await self.prompt_repository.create(prompt)
         prompt.id = prompt_id
+        self.prompt_cache.invalidate(prompt.name)
 
         return prompt
@@ -1,14 +1,23 @@
 from datetime import UTC, datetime
 from application.service.validator import Validator
 from common import handle_exceptions
+from common.cache import AsyncTTLCache
 from domain.prompts.models import BasePrompt, Prompt
 from domain.prompts.repository import IPromptRepository
 
 
 class UpdatePrompt:
-    def __init__(self, prompt_repository: IPromptRepository, validator: Validator):
+    def __init__(
+        self,
+        prompt_repository: IPromptRepository,
+        validator: Validator,
+        tool_prompt_cache: AsyncTTLCache[str, str],
+        prompt_cache: AsyncTTLCache[str, str],
+    ):
         self.prompt_repository = prompt_repository
         self.validator = validator
+        self.tool_prompt_cache = tool_prompt_cache
+        self.prompt_cache = prompt_cache
 
     @handle_exceptions
     async def __call__(self, prompt: BasePrompt, user_id: str) -> Prompt:
@@ -24,4 +33,11 @@ class UpdatePrompt:
             prompt=existing_prompt,
         )
 
+        # 모든 워커의 캐시에서 제거 (TieredCache 는 무효화를 다른 워커에 전파)
+        self.prompt_cache.invalidate(existing_prompt.name)
+
+        # 툴 프롬프트 템플릿이 바뀌면 렌더링된 결과도 다시 만들어야 함
+        if existing_prompt.name == "tool_list":
+            self.tool_prompt_cache.clear()
+
         return existing_prompt
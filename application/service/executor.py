@@ -5,6 +5,7 @@ from typing import AsyncGenerator, List
 from application.agents.retrieval import RetrievalAgent
 from application.agents.summarization import SummarizationAgent
 from application.agents.translation import TranslationAgent
+from common.tracing import span
 from domain.messages.models.message import BaseMessage, HumanMessage
 from domain.plans.plan import PlanInfo
 from domain.plans.sub_step import SubStepInfo
@@ -115,17 +116,18 @@ class ExecutorService:
         verbose: bool = True,
     ) -> AsyncGenerator[PlanInfo, None]:
 
-        for idx, _ in enumerate(plan.step_list.root):
-            async for state in self._execute_single_step(
-                idx,
-                plan,
-                chat_history,
-                user_msg,
-                app_id,
-                user_id,
-                signal_queue,
-                verbose,
-            ):
-                yield state
+        for idx, step in enumerate(plan.step_list.root):
+            with span(f"step.{step.agent.lower()}", index=idx):
+                async for state in self._execute_single_step(
+                    idx,
+                    plan,
+                    chat_history,
+                    user_msg,
+                    app_id,
+                    user_id,
+                    signal_queue,
+                    verbose,
+                ):
+                    yield state
         plan.status = "complete"
         yield plan
@@ -1,7 +1,6 @@
 from typing import AsyncGenerator, List
 from application.service.handler import HandlerService
 from application.service.prompt_service import PromptService
-from domain.chats.models.token_chunk import TokenChunk
 from domain.messages.models.message import AIMessage, BaseMessage, HumanMessage
 from domain.plans.plan import PlanInfo
 from infra.wrapper.haiqv_chat_ollama import HaiqvChatOllama
@@ -70,24 +69,35 @@ class GeneratorService:
         plan: PlanInfo,
         tts_summary: str | None = None,
         flush_every: int = 20,
-    ) -> AsyncGenerator[TokenChunk, None]:
+    ) -> AsyncGenerator[str, None]:
+        """
+        답변 토큰 문자열 스트림
+        SSE 프레임(TokenChunk)으로 묶는 것은 호출자가 한다. (coalesce)
+        """
         buffer = ""
-        async for idx, token in aenumerate(
-            self._token_stream(
-                app_id=app_id,
-                user_id=user_id,
-                chat_history=chat_history,
-                user_msg=user_msg,
-                plan=plan,
-                tts_summary=tts_summary,
-            ),
-            1,
-        ):
-            tok_str = str(token.content or "")
-            buffer += tok_str
-            if idx % flush_every == 0:
-                buffer = await self._handler.flush_content(assistant_msg, buffer)
-            yield TokenChunk(v=tok_str).model_dump_json()
+        try:
+            async for idx, token in aenumerate(
+                self._token_stream(
+                    app_id=app_id,
+                    user_id=user_id,
+                    chat_history=chat_history,
+                    user_msg=user_msg,
+                    plan=plan,
+                    tts_summary=tts_summary,
+                ),
+                1,
+            ):
+                tok_str = str(token.content or "")
+                buffer += tok_str
+                if idx % flush_every == 0:
+                    # 저장 중 취소되어도 content 에 이미 반영된 토큰을 다시 붙이지 않도록 먼저 비운다
+                    pending, buffer = buffer, ""
+                    await self._handler.flush_content(assistant_msg, pending)
+                yield tok_str
+        except BaseException:
+            # 중단 시 받은 토큰까지 메시지에 반영 (저장은 호출자의 mark_stalled)
+            assistant_msg.content = (assistant_msg.content or "") + buffer
+            raise
 
         if buffer:
             await self._handler.flush_content(assistant_msg, buffer)
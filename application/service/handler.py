@@ -1,6 +1,9 @@
+import asyncio
 import logging
 
+from common.tracing import current_trace
 from domain.messages.models.message import AIMessage
+from domain.messages.models.trace import TraceTimeline
 from domain.messages.repository.repository import IMessageRepository
 from domain.plans.plan import PlanInfo
 
@@ -23,3 +26,24 @@ class HandlerService:
         assistant_msg.content += buffer
         await self.message_repository.update(assistant_msg)
         return ""
+
+    async def mark_stalled(self, assistant_msg: AIMessage, reason: str) -> None:
+        """
+        중단된 응답을 stalled 로 저장
+        resume_offset: 저장된 content 길이 (이어서 생성할 위치)
+        """
+        assistant_msg.status = "stalled"
+        assistant_msg.metadata = {
+            **assistant_msg.metadata,
+            "stalled_reason": reason,
+            "resume_offset": str(len(assistant_msg.content or "")),
+        }
+        self.attach_trace(assistant_msg)
+        # 취소 중인 태스크에서 호출되어도 저장은 끝까지 수행
+        await asyncio.shield(self.message_repository.update(assistant_msg))
+
+    def attach_trace(self, assistant_msg: AIMessage) -> None:
+        """진행 중인 trace 의 타임라인을 메시지에 기록 (다음 update 때 저장)"""
+        trace = current_trace()
+        if trace is not None:
+            assistant_msg.trace = TraceTimeline.model_validate(trace.timeline())
@@ -6,11 +6,6 @@ from infra.wrapper.haiqv_chat_ollama import HaiqvChatOllama
 from utils.str_utils import extract_json_array
 
 logger = logging.getLogger()
-logging.basicConfig(
-    format="[%(asctime)s.%(msecs)03d] %(levelname)-8s %(message)s",
-    level=logging.INFO,
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 
 from typing import List
 from langchain.prompts import PromptTemplate
@@ -20,8 +15,8 @@ import langchain_core.messages
 
 
 class PlannerService:
-    def __init__(self, prompt_service: PromptService):
-        self._llm = HaiqvChatOllama()
+    def __init__(self, prompt_service: PromptService, llm: HaiqvChatOllama):
+        self._llm = llm
         self._prompt_service = prompt_service
         self._step_parser = PydanticOutputParser(pydantic_object=StepList)
 
@@ -1,30 +1,89 @@
+import asyncio
+import logging
 from typing import List
+from common.cache import AsyncTTLCache
+from domain.api.models import AppInfo
 from domain.api.studio_repository import IStudioRepository
 from domain.prompts.repository import IPromptRepository
 
+logger = logging.getLogger(__name__)
+
 
 class PromptService:
     def __init__(
         self,
         prompt_repository: IPromptRepository,
         studio_repository: IStudioRepository,
+        app_info_cache: AsyncTTLCache[str, AppInfo],
+        tool_prompt_cache: AsyncTTLCache[str, str],
+        prompt_cache: AsyncTTLCache[str, str],
     ):
         self.prompt_repository = prompt_repository
         self.studio_repository = studio_repository
+        self.app_info_cache = app_info_cache
+        self.tool_prompt_cache = tool_prompt_cache
+        self.prompt_cache = prompt_cache
 
     async def get_prompt(self, prompt_name: str) -> str:
+        return await self.prompt_cache.get_or_load(
+            prompt_name, lambda: self._load_prompt(prompt_name)
+        )
+
+    async def _load_prompt(self, prompt_name: str) -> str:
         prompt = await self.prompt_repository.get_by_name(prompt_name)
         return prompt.content
 
-    async def make_tool_prompt(self, app_id: str, user_id: str) -> str:
+    async def get_app_info(self, app_id: str, user_id: str) -> AppInfo:
+        return await self.app_info_cache.get_or_load(
+            app_id.upper(),
+            lambda: self.studio_repository.get_app_info(
+                user_id=user_id,
+                app_id=app_id,
+            ),
+        )
+
+    async def _render_tool_prompt(self, app_id: str, user_id: str) -> str:
         # app_id에 대한 정보를 가져와서 툴 프롬프트를 생성함
         tool_prompt = await self.get_prompt("tool_list")
-        app_info = await self.studio_repository.get_app_info(
-            user_id=user_id,
-            app_id=app_id,
-        )
+        app_info = await self.get_app_info(app_id=app_id, user_id=user_id)
         tool_prompt = tool_prompt.format(
             description=app_info.description,
             keywords=", ".join(app_info.keywords),
         )
         return tool_prompt
+
+    async def make_tool_prompt(self, app_id: str, user_id: str) -> str:
+        return await self.tool_prompt_cache.get_or_load(
+            app_id.upper(),
+            lambda: self._render_tool_prompt(app_id=app_id, user_id=user_id),
+        )
+
+    async def prefetch_tool_prompts(self, app_ids: List[str], user_id: str) -> None:
+        """
+        지정된 앱들의 AppInfo 와 툴 프롬프트를 강제로 다시 적재한다.
+        기동 시점 및 주기적 갱신에 사용하며, 실패한 앱은 기존 캐시 값을 유지한다.
+        """
+
+        async def _prefetch(app_id: str) -> str:
+            key = app_id.upper()
+            await self.app_info_cache.refresh(
+                key,
+                lambda: self.studio_repository.get_app_info(
+                    user_id=user_id,
+                    app_id=app_id,
+                ),
+            )
+            return await self.tool_prompt_cache.refresh(
+                key,
+                lambda: self._render_tool_prompt(app_id=app_id, user_id=user_id),
+            )
+
+        results = await asyncio.gather(
+            *(_prefetch(app_id) for app_id in app_ids),
+            return_exceptions=True,
+        )
+        for app_id, result in zip(app_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"[PromptService] '{app_id}' 툴 프롬프트 프리페치 실패: {result}"
+                )
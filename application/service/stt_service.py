@@ -1,11 +1,16 @@
+import asyncio
 import base64
-from pydub import AudioSegment
 from io import BytesIO
+from typing import TYPE_CHECKING
 
 from fastapi import HTTPException
 from domain.api.ml_repository import IMLRepository
 from domain.api.models import STTResponse
 
+# pydub 은 음성 요청에서만 필요하므로 최초 사용 시 import (ffmpeg 탐색 포함)
+if TYPE_CHECKING:
+    from pydub import AudioSegment
+
 
 class STTService:
     def __init__(
@@ -15,8 +20,10 @@ class STTService:
         self.expected_rate = 16000
         self.ml_repository = ml_repository
 
-    def load_and_resample_audio(self, audio_file_path: str) -> AudioSegment:
+    def load_and_resample_audio(self, audio_file_path: str) -> "AudioSegment":
         """오디오 파일을 불러오고 샘플레이트가 다르면 16kHz로 변환"""
+        from pydub import AudioSegment
+
         try:
             sound = AudioSegment.from_file(audio_file_path)
         except Exception:
@@ -29,17 +36,21 @@ class STTService:
             sound = sound.set_frame_rate(self.expected_rate)
         return sound
 
-    def encode_audio_to_base64(self, audio: AudioSegment) -> str:
+    def encode_audio_to_base64(self, audio: "AudioSegment") -> str:
         """AudioSegment 객체를 base64로 인코딩"""
         buffer = BytesIO()
         audio.export(buffer, format="wav")
         encoded = base64.b64encode(buffer.getvalue()).decode("utf-8")
         return encoded
 
+    def _prepare_audio(self, audio_file_path: str) -> str:
+        # pydub / ffmpeg 디코딩과 리샘플링은 블로킹이므로 스레드에서 수행
+        audio = self.load_and_resample_audio(audio_file_path)
+        return self.encode_audio_to_base64(audio)
+
     async def transcribe(self, audio_file_path: str) -> STTResponse:
         """
         오디오 파일을 읽고 샘플레이트를 16k로 맞춰 인코딩한 후 전송
         """
-        audio = self.load_and_resample_audio(audio_file_path)
-        encoded_audio = self.encode_audio_to_base64(audio)
+        encoded_audio = await asyncio.to_thread(self._prepare_audio, audio_file_path)
         return await self.ml_repository.stt(encoded_audio)
@@ -11,11 +11,6 @@ from langchain_core.prompts import PromptTemplate
 from infra.wrapper.haiqv_chat_ollama import HaiqvChatOllama
 
 logger = logging.getLogger()
-logging.basicConfig(
-    format="[%(asctime)s.%(msecs)03d] %(levelname)-8s %(message)s",
-    level=logging.INFO,
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 
 from typing import AsyncGenerator
 from domain.chats.models.chat_info import ChatInfo
@@ -76,7 +71,7 @@ class TitleService:
             langchain_core.messages.SystemMessage(content=_CHAT_TITLE_SYSTEM_PROMPT),
             langchain_core.messages.HumanMessage(content=user_prompt),
         ]
-        response = self._llm.invoke(messages)
+        response = await self._llm.ainvoke(messages)
 
         # 문자열로 출력된 타이틀 파싱
         title_parser = PydanticOutputParser(pydantic_object=TitleGenerateResult)
@@ -1,8 +1,9 @@
 from fastapi import HTTPException, status
+from common.cache import TieredCache
 from domain.chats.models.identifiers import ChatId
 from domain.chats.repository.repository import IChatInfoRepository
 from domain.prompts.repository import IPromptRepository
-from domain.users.models import User
+from domain.users.models import BaseUser, User
 from domain.users.repository import IUserRepository
 
 
@@ -16,10 +17,12 @@ class Validator:
         user_repository: IUserRepository,
         chat_info_repository: IChatInfoRepository,
         prompt_repository: IPromptRepository,
+        user_cache: TieredCache[str, BaseUser],
     ):
         self.user_repository = user_repository
         self.chat_info_repository = chat_info_repository
         self.prompt_repository = prompt_repository
+        self.user_cache = user_cache
 
     async def user_validator(
         self,
@@ -36,6 +39,19 @@ class Validator:
 
         return user
 
+    async def current_user(self, user_id: str) -> BaseUser:
+        """
+        인증된 요청의 사용자 (비밀번호 제외, 캐시)
+        """
+        return await self.user_cache.get_or_load(
+            user_id,
+            lambda: self._load_current_user(user_id),
+        )
+
+    async def _load_current_user(self, user_id: str) -> BaseUser:
+        user = await self.user_validator(user_id)
+        return BaseUser(user_id=user.user_id, user_name=user.user_name)
+
     async def chat_validator(
         self,
         chat_id: ChatId,
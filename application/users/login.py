@@ -28,7 +28,7 @@ class Login:
 
         user = await self.validator.user_validator(user_id=user_req.user_id)
 
-        if not self.crypto_service.verify(user_req.password, user.password):
+        if not await self.crypto_service.averify(user_req.password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="비밀번호를 확인해주세요",
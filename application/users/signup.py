@@ -34,7 +34,7 @@ class SignUp:
         new_user = User(
             user_id=user_req.user_id,
             user_name=user_req.user_name,
-            password=self.crypto_service.encrypt(user_req.password),
+            password=await self.crypto_service.aencrypt(user_req.password),
             created_at=datetime.now(UTC),
         )
 
@@ -0,0 +1,111 @@
+"""
+요청당 의존성 해석(DI) 비용 벤치마크
+
+라우트가 Depends(Provide[...]) 로 받는 의존성을 한 번 해석하는 데 걸리는 시간을 측정한다.
+- singleton: 현재 컨테이너 (상태 없는 서비스 / 저장소 / 에이전트 공유)
+- factory  : 이전 구성 재현. 같은 프로바이더를 Factory 로 override 하여 요청마다 그래프 전체를 새로 만들고,
+             PlannerService 는 자체 HaiqvChatOllama 를 생성한다.
+
+    python -m benchmarks.di_resolution
+"""
+
+import argparse
+import timeit
+from typing import Dict
+
+from dependency_injector import providers
+
+from containers import Container
+from infra.wrapper.haiqv_chat_ollama import HaiqvChatOllama
+
+# 라우트 / 인증 의존성에서 요청마다 해석하는 프로바이더
+ROUTE_PROVIDERS = (
+    "message_generator",
+    "audio_generator",
+    "message_list",
+    "chat_list",
+    "create_chat",
+    "login",
+    "validator",
+)
+
+# 이전에 Factory 였던 프로바이더
+FORMER_FACTORIES = (
+    "token_service",
+    "crypto_service",
+    "user_repository",
+    "chat_info_repository",
+    "message_repository",
+    "prompt_repository",
+    "studio_repository",
+    "rerank_repository",
+    "ml_repository",
+    "retrieval_agent",
+    "summarization_agent",
+    "translation_agent",
+    "validator",
+    "chat_service",
+    "prompt_service",
+    "handler",
+    "planner",
+    "executor",
+    "generator",
+    "title_service",
+    "stt_service",
+    "tts_service",
+    "signup",
+    "login",
+    "chat_list",
+    "create_chat",
+    "delete_chat",
+    "message_list",
+    "message_generator",
+    "audio_generator",
+    "create_prompt",
+    "get_prompt",
+    "update_prompt",
+)
+
+
+def factory_container() -> Container:
+    container = Container()
+    for name in FORMER_FACTORIES:
+        provider = getattr(container, name)
+        kwargs = dict(provider.kwargs)
+        if name == "planner":
+            kwargs["llm"] = providers.Factory(HaiqvChatOllama)
+        provider.override(
+            providers.Factory(provider.provides, *provider.args, **kwargs)
+        )
+    return container
+
+
+def measure(container: Container, name: str, repeat: int) -> float:
+    provider = getattr(container, name)
+    provider()
+    timer = timeit.Timer(provider)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DI resolution benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    containers: Dict[str, Container] = {
+        "factory": factory_container(),
+        "singleton": Container(),
+    }
+    print(f"{'provider':<20} {'factory':>12} {'singleton':>12} {'speedup':>9}")
+    for name in ROUTE_PROVIDERS:
+        before = measure(containers["factory"], name, args.repeat)
+        after = measure(containers["singleton"], name, args.repeat)
+        print(
+            f"{name:<20} {before * 1e6:>10.1f}us {after * 1e6:>10.2f}us "
+            f"{before / after:>8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
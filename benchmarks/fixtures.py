@@ -0,0 +1,105 @@
+"""
+마이크로 벤치마크용 현실적인 도메인 객체
+
+- 큰 플랜: 스텝 8 개 x 서브 스텝 6 개, 검색 결과 observation 포함
+- 10 KB 사용자 질의
+- 긴 채팅: 질의/응답 100 쌍
+"""
+
+from datetime import UTC, datetime
+
+from bson import ObjectId
+
+from domain.api.models import RerankOutput
+from domain.messages.models.message import AIMessage, BaseMessage, HumanMessage
+from domain.plans.observation_item import ObservationItem
+from domain.plans.plan import PlanInfo
+from domain.plans.step import StepInfo, StepList
+from domain.plans.sub_step import SubStepInfo
+from infra.implement.message_repository_impl import MessageRepository
+
+PARAGRAPH = (
+    "서울 지하철은 1974년 1호선 개통 이후 꾸준히 확장되어 현재 수도권 전철망과 연결되어 있다. "
+    "The reranker scores each passage against the user query and returns a relevance score. "
+)
+
+
+def long_query(size: int = 10 * 1024) -> str:
+    return (PARAGRAPH * (size // len(PARAGRAPH) + 1))[:size]
+
+
+def large_plan(steps: int = 8, sub_steps: int = 6) -> PlanInfo:
+    step_list = []
+    for s in range(steps):
+        sub_step_list = []
+        for t in range(sub_steps):
+            if t % 3 == 0:
+                observation = ObservationItem(
+                    type="keyword", value=["서울 지하철", "노선", "환승"]
+                )
+            elif t % 3 == 1:
+                observation = ObservationItem(
+                    type="key_value",
+                    value={"mode": "complete", "keywords": 3, "succeeded": 3},
+                )
+            else:
+                observation = ObservationItem(
+                    type="list",
+                    value=[
+                        PARAGRAPH * 6 + f"\nfrom: document_{n}.pdf - {n} page"
+                        for n in range(3)
+                    ],
+                )
+            sub_step_list.append(
+                SubStepInfo(
+                    status="complete",
+                    title=f"Sub step {t} of step {s}",
+                    observation=observation,
+                )
+            )
+        step_list.append(
+            StepInfo(
+                status="complete",
+                agent="retrieval",
+                thought=f"{s} 번째 단계: 문서에서 관련 내용을 찾는다.",
+                sub_step_list=sub_step_list,
+                observation=ObservationItem(type="string", value=PARAGRAPH * 3),
+            )
+        )
+    return PlanInfo(status="complete", step_list=StepList(step_list))
+
+
+def ai_message(chat_id: str, plan: PlanInfo) -> AIMessage:
+    return AIMessage(
+        _id=str(ObjectId()),
+        chat_id=chat_id,
+        content=PARAGRAPH * 10,
+        status="complete",
+        plan=plan,
+        primary_page_list=[
+            RerankOutput(document_name=f"document_{n}.pdf", page=n) for n in range(3)
+        ],
+        created_at=datetime.now(UTC),
+    )
+
+
+def long_chat(pairs: int = 100, plan_steps: int = 2) -> list[BaseMessage]:
+    chat_id = str(ObjectId())
+    plan = large_plan(steps=plan_steps)
+    messages: list[BaseMessage] = []
+    for _ in range(pairs):
+        messages.append(
+            HumanMessage(
+                _id=str(ObjectId()),
+                chat_id=chat_id,
+                content=long_query(1024),
+                created_at=datetime.now(UTC),
+            )
+        )
+        messages.append(ai_message(chat_id, plan))
+    return messages
+
+
+def message_document(message: BaseMessage) -> dict:
+    """Mongo 에서 읽은 것과 같은 형태의 문서"""
+    return MessageRepository.serialize(message)
@@ -0,0 +1,140 @@
+"""
+기동 시 import 비용 점검 (python -X importtime)
+
+`import main` 을 새 인터프리터에서 실행하여
+- 전체 import 시간이 예산(--budget-ms)을 넘거나
+- 지연 로드 대상 모듈(pydub, numpy, transformers)을 우리 코드가 직접 import 하면
+exit 1 로 실패한다. (langchain_core 처럼 서드파티가 import 하는 경우는 예산에만 반영)
+
+    python -m benchmarks.import_time                  # 기본 예산 4000ms
+    python -m benchmarks.import_time --budget-ms 2000 --top 20
+
+설정 파일(.env)이 있는 디렉터리에서 실행한다.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+FIRST_PARTY = (
+    "application",
+    "common",
+    "config",
+    "containers",
+    "database",
+    "domain",
+    "infra",
+    "interface",
+    "main",
+    "middleware",
+    "utils",
+)
+LAZY_MODULES = ("pydub", "numpy", "transformers")
+
+_ROW = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+@dataclass
+class ImportRow:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    parent: Optional[str] = None
+
+
+def run_importtime(target: str) -> List[ImportRow]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(ROOT), env.get("PYTHONPATH", "")) if p
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr[-2000:])
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = _ROW.match(line)
+        if match:
+            rows.append(
+                ImportRow(
+                    name=match[4],
+                    self_us=int(match[1]),
+                    cumulative_us=int(match[2]),
+                    depth=len(match[3]) // 2,
+                )
+            )
+
+    # 하위 모듈이 먼저 출력되므로, 뒤에서 처음 만나는 더 얕은 행이 import 한 모듈이다
+    pending: Dict[int, List[ImportRow]] = {}
+    for row in rows:
+        for child in pending.pop(row.depth + 1, []):
+            child.parent = row.name
+        pending.setdefault(row.depth, []).append(row)
+    return rows
+
+
+def _top_level(name: str) -> str:
+    return name.split(".", 1)[0]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="startup import cost check")
+    parser.add_argument("--target", default="main")
+    parser.add_argument("--budget-ms", type=float, default=4000)
+    parser.add_argument(
+        "--runs", type=int, default=3, help="최솟값 사용 (첫 실행은 .pyc 생성)"
+    )
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [run_importtime(args.target) for _ in range(args.runs)]
+    rows = min(
+        runs, key=lambda r: next(x.cumulative_us for x in r if x.name == args.target)
+    )
+    total_ms = next(r.cumulative_us for r in rows if r.name == args.target) / 1000
+
+    print(f"import {args.target}: {total_ms:.0f}ms (budget {args.budget_ms:.0f}ms)")
+    print(f"\n{'top-level package':<32} {'cumulative':>12}")
+    packages: Dict[str, int] = {}
+    for row in rows:
+        if row.depth == 1 or row.parent == args.target:
+            key = _top_level(row.name)
+            packages[key] = packages.get(key, 0) + row.cumulative_us
+    for name, us in sorted(packages.items(), key=lambda x: -x[1])[: args.top]:
+        print(f"{name:<32} {us / 1000:>10.1f}ms")
+
+    failures = []
+    for row in rows:
+        if _top_level(row.name) in LAZY_MODULES and row.name in LAZY_MODULES:
+            importer = row.parent or ""
+            if _top_level(importer) in FIRST_PARTY:
+                failures.append(f"{row.name} 를 {importer} 에서 기동 시 import")
+            else:
+                print(f"\nnote: {row.name} imported by third-party {importer}")
+
+    if total_ms > args.budget_ms:
+        failures.append(f"import 시간 {total_ms:.0f}ms > 예산 {args.budget_ms:.0f}ms")
+
+    if failures:
+        print("\nFAILED")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+도메인 직렬화 / 매핑 마이크로 벤치마크
+
+SSE 플랜 갱신, 메시지 목록 DTO 변환, Mongo 직렬화/역직렬화, 프롬프트용 플랜 문자열화 등
+요청마다 반복되는 경로의 호출당 시간을 측정하고 저장된 기준값과 비교한다.
+
+    python -m benchmarks.micro                      # 기준값 대비 비교 (회귀 시 exit 1)
+    python -m benchmarks.micro --threshold 0.4      # 허용 회귀율 하한 40% (기본 10%)
+    python -m benchmarks.micro --update-baseline    # 기준값 갱신
+
+측정은 warmup 후 --repeat 라운드를 돌며, 라운드마다 모든 케이스와 control(고정 순수 Python 작업)을
+번갈아 측정한다. 비교는 케이스 / control 시간 비율의 중앙값으로 하므로
+CPU 클럭 / 다른 프로세스 부하처럼 실행 전체에 걸친 속도 변화는 상쇄된다.
+spread 는 비율의 사분위 범위 / 중앙값, noise 는 그 중앙값의 오차 추정(spread / sqrt(라운드 수))이며,
+케이스별 허용 회귀율은 max(--threshold, --noise-factor x (기준값 noise + 이번 실행 noise)) 이다.
+(부하가 심한 장비에서는 noise 가 커져 허용치가 자동으로 넓어진다)
+
+기준값은 장비마다 다르므로 비교에 사용하는 장비(CI 등)에서 --update-baseline 으로 갱신한다.
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks import fixtures
+from infra.implement.message_repository_impl import MessageRepository
+from interface.mapper.message_mapper import MessageMapper
+from utils.prompt_utils import step_list_to_str
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "micro.json"
+CONTROL = "control"
+
+
+def control() -> int:
+    """장비 / 실행 간 속도 차이 보정용 고정 작업 (인터프리터 + 작은 객체 할당)"""
+    return sum(len(str(i)) for i in range(2000))
+
+
+def build_cases() -> Dict[str, Callable[[], object]]:
+    plan = fixtures.large_plan()
+    query_message = fixtures.long_chat(pairs=1)[0].model_copy(
+        update={"content": fixtures.long_query()}
+    )
+    ai_message = fixtures.ai_message(query_message.chat_id, plan)
+    ai_document = fixtures.message_document(ai_message)
+    chat = fixtures.long_chat()
+    chat_documents = [fixtures.message_document(m) for m in chat]
+
+    return {
+        "plan_model_dump_json": lambda: plan.model_dump_json(exclude_none=True),
+        "step_list_to_str": lambda: step_list_to_str(plan.step_list),
+        "message_mapper_long_chat": lambda: [MessageMapper.to_dto(m) for m in chat],
+        "serialize_ai_message": lambda: MessageRepository.serialize(ai_message),
+        "serialize_10kb_query": lambda: MessageRepository.serialize(query_message),
+        "deserialize_ai_message": lambda: MessageRepository.deserialize(ai_document),
+        "deserialize_long_chat": lambda: [
+            MessageRepository.deserialize(d) for d in chat_documents
+        ],
+    }
+
+
+def calibrate(timer: timeit.Timer, sample_seconds: float) -> int:
+    """한 샘플이 sample_seconds 이상 걸리는 호출 횟수 (측정 자체가 warmup 을 겸함)"""
+    number = 1
+    while timer.timeit(number=number) < sample_seconds:
+        number *= 2
+    return number
+
+
+def measure(
+    cases: Dict[str, Callable[[], object]],
+    repeat: int,
+    warmup: int,
+    sample_seconds: float,
+) -> Dict[str, List[float]]:
+    """케이스별 라운드당 호출 시간(초) 목록. 라운드마다 모든 케이스를 번갈아 측정"""
+    timers = {name: timeit.Timer(fn) for name, fn in cases.items()}
+    numbers = {name: calibrate(timer, sample_seconds) for name, timer in timers.items()}
+    samples: Dict[str, List[float]] = {name: [] for name in timers}
+    for round_ in range(warmup + repeat):
+        for name, timer in timers.items():
+            elapsed = timer.timeit(number=numbers[name]) / numbers[name]
+            if round_ >= warmup:
+                samples[name].append(elapsed)
+    return samples
+
+
+def summarize(values: List[float]) -> Tuple[float, float]:
+    """(중앙값, 사분위 범위 / 중앙값)"""
+    median = statistics.median(values)
+    q1, _, q3 = statistics.quantiles(values, n=4)
+    return median, (q3 - q1) / median
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="domain micro benchmarks")
+    parser.add_argument("--repeat", type=int, default=41, help="측정 라운드 수")
+    parser.add_argument("--warmup", type=int, default=3, help="버리는 라운드 수")
+    parser.add_argument("--sample-ms", type=float, default=20, help="샘플당 시간")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--noise-factor", type=float, default=4)
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--only", default="", help="이름에 포함된 케이스만 실행")
+    args = parser.parse_args()
+
+    cases = {name: fn for name, fn in build_cases().items() if args.only in name}
+    samples = measure(
+        {CONTROL: control, **cases}, args.repeat, args.warmup, args.sample_ms / 1000
+    )
+    control_samples = samples.pop(CONTROL)
+    results = {}
+    for name, times in samples.items():
+        ratio, spread = summarize([t / c for t, c in zip(times, control_samples)])
+        results[name] = {
+            "seconds": statistics.median(times),
+            "ratio": ratio,
+            "spread": spread,
+            "noise": spread / math.sqrt(len(times)),
+        }
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "control_seconds": statistics.median(control_samples),
+                    "cases": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"baseline updated: {baseline_path}")
+
+    baseline = (
+        json.loads(baseline_path.read_text())["cases"] if baseline_path.exists() else {}
+    )
+
+    regressions = []
+    print(
+        f"control {statistics.median(control_samples) * 1e6:.1f}us, "
+        f"{args.repeat} rounds (vs baseline: case / control ratio median)"
+    )
+    print(
+        f"{'case':<28} {'per call':>12} {'spread':>8} {'noise':>7} "
+        f"{'vs baseline':>12} {'allowed':>8}"
+    )
+    for name, result in results.items():
+        line = (
+            f"{name:<28} {result['seconds'] * 1e6:>10.1f}us "
+            f"{result['spread'] * 100:>7.1f}% {result['noise'] * 100:>6.1f}%"
+        )
+        # 이전 형식(ratio 없음) 기준값은 비교하지 않음 → --update-baseline 필요
+        if "noise" in baseline.get(name, {}):
+            change = result["ratio"] / baseline[name]["ratio"] - 1
+            allowed = max(
+                args.threshold,
+                args.noise_factor * (result["noise"] + baseline[name]["noise"]),
+            )
+            line += f" {change * 100:>+11.1f}% {allowed * 100:>7.0f}%"
+            if change > allowed:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) slower than baseline beyond the allowed "
+            f"regression: {', '.join(regressions)}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+요청 컨텍스트 미들웨어 오버헤드 벤치마크
+
+이전 구성(BaseHTTPMiddleware 기반 RequestContextMiddleware + starlette_context RawContextMiddleware)과
+현재 순수 ASGI RequestContextMiddleware 를 미들웨어 없는 앱과 비교한다.
+starlette-context 는 더 이상 의존성이 아니므로 RawContextMiddleware 는 같은 동작(요청마다 context dict 를
+contextvar 에 설정하고 응답 시작 메시지를 가로챔)을 하는 LegacyRawContextMiddleware 로 재현한다.
+HTTP 서버 없이 ASGI 앱을 직접 호출하므로 미들웨어 자체 비용만 측정된다.
+
+- requests/s: 작은 JSON 응답을 concurrency 개씩 동시에 처리
+- SSE per-chunk: StreamingResponse 청크 하나를 클라이언트(send)까지 전달하는 데 드는 시간
+
+    python -m benchmarks.request_context
+    python -m benchmarks.request_context --requests 5000 --chunks 20000
+"""
+
+import argparse
+import asyncio
+import contextvars
+import time
+from typing import Callable, Dict, List
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from middleware.request_context import RequestContextMiddleware
+
+_legacy_var: contextvars.ContextVar[Request] = contextvars.ContextVar("legacy")
+_legacy_context: contextvars.ContextVar[dict] = contextvars.ContextVar("context")
+
+
+class LegacyRawContextMiddleware:
+    """비교용: starlette_context.RawContextMiddleware (플러그인 없음) 와 같은 처리"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+            await send(message)
+
+        token = _legacy_context.set({})
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _legacy_context.reset(token)
+
+
+class LegacyRequestContextMiddleware(BaseHTTPMiddleware):
+    """비교용: 교체 전 구현"""
+
+    async def dispatch(self, request: Request, call_next):
+        token = _legacy_var.set(request)
+        try:
+            return await call_next(request)
+        finally:
+            _legacy_var.reset(token)
+
+
+def build_app(stack: str, chunks: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def events():
+            for i in range(chunks):
+                yield f'data: {{"v": "{i}"}}\n\n'
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    if stack == "before":
+        app.add_middleware(LegacyRawContextMiddleware)
+        app.add_middleware(LegacyRequestContextMiddleware)
+    elif stack == "after":
+        app.add_middleware(RequestContextMiddleware)
+    return app
+
+
+def _scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+
+async def call(app, path: str) -> int:
+    """응답 본문 메시지 수"""
+    messages = 0
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # 응답이 끝날 때까지 연결 유지
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal messages
+        if message["type"] == "http.response.body" and message.get("body"):
+            messages += 1
+
+    await app(_scope(path), receive, send)
+    return messages
+
+
+async def requests_per_second(app, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one():
+        async with semaphore:
+            await call(app, "/ping")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(requests)))
+    return requests / (time.perf_counter() - started)
+
+
+async def seconds_per_chunk(app, chunks: int) -> float:
+    started = time.perf_counter()
+    received = await call(app, "/stream")
+    assert received == chunks, received
+    return (time.perf_counter() - started) / chunks
+
+
+def best(repeat: int, fn: Callable[[], float], higher_is_better: bool) -> float:
+    results = [asyncio.run(fn()) for _ in range(repeat)]
+    return max(results) if higher_is_better else min(results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="request context middleware benchmark")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--chunks", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows: Dict[str, List[float]] = {}
+    for stack in ("none", "before", "after"):
+        app = build_app(stack, args.chunks)
+        rps = best(
+            args.repeat,
+            lambda: requests_per_second(app, args.requests, args.concurrency),
+            higher_is_better=True,
+        )
+        per_chunk = best(
+            args.repeat, lambda: seconds_per_chunk(app, args.chunks), False
+        )
+        rows[stack] = [rps, per_chunk]
+
+    base_chunk = rows["none"][1]
+    print(f"{'stack':<8} {'req/s':>10} {'SSE/chunk':>12} {'overhead/chunk':>16}")
+    for stack, (rps, per_chunk) in rows.items():
+        print(
+            f"{stack:<8} {rps:>10.0f} {per_chunk * 1e6:>10.2f}us "
+            f"{(per_chunk - base_chunk) * 1e6:>+14.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+SSE 토큰 프레임 묶음(coalescing) CPU 벤치마크
+
+가짜 LLM 토큰 스트림(--interval-ms 간격)을 실제 응답 경로
+(coalesce_tokens -> TokenChunk 직렬화 -> StreamingResponse -> RequestContextMiddleware -> send)로
+--concurrency 개 동시에 흘려보내고, 답변 하나당 프로세스 CPU 시간 / 프레임 수 / 전송 바이트를 비교한다.
+HTTP 서버 없이 ASGI 앱을 직접 호출하므로 소켓 쓰기 비용은 포함되지 않는다. (실제 절감은 더 크다)
+
+- token window 0      : 이전 동작 (토큰마다 프레임)
+- token window N ms   : N ms 단위로 묶음 (--windows)
+- plan window         : 플랜 갱신 프레임(PlanInfo 직렬화) 묶음
+
+    python -m benchmarks.sse_coalescing
+    python -m benchmarks.sse_coalescing --tokens 1000 --interval-ms 1 --windows 0 25 50
+"""
+
+import argparse
+import asyncio
+import time
+from typing import AsyncGenerator, Dict, List
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from application.messages.frames import (
+    coalesce_plans,
+    coalesce_tokens,
+    plan_payload,
+    token_payload,
+)
+from domain.chats.models.stream_options import StreamOptions
+from domain.plans.plan import PlanInfo
+from middleware.request_context import RequestContextMiddleware
+
+TOKENS = (
+    "안녕",
+    "하세요",
+    ".",
+    " 차량",
+    "의",
+    " 타이어",
+    " 공기압",
+    "은",
+    " 2",
+    ".",
+    "5",
+    " bar",
+    "입니다",
+    "\n",
+)
+
+
+async def fake_tokens(count: int, interval: float) -> AsyncGenerator[str, None]:
+    for i in range(count):
+        await asyncio.sleep(interval)
+        yield TOKENS[i % len(TOKENS)]
+
+
+async def fake_plans(count: int, interval: float) -> AsyncGenerator[PlanInfo, None]:
+    plan = PlanInfo(status="processing")
+    for _ in range(count):
+        await asyncio.sleep(interval)
+        yield plan
+
+
+def build_app(args, options: StreamOptions) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/answer")
+    async def answer():
+        async def events():
+            async for batch in coalesce_tokens(
+                fake_tokens(args.tokens, args.interval_ms / 1000), options
+            ):
+                yield f"data:{token_payload(batch)}\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/plan")
+    async def plan():
+        async def events():
+            async for batch in coalesce_plans(
+                fake_plans(args.plans, args.interval_ms / 1000), options
+            ):
+                yield f"data:{plan_payload(batch)}\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    app.add_middleware(RequestContextMiddleware)
+    return app
+
+
+def _scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+
+async def call(app, path: str) -> List[int]:
+    """[프레임 수, 본문 바이트]"""
+    result = [0, 0]
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            result[0] += 1
+            result[1] += len(message["body"])
+
+    await app(_scope(path), receive, send)
+    return result
+
+
+async def run(app, path: str, concurrency: int) -> Dict[str, float]:
+    cpu, wall = time.process_time(), time.perf_counter()
+    results = await asyncio.gather(*(call(app, path) for _ in range(concurrency)))
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    return {
+        "cpu_ms": cpu * 1000 / concurrency,
+        "wall_s": wall,
+        "frames": sum(r[0] for r in results) / concurrency,
+        "bytes": sum(r[1] for r in results) / concurrency,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SSE frame coalescing benchmark")
+    parser.add_argument("--tokens", type=int, default=600, help="답변당 토큰 수")
+    parser.add_argument("--plans", type=int, default=60, help="답변당 플랜 갱신 수")
+    parser.add_argument("--interval-ms", type=float, default=2, help="토큰 간격")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--windows", type=int, nargs="+", default=[0, 25, 50])
+    parser.add_argument("--max-bytes", type=int, default=1024)
+    parser.add_argument("--plan-window-ms", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for window in args.windows:
+        options = StreamOptions(
+            token_window_ms=window,
+            token_max_bytes=args.max_bytes,
+            plan_window_ms=args.plan_window_ms,
+        )
+        app = build_app(args, options)
+        best = min(
+            (
+                asyncio.run(run(app, "/answer", args.concurrency))
+                for _ in range(args.repeat)
+            ),
+            key=lambda r: r["cpu_ms"],
+        )
+        rows.append((f"token {window}ms", best))
+
+    for window in sorted({0, args.plan_window_ms}):
+        app = build_app(args, StreamOptions(plan_window_ms=window))
+        best = min(
+            (
+                asyncio.run(run(app, "/plan", args.concurrency))
+                for _ in range(args.repeat)
+            ),
+            key=lambda r: r["cpu_ms"],
+        )
+        rows.append((f"plan {window}ms", best))
+
+    print(
+        f"{args.tokens} tokens / {args.plans} plan updates per answer, "
+        f"{args.interval_ms}ms interval, {args.concurrency} concurrent answers"
+    )
+    print(f"{'mode':<14} {'CPU/answer':>12} {'frames':>8} {'bytes':>9} {'wall':>7}")
+    for name, r in rows:
+        print(
+            f"{name:<14} {r['cpu_ms']:>10.2f}ms {r['frames']:>8.0f} "
+            f"{r['bytes']:>9.0f} {r['wall_s']:>6.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from pydantic import TypeAdapter
+
+from common.metrics import CACHE_LOOKUPS
+from common.shared_cache import (
+    KEY_SEPARATOR,
+    InvalidationEvent,
+    SharedCacheTier,
+    key_str,
+)
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    fresh_until: float
+    stale_until: float
+
+
+class AsyncTTLCache(Generic[K, V]):
+    """
+    TTL + stale-while-revalidate + single-flight 비동기 캐시
+
+    - ttl 이내: 캐시 값을 그대로 반환
+    - ttl 경과 ~ ttl + stale_ttl 이내: 캐시 값을 반환하고 백그라운드에서 갱신
+    - 그 이후: loader 를 호출하여 새로 적재 (동일 key 에 대한 동시 호출은 한 번만 수행)
+
+    적재 중 무효화(invalidate / invalidate_where / clear)가 있으면 그 적재 결과는 대기자에게만 반환하고
+    캐시에는 기록하지 않는다. (무효화 전에 읽은 값이 무효화 후에 다시 저장되지 않도록)
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: float = 0,
+        max_size: int = 1024,
+        name: str = "cache",
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_size = max_size
+        self.name = name
+
+        self._entries: "OrderedDict[K, _Entry[V]]" = OrderedDict()
+        self._inflight: Dict[K, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+        # 무효화마다 증가. 적재 시작 시점과 다르면 결과를 기록하지 않는다
+        self._generation = 0
+
+        self.hits = 0
+        self.discarded_loads = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.load_errors = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """만료되지 않은(stale 포함) 값을 반환. 없으면 None"""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry.stale_until:
+            return None
+        return entry.value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        now = time.monotonic()
+        fresh_until = now + (self.ttl if ttl is None else ttl)
+        self._entries[key] = _Entry(
+            value=value,
+            fresh_until=fresh_until,
+            stale_until=fresh_until + self.stale_ttl,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def is_loading(self, key: K) -> bool:
+        """key 를 적재 중인 작업이 있는지 (get_or_load 가 그 작업을 기다리게 됨)"""
+        return key in self._inflight
+
+    def invalidate(self, key: K) -> None:
+        self._generation += 1
+        self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[K], bool]) -> int:
+        """predicate 를 만족하는 key 를 모두 제거하고 제거한 개수를 반환"""
+        self._generation += 1
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        entry = self._entries.get(key)
+        now = time.monotonic()
+
+        if entry is not None:
+            if now < entry.fresh_until:
+                self.hits += 1
+                CACHE_LOOKUPS.inc(cache=self.name, tier="local", result="hit")
+                self._entries.move_to_end(key)
+                return entry.value
+
+            if now < entry.stale_until:
+                self.stale_hits += 1
+                CACHE_LOOKUPS.inc(cache=self.name, tier="local", result="stale")
+                self._entries.move_to_end(key)
+                self._refresh_in_background(key, loader)
+                return entry.value
+
+            self._entries.pop(key, None)
+
+        self.misses += 1
+        CACHE_LOOKUPS.inc(cache=self.name, tier="local", result="miss")
+        return await self._load(key, loader)
+
+    async def refresh(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """캐시 상태와 관계없이 값을 다시 적재 (single-flight 유지)"""
+        return await self._load(key, loader)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": (
+                round((self.hits + self.stale_hits) / lookups, 4) if lookups else None
+            ),
+            "load_errors": self.load_errors,
+            "discarded_loads": self.discarded_loads,
+            "inflight": len(self._inflight),
+        }
+
+    async def _load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_loader(key, loader))
+            task.add_done_callback(self._consume_exception)
+            self._inflight[key] = task
+        # 호출자가 취소되더라도 다른 대기자를 위해 적재 작업은 계속 진행
+        return await asyncio.shield(task)
+
+    async def _run_loader(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        generation = self._generation
+        try:
+            value = await loader()
+        except Exception:
+            self.load_errors += 1
+            raise
+        else:
+            self._set_if_current(key, value, generation)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _set_if_current(
+        self, key: K, value: V, generation: int, ttl: Optional[float] = None
+    ) -> bool:
+        """적재 시작(generation) 이후 무효화가 없었을 때만 기록"""
+        if generation != self._generation:
+            self.discarded_loads += 1
+            return False
+        self.set(key, value, ttl=ttl)
+        return True
+
+    def _refresh_in_background(
+        self, key: K, loader: Callable[[], Awaitable[V]]
+    ) -> None:
+        if key in self._inflight:
+            return
+
+        async def _refresh() -> None:
+            try:
+                await self._load(key, loader)
+            except Exception as e:
+                logger.warning(f"[{self.name}] '{key}' 백그라운드 갱신 실패: {e}")
+
+        task = asyncio.create_task(_refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    @staticmethod
+    def _consume_exception(task: asyncio.Task) -> None:
+        # 대기자가 모두 취소된 경우 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+
+class TieredCache(AsyncTTLCache[K, V]):
+    """
+    프로세스 LRU(L1) + 워커 공유 계층(L2) 2단 캐시
+
+    - L1 미스(및 stale 갱신) 시 L2 를 먼저 조회하고, L2 에도 없을 때만 loader 를 호출하여 L1 / L2 에 기록
+      (refresh 는 L2 를 건너뛰고 항상 loader 호출)
+    - invalidate / invalidate_prefix / clear 는 L2 에서 삭제하고 다른 워커의 L1 에도 전파한다.
+    - L2 저장 / 삭제는 백그라운드에서 요청 순서대로 하나씩 반영한다. (삭제가 먼저 요청된 저장보다 앞서지 않도록)
+    - tier 가 None 이면 AsyncTTLCache 와 같다.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: float = 0,
+        max_size: int = 1024,
+        name: str = "cache",
+        tier: Optional[SharedCacheTier] = None,
+        value_type: Any = Any,
+    ):
+        super().__init__(ttl=ttl, stale_ttl=stale_ttl, max_size=max_size, name=name)
+        self.tier = tier
+        self._adapter = TypeAdapter(value_type)
+        self._forced: Set[K] = set()
+        self._writes: Set[asyncio.Task] = set()
+        self._last_write: Optional[asyncio.Task] = None
+
+        self.shared_hits = 0
+        self.shared_misses = 0
+        self.shared_errors = 0
+
+        if tier is not None:
+            tier.subscribe(name, self._on_invalidation)
+
+    async def refresh(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        self._forced.add(key)
+        try:
+            return await super().refresh(key, loader)
+        finally:
+            self._forced.discard(key)
+
+    def invalidate(self, key: K) -> None:
+        super().invalidate(key)
+        self._broadcast(InvalidationEvent(self.name, keys=[key_str(key)]))
+
+    def invalidate_prefix(self, prefix) -> int:
+        """key(튜플이면 앞부분)가 prefix 로 시작하는 항목을 모든 워커에서 제거"""
+        shared_prefix = key_str(prefix) + (
+            KEY_SEPARATOR if isinstance(prefix, tuple) else ""
+        )
+        removed = super().invalidate_where(
+            lambda key: key_str(key).startswith(shared_prefix)
+        )
+        self._broadcast(InvalidationEvent(self.name, prefix=shared_prefix))
+        return removed
+
+    def clear(self) -> None:
+        super().clear()
+        self._broadcast(InvalidationEvent(self.name))
+
+    def stats(self) -> dict:
+        return {
+            **super().stats(),
+            "shared": self.tier is not None,
+            "shared_hits": self.shared_hits,
+            "shared_misses": self.shared_misses,
+            "shared_errors": self.shared_errors,
+            "pending_writes": len(self._writes),
+        }
+
+    async def _run_loader(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        generation = self._generation
+        try:
+            if self.tier is not None and key not in self._forced:
+                shared = await self._get_shared(key)
+                if shared is not None:
+                    value, remaining = shared
+                    self._set_if_current(key, value, generation, ttl=remaining)
+                    return value
+
+            try:
+                value = await loader()
+            except Exception:
+                self.load_errors += 1
+                raise
+            # 무효화와 겹친 적재 결과는 L1 / L2 어디에도 기록하지 않음
+            if self._set_if_current(key, value, generation) and self.tier is not None:
+                self._spawn(lambda: self._set_shared(key, value, generation))
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _get_shared(self, key: K) -> Optional[Tuple[V, float]]:
+        try:
+            entry = await self.tier.get(self.name, key_str(key))
+            remaining = entry.expires_at - time.time() if entry else 0
+            if remaining <= 0:
+                self.shared_misses += 1
+                CACHE_LOOKUPS.inc(cache=self.name, tier="shared", result="miss")
+                return None
+            value = self._adapter.validate_json(entry.value)
+        except Exception as e:
+            self.shared_errors += 1
+            CACHE_LOOKUPS.inc(cache=self.name, tier="shared", result="error")
+            logger.warning(f"[{self.name}] 공유 캐시 조회 실패: {e}")
+            return None
+
+        self.shared_hits += 1
+        CACHE_LOOKUPS.inc(cache=self.name, tier="shared", result="hit")
+        return value, min(remaining, self.ttl)
+
+    async def _set_shared(self, key: K, value: V, generation: int) -> None:
+        # 저장 차례가 오기 전에 무효화되었으면 기록하지 않음 (뒤의 삭제가 이미 대기 중)
+        if generation != self._generation:
+            self.discarded_loads += 1
+            return
+        try:
+            await self.tier.set(
+                self.name,
+                key_str(key),
+                self._adapter.dump_json(value),
+                time.time() + self.ttl,
+            )
+        except Exception as e:
+            logger.warning(f"[{self.name}] 공유 캐시 저장 실패: {e}")
+
+    def _broadcast(self, event: InvalidationEvent) -> None:
+        if self.tier is None:
+            return
+        event.origin = self.tier.origin
+
+        async def _invalidate() -> None:
+            try:
+                await self.tier.invalidate(event)
+            except Exception as e:
+                logger.warning(f"[{self.name}] 공유 캐시 무효화 실패: {e}")
+
+        self._spawn(_invalidate)
+
+    def _spawn(self, operation: Callable[[], Awaitable[None]]) -> None:
+        # L2 저장 / 무효화는 응답 지연에 포함하지 않되, 직전 작업이 끝난 뒤 실행하여 순서를 보장
+        # (tier 호출은 스레드 / 네트워크를 거치므로 동시에 보내면 도착 순서가 바뀔 수 있음)
+        previous = self._last_write
+
+        async def _run() -> None:
+            if previous is not None:
+                await asyncio.wait({previous})
+            await operation()
+
+        task = asyncio.create_task(_run())
+        self._last_write = task
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    def _on_invalidation(self, event: InvalidationEvent) -> None:
+        """다른 워커가 보낸 무효화 이벤트를 L1 에 반영"""
+        if event.keys is None and event.prefix is None:
+            super().clear()
+            return
+        super().invalidate_where(lambda key: event.matches(key_str(key)))
@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, Literal
+
+logger = logging.getLogger(__name__)
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str):
+        self.name = name
+        self.detail = f"{name} 업스트림 차단 중 (circuit open)"
+        super().__init__(self.detail)
+
+
+class _CallTimer:
+    """
+    호출 지연 측정. mark() 가 호출되면 그 시점(첫 응답)까지를 지연으로 본다
+    (guard() 의 첫 응답 deadline 도 이때 해제된다)
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.first_byte: float | None = None
+        self.deadline: asyncio.Timeout | None = None
+
+    def mark(self) -> None:
+        if self.first_byte is None:
+            self.first_byte = time.perf_counter()
+            if self.deadline is not None and not self.deadline.expired():
+                self.deadline.reschedule(None)
+
+    def latency(self) -> float:
+        return (self.first_byte or time.perf_counter()) - self.started
+
+
+class CircuitBreaker:
+    """
+    업스트림별 서킷 브레이커
+
+    최근 window_seconds 동안의 호출 결과(실패 / 느린 호출) 비율이 임계치를 넘으면 open.
+    open_seconds 가 지나면 half_open 으로 전환되어 시험 호출을 허용하고,
+    시험 호출이 성공하면 closed, 실패하면 다시 open 된다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window_seconds: float = 60,
+        min_calls: int = 10,
+        failure_ratio: float = 0.5,
+        slow_call_seconds: float = 10,
+        slow_call_ratio: float = 0.5,
+        open_seconds: float = 30,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.failure_ratio = failure_ratio
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_ratio = slow_call_ratio
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        # (기록 시각, 성공 여부, 느린 호출 여부)
+        self._calls: deque[tuple[float, bool, bool]] = deque()
+        self._opened_at: float | None = None
+        self._half_open_calls = 0
+
+    @property
+    def state(self) -> BreakerState:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.open_seconds:
+            return "half_open"
+        return "open"
+
+    @property
+    def is_open(self) -> bool:
+        """시험 호출 슬롯을 소비하지 않는 상태 확인용"""
+        return self.state == "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and self._half_open_calls < self.half_open_max_calls:
+            self._half_open_calls += 1
+            return True
+        return False
+
+    def check(self) -> None:
+        if not self.allow():
+            raise CircuitOpenError(self.name)
+
+    def record(self, success: bool, latency: float) -> None:
+        now = time.monotonic()
+        slow = latency >= self.slow_call_seconds
+
+        if self._opened_at is not None:
+            if self.state == "open":
+                # 차단 전에 시작된 호출의 늦은 결과는 무시
+                return
+            # half_open 시험 호출 결과
+            if success and not slow:
+                self._close()
+            else:
+                self._open(now, reason="시험 호출 실패")
+            return
+
+        self._calls.append((now, success, slow))
+        self._prune(now)
+
+        total = len(self._calls)
+        if total < self.min_calls:
+            return
+
+        failures = sum(1 for _, ok, _ in self._calls if not ok)
+        slows = sum(1 for _, _, is_slow in self._calls if is_slow)
+        if failures / total >= self.failure_ratio:
+            self._open(now, reason=f"실패율 {failures}/{total}")
+        elif slows / total >= self.slow_call_ratio:
+            self._open(now, reason=f"지연 호출 {slows}/{total}")
+
+    def stats(self) -> dict:
+        self._prune(time.monotonic())
+        return {
+            "name": self.name,
+            "state": self.state,
+            "calls": len(self._calls),
+            "failures": sum(1 for _, ok, _ in self._calls if not ok),
+            "slow_calls": sum(1 for _, _, slow in self._calls if slow),
+        }
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[_CallTimer]:
+        """
+        async with breaker.guard() as call: ... 블록을 하나의 호출로 기록.
+        스트리밍 호출은 첫 청크 수신 시 call.mark() 로 지연 측정 시점을 고정한다.
+
+        첫 응답(mark() 또는 블록 종료)까지 slow_call_seconds 를 넘기면 블록을 취소하고
+        TimeoutError 를 실패로 기록한다. (멈춘 업스트림이 기록 없이 계속 호출을 받지 않도록)
+        mark() 전에는 블록 밖으로 yield 하지 않아야 한다. (deadline 은 진입한 태스크를 취소)
+        """
+        self.check()
+        call = _CallTimer()
+        try:
+            async with asyncio.timeout(self.slow_call_seconds) as call.deadline:
+                yield call
+        except (asyncio.CancelledError, GeneratorExit):
+            # 호출자 취소는 업스트림 실패로 보지 않음
+            self._release()
+            raise
+        except BaseException:
+            self.record(False, call.latency())
+            raise
+        self.record(True, call.latency())
+
+    @contextmanager
+    def guard_sync(self) -> Iterator[_CallTimer]:
+        """동기 호출은 중단할 수 없으므로 deadline 없이 지연만 기록"""
+        self.check()
+        call = _CallTimer()
+        try:
+            yield call
+        except (asyncio.CancelledError, GeneratorExit):
+            # 호출자 취소는 업스트림 실패로 보지 않음
+            self._release()
+            raise
+        except BaseException:
+            self.record(False, call.latency())
+            raise
+        self.record(True, call.latency())
+
+    def _release(self) -> None:
+        if self._opened_at is not None and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def _prune(self, now: float) -> None:
+        while self._calls and now - self._calls[0][0] > self.window_seconds:
+            self._calls.popleft()
+
+    def _open(self, now: float, reason: str) -> None:
+        if self._opened_at is None:
+            logger.warning(f"[CircuitBreaker] {self.name} open: {reason}")
+        self._opened_at = now
+        self._half_open_calls = 0
+        self._calls.clear()
+
+    def _close(self) -> None:
+        logger.info(f"[CircuitBreaker] {self.name} closed")
+        self._opened_at = None
+        self._half_open_calls = 0
+        self._calls.clear()
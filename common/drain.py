@@ -0,0 +1,188 @@
+"""
+종료 시 진행 중인 SSE 스트림 드레인
+
+SIGTERM / SIGINT 를 받으면 (uvicorn 의 종료 핸들러보다 먼저)
+- readiness 게이트를 닫고 새 스트림을 거절하며 (/ready → 503, 스트림 라우트 → 503)
+- 진행 중인 스트림은 timeout 까지 그대로 완료시킨다.
+- timeout 이 지나면 남은 스트림의 다음 프레임 대기를 취소하여 파이프라인이 버퍼를 저장하고
+  메시지를 stalled 로 표시하게 한 뒤, 클라이언트에 마지막 프레임(stalled_frame)을 보내고 닫는다.
+  (flush_seconds 안에 끝나지 않는 스트림은 기다리지 않는다)
+
+    async for frame in drain.guard(generator(...), stalled_frame=...):
+        yield frame
+"""
+
+import asyncio
+import logging
+import signal
+import time
+from typing import AsyncIterator, Callable, Dict, Optional, Set
+
+from common.metrics import DRAIN_STREAMS
+from common.readiness import Readiness
+
+logger = logging.getLogger(__name__)
+
+READINESS_GATE = "drain"
+DRAIN_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
+
+class _TrackedStream:
+    __slots__ = ("task", "waiting", "stopped")
+
+    def __init__(self, task: Optional[asyncio.Task]):
+        self.task = task
+        # 업스트림 프레임을 기다리는 중인지 (이때만 취소한다)
+        self.waiting = False
+        self.stopped = False
+
+
+class DrainController:
+    def __init__(
+        self,
+        readiness: Readiness,
+        timeout: float = 25,
+        flush_timeout: float = 5,
+    ):
+        self._readiness = readiness
+        self.timeout = timeout
+        self.flush_timeout = flush_timeout
+        self._streams: Set[_TrackedStream] = set()
+        self._idle = asyncio.Event()
+        self._draining = False
+        self._expired = False
+        self._started_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._previous_handlers: Dict[int, Callable] = {}
+
+    @property
+    def draining(self) -> bool:
+        return self._draining
+
+    @property
+    def expired(self) -> bool:
+        return self._expired
+
+    @property
+    def active(self) -> int:
+        return len(self._streams)
+
+    def install_signal_handlers(self) -> None:
+        """
+        현재 핸들러(uvicorn 의 종료 핸들러)를 감싸서, 드레인을 먼저 시작한 뒤 넘긴다.
+        uvicorn 은 이후 리스너를 닫고 진행 중인 연결이 끝날 때까지 기다린다.
+        """
+        self._readiness.open(READINESS_GATE)
+        loop = asyncio.get_running_loop()
+
+        for sig in DRAIN_SIGNALS:
+            previous = signal.getsignal(sig)
+            if not callable(previous):
+                continue
+
+            def _handler(signum, frame, previous=previous):
+                loop.call_soon_threadsafe(self.begin)
+                previous(signum, frame)
+
+            try:
+                signal.signal(sig, _handler)
+            except ValueError:
+                # 메인 스레드가 아님 (테스트 / 임베디드 실행)
+                return
+            self._previous_handlers[sig] = previous
+
+    def restore_signal_handlers(self) -> None:
+        for sig, previous in self._previous_handlers.items():
+            signal.signal(sig, previous)
+        self._previous_handlers.clear()
+
+    def begin(self) -> None:
+        if self._draining:
+            return
+        self._draining = True
+        self._started_at = time.monotonic()
+        self._readiness.close(READINESS_GATE, detail={"active_streams": self.active})
+        logger.warning(
+            f"[Drain] 드레인 시작: 진행 중 스트림 {self.active}개, 최대 {self.timeout:.0f}s 대기"
+        )
+        if not self._streams:
+            self._idle.set()
+        self._task = asyncio.create_task(self._drain(), name="drain")
+
+    async def wait(self) -> None:
+        if self._task is not None:
+            await self._task
+
+    async def _drain(self) -> None:
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=self.timeout)
+            logger.warning(
+                f"[Drain] 모든 스트림 완료 ({time.monotonic() - self._started_at:.1f}s)"
+            )
+            return
+        except asyncio.TimeoutError:
+            pass
+
+        self._expired = True
+        logger.warning(f"[Drain] timeout: 남은 스트림 {self.active}개 중단")
+        for stream in list(self._streams):
+            if stream.waiting and stream.task is not None:
+                stream.stopped = True
+                stream.task.cancel()
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=self.flush_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"[Drain] 정리되지 않은 스트림 {self.active}개")
+
+    async def guard(
+        self, stream: AsyncIterator[str], stalled_frame: str
+    ) -> AsyncIterator[str]:
+        """스트림을 드레인 대상으로 등록하고, timeout 이후에는 stalled_frame 으로 마무리"""
+        tracked = _TrackedStream(asyncio.current_task())
+        self._streams.add(tracked)
+        self._idle.clear()
+        outcome = "completed"
+        try:
+            while not self._expired:
+                tracked.waiting = True
+                try:
+                    frame = await anext(stream)
+                except StopAsyncIteration:
+                    return
+                except asyncio.CancelledError:
+                    if not tracked.stopped:
+                        raise
+                    # 드레인 취소만 흡수하고 응답은 정상 종료한다
+                    tracked.task.uncancel()
+                    break
+                finally:
+                    tracked.waiting = False
+                yield frame
+
+            outcome = "stalled"
+            # 프레임 전송 중에 timeout 이 된 스트림도 여기서 정리 (GeneratorExit → stalled 저장)
+            await stream.aclose()
+            yield stalled_frame
+        finally:
+            if self._draining:
+                DRAIN_STREAMS.inc(outcome=outcome)
+            self._streams.discard(tracked)
+            if not self._streams:
+                self._idle.set()
+                if self._draining:
+                    self._readiness.update(READINESS_GATE, {"active_streams": 0})
+
+    def stall_reason(self, exc: BaseException) -> str:
+        """중단된 응답 메시지에 기록할 사유"""
+        if self._draining:
+            return "shutdown"
+        if isinstance(exc, Exception):
+            return "error"
+        return "interrupted"
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "draining": self._draining,
+            "expired": self._expired,
+            "active_streams": self.active,
+        }
@@ -1,111 +1,184 @@
 import functools
 import inspect
+import random
+import time
 import uuid
+from typing import Optional, Tuple
 
-from dependency_injector.wiring import Provide, inject
+from dependency_injector.wiring import Provide, Provider
 from fastapi import UploadFile
+from fastapi.params import Depends
+from pydantic import BaseModel
+from starlette.requests import Request
 
 from common.system_logger import SystemLogger
-from containers import Container
+from common.tracing import set_trace_id
+from config import get_settings
 from middleware.request_context import get_request
 
+LOG = get_settings().log
 
-def safe_serialize(obj):
-    """UploadFile이나 기타 비직렬화 객체를 안전하게 문자열 또는 dict로 변환"""
+# 재현(replay) 용 로그에 남기지 않을 필드
+REDACTED_FIELDS = {"password", "token", "access_token"}
+_EXCLUDED_PARAMS = {"user", "self"}
+_DI_MARKERS = (Provide, Provider)
+
+
+def safe_serialize(obj, max_chars: int = 0, max_items: int = 0):
+    """
+    UploadFile이나 기타 비직렬화 객체를 안전하게 문자열 또는 dict로 변환
+    max_chars / max_items 가 주어지면 긴 문자열과 list / dict 를 잘라낸다 (0: 제한 없음)
+    """
     if isinstance(obj, UploadFile):
         return {
             "filename": obj.filename,
             "content_type": obj.content_type,
             "size": getattr(obj.file, "size", None),
         }
-    if isinstance(obj, (str, int, float, bool, type(None))):
+    if isinstance(obj, str):
+        if max_chars and len(obj) > max_chars:
+            return f"{obj[:max_chars]}...(+{len(obj) - max_chars})"
+        return obj
+    if isinstance(obj, (int, float, bool, type(None))):
         return obj
+    if isinstance(obj, BaseModel):
+        return safe_serialize(
+            obj.model_dump(mode="json", by_alias=True), max_chars, max_items
+        )
     if isinstance(obj, dict):
-        return {k: safe_serialize(v) for k, v in obj.items()}
+        items = list(obj.items())
+        result = {
+            k: (
+                "***"
+                if k in REDACTED_FIELDS
+                else safe_serialize(v, max_chars, max_items)
+            )
+            for k, v in (items[:max_items] if max_items else items)
+        }
+        if max_items and len(items) > max_items:
+            result["..."] = len(items) - max_items
+        return result
     if isinstance(obj, list):
-        return [safe_serialize(v) for v in obj]
-    return str(obj)
-
+        result = [
+            safe_serialize(v, max_chars, max_items)
+            for v in (obj[:max_items] if max_items else obj)
+        ]
+        if max_items and len(obj) > max_items:
+            result.append(f"...(+{len(obj) - max_items})")
+        return result
+    return safe_serialize(str(obj), max_chars, max_items)
+
+
+def request_info(request: Request) -> dict:
+    """요청 재현에 필요한 HTTP 정보"""
+    route = request.scope.get("route")
+    return {
+        "method": request.method,
+        "path": request.url.path,
+        "route": getattr(route, "path", None),
+        "path_params": dict(request.path_params),
+        "query": dict(request.query_params),
+    }
+
+
+def _logged_params(func) -> Tuple[str, ...]:
+    """로그에 남길 파라미터 (user / self, Request, Depends / DI 주입 대상 제외)"""
+    names = []
+    for name, param in inspect.signature(func).parameters.items():
+        if name in _EXCLUDED_PARAMS or param.kind in (
+            param.VAR_POSITIONAL,
+            param.VAR_KEYWORD,
+        ):
+            continue
+        if isinstance(param.annotation, type) and issubclass(param.annotation, Request):
+            continue
+        default = param.default
+        if isinstance(default, (Depends, *_DI_MARKERS)):
+            continue
+        names.append(name)
+    return tuple(names)
+
+
+def log_request(start_sample_rate: Optional[float] = None):
+    """
+    요청 START / END / EXCEPTION 로그
+    함수 / 파라미터 정보는 데코레이션 시점에 한 번만 계산하고, 기록은 SystemLogger 배치 큐에 적재한다.
+    START(args / http 포함)는 start_sample_rate 비율만 기록하고, END / EXCEPTION 은 항상 기록한다.
+    """
+    sample_rate = (
+        LOG.log_start_sample_rate if start_sample_rate is None else start_sample_rate
+    )
+    max_chars = LOG.log_arg_max_chars
+    max_items = LOG.log_arg_max_items
 
-def log_request():
     def decorator(func):
+        file_name = func.__module__.split(".")[-1] + ".py"
+        function_name = func.__name__
+        start_detail = f"Executing {function_name}"
+        end_detail = f"Finished {function_name}"
+        params = _logged_params(func)
+
         @functools.wraps(func)
-        @inject
-        async def wrapper(
-            *args,
-            logger: SystemLogger = Provide[Container.system_logger],
-            **kwargs,
-        ):
+        async def wrapper(*args, **kwargs):
             request = get_request()
-            trace_id = str(uuid.uuid4())
-            request.state.request_id = trace_id
-
-            user = getattr(request.state, "user", None)
-            user_id = getattr(user, "user_id", "anonymous")
-
-            frame = next(
-                (
-                    f
-                    for f in inspect.stack()
-                    if f.filename.endswith(".py") and "log_request" not in f.function
-                ),
-                inspect.stack()[2],
-            )
-            file_name = func.__module__.split(".")[-1] + ".py"
-            function_name = func.__name__
-
-            IGNORED_TYPES = (Provide,)
-
-            filtered_kwargs = {
-                k: safe_serialize(v)
-                for k, v in kwargs.items()
-                if (
-                    k not in {"request", "user", "self"}
-                    and not isinstance(v, IGNORED_TYPES)
-                    and not repr(v).startswith("<dependency_injector.wiring.Provide")
-                )
+            state = request.state
+            trace_id = getattr(state, "request_id", None)
+            if trace_id is None:
+                trace_id = request.headers.get("x-request-id") or str(uuid.uuid4())
+                state.request_id = trace_id
+            set_trace_id(trace_id)
+
+            logger: SystemLogger = request.app.container.system_logger()
+            user = getattr(state, "user", None)
+            base = {
+                "fileName": file_name,
+                "functionName": function_name,
+                "user_id": getattr(user, "user_id", "anonymous"),
+                "trace_id": trace_id,
             }
 
-            try:
-                await logger.info(
+            if sample_rate >= 1 or random.random() < sample_rate:
+                logger.submit(
+                    "INFO",
                     {
-                        "fileName": file_name,
-                        "functionName": function_name,
-                        "user_id": user_id,
-                        "trace_id": trace_id,
+                        **base,
                         "state": "START",
-                        "detail": f"Executing {func.__name__}",
-                        "args": filtered_kwargs,
-                    }
+                        "detail": start_detail,
+                        "args": {
+                            name: safe_serialize(kwargs[name], max_chars, max_items)
+                            for name in params
+                            if name in kwargs and not isinstance(kwargs[name], Request)
+                        },
+                        "http": request_info(request),
+                    },
                 )
 
+            started = time.perf_counter()
+            try:
                 result = await func(*args, **kwargs)
-
-                await logger.info(
-                    {
-                        "fileName": file_name,
-                        "functionName": function_name,
-                        "user_id": user_id,
-                        "trace_id": trace_id,
-                        "state": "END",
-                        "detail": f"Finished {func.__name__}",
-                    }
-                )
-                return result
-
             except Exception as e:
-                await logger.error(
+                logger.submit(
+                    "ERROR",
                     {
-                        "fileName": file_name,
-                        "functionName": function_name,
-                        "user_id": user_id,
-                        "trace_id": trace_id,
+                        **base,
                         "state": "EXCEPTION",
+                        "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
                         "detail": f"Failed: {str(e)}",
-                    }
+                    },
                 )
                 raise
 
+            logger.submit(
+                "INFO",
+                {
+                    **base,
+                    "state": "END",
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+                    "detail": end_detail,
+                },
+            )
+            return result
+
         return wrapper
 
     return decorator
@@ -0,0 +1,176 @@
+"""
+이벤트 루프 지연(lag) 모니터 / 블로킹 호출 탐지
+
+- 루프 태스크가 interval 마다 sleep 하고, 예정보다 늦게 깨어난 시간을 lag 으로 기록한다.
+- capture_stacks 가 켜져 있으면 워치독 스레드가 루프가 threshold 이상 멈춘 시점에
+  루프 스레드의 스택을 수집해 두었다가, 루프가 재개되면 블로킹 시간과 함께 로그로 남긴다.
+
+    async with detect_blocking(threshold_ms=50):
+        await pipeline()          # 블로킹 호출이 있으면 BlockingCallError
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import AsyncIterator, Deque, List, Optional
+
+from common.metrics import EVENT_LOOP_BLOCKS, EVENT_LOOP_LAG
+
+logger = logging.getLogger(__name__)
+
+
+class BlockingCallError(AssertionError):
+    pass
+
+
+@dataclass
+class BlockEvent:
+    duration: float
+    started_at: datetime
+    stack: List[str] = field(default_factory=list)
+
+    def format(self) -> str:
+        header = f"이벤트 루프 {self.duration * 1000:.1f}ms 블로킹 ({self.started_at:%H:%M:%S.%f})"
+        if not self.stack:
+            return header
+        return header + "\n" + "".join(self.stack).rstrip()
+
+
+class LoopMonitor:
+    """워커 이벤트 루프 lag 측정 (start/stop 은 루프 안에서 호출)"""
+
+    def __init__(
+        self,
+        interval_ms: float = 100,
+        block_threshold_ms: float = 100,
+        capture_stacks: bool = False,
+        max_events: int = 100,
+        log_blocks: bool = True,
+    ):
+        self.interval = interval_ms / 1000
+        self.threshold = block_threshold_ms / 1000
+        self.capture_stacks = capture_stacks
+        self.log_blocks = log_blocks
+        self.events: Deque[BlockEvent] = deque(maxlen=max_events)
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._loop_thread: Optional[int] = None
+        # 루프 태스크가 마지막으로 깨어난 시각 / 해당 tick 에서 수집한 스택
+        self._beat = 0.0
+        self._captured: Optional[tuple] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._loop_thread = threading.get_ident()
+        self._beat = time.perf_counter()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run(), name="loop-monitor")
+        if self.capture_stacks:
+            self._watchdog = threading.Thread(
+                target=self._watch, name="loop-watchdog", daemon=True
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _run(self) -> None:
+        while True:
+            scheduled = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self._tick(scheduled)
+
+    def _tick(self, scheduled: float) -> None:
+        now = time.perf_counter()
+        lag = max(now - scheduled - self.interval, 0.0)
+        beat, self._beat = self._beat, now
+        EVENT_LOOP_LAG.observe(lag)
+        self.max_lag = max(self.max_lag, lag)
+
+        captured, self._captured = self._captured, None
+        if lag < self.threshold:
+            return
+
+        EVENT_LOOP_BLOCKS.inc()
+        stack = captured[1] if captured and captured[0] == beat else []
+        event = BlockEvent(
+            duration=lag,
+            started_at=datetime.fromtimestamp(time.time() - lag - self.interval, UTC),
+            stack=stack,
+        )
+        self.events.append(event)
+        if self.log_blocks:
+            logger.warning(f"[LoopMonitor] {event.format()}")
+
+    def _watch(self) -> None:
+        # 루프가 interval + threshold 이상 깨어나지 못하면 그 시점의 루프 스레드 스택을 수집
+        poll = max(min(self.interval, self.threshold) / 2, 0.001)
+        while not self._stop.wait(poll):
+            beat = self._beat
+            stalled = time.perf_counter() - beat
+            if stalled < self.interval + self.threshold:
+                continue
+            if self._captured is not None and self._captured[0] == beat:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is not None:
+                self._captured = (beat, traceback.format_stack(frame))
+
+    def stats(self) -> dict:
+        return {
+            "running": self.running,
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+            "blocks": len(self.events),
+        }
+
+
+@asynccontextmanager
+async def detect_blocking(
+    threshold_ms: float = 50, interval_ms: float = 10
+) -> AsyncIterator[LoopMonitor]:
+    """
+    구간 내 블로킹 호출을 탐지하여 BlockingCallError 로 실패시킨다 (테스트 / 점검 스크립트용)
+    """
+    monitor = LoopMonitor(
+        interval_ms=interval_ms,
+        block_threshold_ms=threshold_ms,
+        capture_stacks=True,
+        log_blocks=False,
+    )
+    monitor.start()
+    try:
+        yield monitor
+        # 마지막 tick 까지 반영
+        await asyncio.sleep(monitor.interval * 2)
+    finally:
+        await monitor.stop()
+
+    if monitor.events:
+        raise BlockingCallError(
+            f"블로킹 호출 {len(monitor.events)}건 탐지\n\n"
+            + "\n\n".join(event.format() for event in monitor.events)
+        )
@@ -0,0 +1,403 @@
+"""
+프로세스 내 메트릭 레지스트리 (Prometheus text exposition 0.0.4)
+
+uvicorn 워커가 여러 개인 경우 각 워커가 주기적으로 {multiprocess_dir}/{pid}.json 에
+스냅샷을 기록하고, /metrics 를 받은 워커가 모든 스냅샷을 합산해 응답한다.
+- Counter / Histogram: 종료된 워커 것까지 합산 (단조 증가 유지)
+- Gauge: 살아있는 워커 것만 합산
+
+gunicorn 은 기동 시 디렉터리를 비우고(clear_multiprocess_dir),
+워커 종료 시 그 워커의 Counter / Histogram 을 dead.json 하나로 합친 뒤 파일을 지운다(mark_process_dead).
+(재시작이 반복되어도 파일 수 / 합산 비용이 워커 수 이상으로 늘지 않음)
+"""
+
+import json
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+LabelValues = Tuple[str, ...]
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+RATE_BUCKETS = (1, 5, 10, 20, 30, 50, 75, 100, 150, 200)
+
+
+class _Metric:
+    type = ""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        registry: Optional["Registry"] = None,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, object] = {}
+        (registry or REGISTRY).register(self)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Tuple[LabelValues, object]]:
+        return list(self._values.items())
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._functions: Dict[LabelValues, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, fn: Callable[[], float], **labels: str) -> None:
+        """수집 시점에 값을 계산하는 gauge (큐 길이 등)"""
+        self._functions[self._key(labels)] = fn
+
+    def samples(self) -> List[Tuple[LabelValues, object]]:
+        values = dict(self._values)
+        for key, fn in self._functions.items():
+            try:
+                values[key] = float(fn())
+            except Exception as e:
+                logger.warning(f"[Metrics] {self.name} 수집 실패: {e}")
+        return list(values.items())
+
+
+class Histogram(_Metric):
+    """값: [버킷별 누적 전 개수..., sum, count]"""
+
+    type = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = LATENCY_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        row = self._values.get(key)
+        if row is None:
+            row = self._values[key] = [0] * (len(self.buckets) + 2)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                row[i] += 1
+                break
+        row[-2] += value
+        row[-1] += 1
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self.multiprocess_dir: Optional[Path] = None
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"중복 메트릭: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def configure(self, multiprocess_dir: str) -> None:
+        if multiprocess_dir:
+            self.multiprocess_dir = Path(multiprocess_dir)
+            self.multiprocess_dir.mkdir(parents=True, exist_ok=True)
+
+    def snapshot(self) -> dict:
+        return {
+            name: {
+                "type": m.type,
+                "help": m.help,
+                "labelnames": list(m.labelnames),
+                "buckets": list(getattr(m, "buckets", ())),
+                "samples": [[list(k), v] for k, v in m.samples()],
+            }
+            for name, m in self._metrics.items()
+        }
+
+    def write_snapshot(self) -> None:
+        """현재 워커 스냅샷을 원자적으로 기록"""
+        if self.multiprocess_dir is None:
+            return
+        path = self.multiprocess_dir / f"{os.getpid()}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.snapshot()))
+        os.replace(tmp, path)
+
+    def collect(self) -> dict:
+        """모든 워커 스냅샷 합산 (단일 프로세스면 자기 것만)"""
+        if self.multiprocess_dir is None:
+            return self.snapshot()
+
+        self.write_snapshot()
+        merged: dict = {}
+        for path in self.multiprocess_dir.glob("*.json"):
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            alive = _pid_alive(int(path.stem)) if path.stem.isdigit() else False
+            _merge(merged, snapshot, include_gauges=alive)
+        return merged
+
+    def render(self) -> str:
+        return render_text(self.collect())
+
+
+DEAD_SNAPSHOT = "dead.json"
+
+
+def clear_multiprocess_dir(multiprocess_dir: str) -> None:
+    """이전 실행의 스냅샷 제거 (마스터 기동 시, 워커 fork 전)"""
+    if not multiprocess_dir:
+        return
+    path = Path(multiprocess_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    for file in [*path.glob("*.json"), *path.glob("*.tmp")]:
+        file.unlink(missing_ok=True)
+
+
+def mark_process_dead(pid: int, multiprocess_dir: str) -> None:
+    """
+    종료된 워커의 스냅샷을 dead.json 에 합치고 삭제 (gunicorn child_exit, 마스터에서 순차 호출)
+    Gauge 는 합치지 않는다.
+    """
+    if not multiprocess_dir:
+        return
+    path = Path(multiprocess_dir) / f"{pid}.json"
+    dead = path.with_name(DEAD_SNAPSHOT)
+    try:
+        snapshot = json.loads(path.read_text())
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        logger.warning(f"[Metrics] 워커 {pid} 스냅샷 읽기 실패: {e}")
+        path.unlink(missing_ok=True)
+        return
+
+    merged: dict = {}
+    try:
+        _merge(merged, json.loads(dead.read_text()), include_gauges=False)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning(f"[Metrics] {DEAD_SNAPSHOT} 읽기 실패 (새로 작성): {e}")
+    _merge(merged, snapshot, include_gauges=False)
+
+    tmp = dead.with_suffix(".tmp")
+    tmp.write_text(
+        json.dumps(
+            {
+                name: {
+                    **metric,
+                    "samples": [[list(k), v] for k, v in metric["samples"].items()],
+                }
+                for name, metric in merged.items()
+                if metric["type"] != "gauge"
+            }
+        )
+    )
+    os.replace(tmp, dead)
+    path.unlink(missing_ok=True)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _merge(merged: dict, snapshot: dict, include_gauges: bool) -> None:
+    for name, metric in snapshot.items():
+        target = merged.setdefault(name, {**metric, "samples": {}})
+        if metric["type"] == "gauge" and not include_gauges:
+            continue
+        samples = target["samples"]
+        for labels, value in metric["samples"]:
+            key = tuple(labels)
+            if key not in samples:
+                samples[key] = list(value) if isinstance(value, list) else value
+            elif isinstance(value, list):
+                samples[key] = [a + b for a, b in zip(samples[key], value)]
+            else:
+                samples[key] += value
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def render_text(collected: dict) -> str:
+    lines: List[str] = []
+    for name, metric in sorted(collected.items()):
+        samples = metric["samples"]
+        if isinstance(samples, list):
+            samples = {tuple(k): v for k, v in samples}
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        names = metric["labelnames"]
+
+        for key, value in sorted(samples.items()):
+            if metric["type"] != "histogram":
+                lines.append(f"{name}{_labels(names, key)} {_format_value(value)}")
+                continue
+
+            cumulative = 0
+            for bound, count in zip(metric["buckets"], value):
+                cumulative += count
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(f"{name}_bucket{_labels(names, key, le)} {cumulative}")
+            inf = _labels(names, key, 'le="+Inf"')
+            lines.append(f"{name}_bucket{inf} {value[-1]}")
+            lines.append(f"{name}_sum{_labels(names, key)} {_format_value(value[-2])}")
+            lines.append(f"{name}_count{_labels(names, key)} {value[-1]}")
+    return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# HTTP
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+HTTP_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (스트리밍은 응답 완료까지)",
+    ("method", "route"),
+)
+SSE_ACTIVE = Gauge("sse_active_streams", "진행 중인 SSE 스트림 수", ("route",))
+# kind: token / plan, 프레임당 묶인 항목 수 = sse_frame_items / sse_frames_total
+SSE_FRAMES = Counter("sse_frames_total", "전송한 SSE 프레임 수", ("kind",))
+SSE_FRAME_ITEMS = Counter(
+    "sse_frame_items_total", "SSE 프레임에 묶어 보낸 토큰 / 플랜 갱신 수", ("kind",)
+)
+DRAIN_STREAMS = Counter(
+    "drain_streams_total",
+    "종료 드레인 중 끝난 SSE 스트림 (completed / stalled)",
+    ("outcome",),
+)
+
+# 파이프라인
+STAGE_DURATION = Histogram(
+    "pipeline_stage_duration_seconds",
+    "응답 생성 단계별 소요 시간",
+    ("pipeline", "stage"),
+)
+# load: cold(모델 적재가 포함된 요청) / warm
+LLM_TTFT = Histogram("llm_ttft_seconds", "LLM 첫 청크까지의 시간", ("model", "load"))
+LLM_TOKENS = Counter("llm_tokens_total", "LLM 스트림 청크 수", ("model",))
+LLM_TOKENS_PER_SECOND = Histogram(
+    "llm_tokens_per_second",
+    "첫 청크 이후 LLM 스트림 속도",
+    ("model",),
+    buckets=RATE_BUCKETS,
+)
+LLM_MODEL_LOAD = Histogram(
+    "llm_model_load_seconds",
+    "LLM 모델 적재(콜드 스타트) 시간",
+    ("model", "trigger"),
+)
+LLM_MODEL_WARM = Gauge(
+    "llm_model_warm", "warmup / keep_alive 갱신 성공 여부", ("model",)
+)
+
+# 업스트림 / 저장소
+UPSTREAM_DURATION = Histogram(
+    "upstream_request_duration_seconds",
+    "업스트림(studio / rerank / ml) 호출 시간",
+    ("upstream", "operation", "outcome"),
+)
+MONGO_DURATION = Histogram(
+    "mongo_operation_duration_seconds",
+    "Mongo 연산 시간",
+    ("collection", "operation", "outcome"),
+)
+QUEUE_DEPTH = Gauge("queue_depth", "내부 큐 길이", ("queue",))
+
+# 캐시 (tier: local = 프로세스 LRU, shared = 워커 공유 계층)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "캐시 조회 결과 (hit / stale / miss / error)",
+    ("cache", "tier", "result"),
+)
+
+# 이벤트 루프
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds", "이벤트 루프 스케줄링 지연", buckets=LAG_BUCKETS
+)
+EVENT_LOOP_BLOCKS = Counter(
+    "event_loop_blocked_total", "임계값 이상 이벤트 루프가 블로킹된 횟수"
+)
+
+
+def observe_operation(name: str, seconds: float, error: bool) -> None:
+    """traced() 연산 이름(<대상>.<...>.<연산>)을 메트릭으로 분류"""
+    outcome = "error" if error else "ok"
+    head, _, rest = name.partition(".")
+    if head == "mongo":
+        collection, _, operation = rest.partition(".")
+        MONGO_DURATION.observe(
+            seconds, collection=collection, operation=operation, outcome=outcome
+        )
+    elif head in ("studio", "rerank", "ml"):
+        UPSTREAM_DURATION.observe(
+            seconds, upstream=head, operation=rest, outcome=outcome
+        )
@@ -0,0 +1,347 @@
+"""
+샘플링 프로파일러 (speedscope 형식 출력)
+
+별도 스레드가 interval 마다 sys._current_frames() 로 스택을 수집한다.
+프로파일링 중이 아닐 때는 스레드도, 태스크 팩토리도 존재하지 않으므로 오버헤드가 없다.
+
+- StackSampler: 워커 프로세스의 모든 스레드 (이벤트 루프, Motor / to_thread 풀 등)
+- TaskSampler: 요청 하나에서 파생된 asyncio 태스크만
+    * "cpu": 해당 태스크가 이벤트 루프에서 실행 중인 시점의 스택
+    * "await": 대기 중인 태스크의 await 체인 (무엇을 기다리는지)
+
+결과는 https://www.speedscope.app 에서 열 수 있다.
+"""
+
+import asyncio
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+import weakref
+from datetime import UTC, datetime
+from types import FrameType
+from typing import Dict, List, Optional, Tuple
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+FrameKey = Tuple[str, str, int]
+
+_session_var: contextvars.ContextVar[Optional["TaskSampler"]] = contextvars.ContextVar(
+    "profile_session", default=None
+)
+
+
+class ProfilerBusyError(Exception):
+    pass
+
+
+class _Recorder:
+    """프레임 테이블과 프로파일별 (스택, 가중치) 목록. 연속된 동일 스택은 합친다"""
+
+    def __init__(self):
+        self.frames: List[dict] = []
+        self._frame_index: Dict[FrameKey, int] = {}
+        self.profiles: Dict[str, Tuple[List[List[int]], List[float]]] = {}
+
+    def frame(self, key: FrameKey) -> int:
+        index = self._frame_index.get(key)
+        if index is None:
+            index = self._frame_index[key] = len(self.frames)
+            name, file, line = key
+            self.frames.append({"name": name, "file": file, "line": line})
+        return index
+
+    def add(self, profile: str, stack: List[FrameKey], weight: float) -> None:
+        samples, weights = self.profiles.setdefault(profile, ([], []))
+        indices = [self.frame(key) for key in stack]
+        if samples and samples[-1] == indices:
+            weights[-1] += weight
+        else:
+            samples.append(indices)
+            weights.append(weight)
+
+    def to_speedscope(self, name: str, duration: float) -> dict:
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "chat-api common.profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": self.frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": profile,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": round(duration, 6),
+                    "samples": samples,
+                    "weights": [round(w, 6) for w in weights],
+                }
+                for profile, (samples, weights) in sorted(self.profiles.items())
+            ],
+        }
+
+
+def _frame_key(frame: FrameType) -> FrameKey:
+    code = frame.f_code
+    return (
+        getattr(code, "co_qualname", code.co_name),
+        code.co_filename,
+        frame.f_lineno,
+    )
+
+
+def _thread_stack(frame: Optional[FrameType], max_depth: int) -> List[FrameKey]:
+    stack: List[FrameKey] = []
+    while frame is not None and len(stack) < max_depth:
+        stack.append(_frame_key(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _await_stack(task: asyncio.Task, max_depth: int) -> List[FrameKey]:
+    """대기 중인 태스크의 코루틴 / 제너레이터 await 체인 (바깥 → 안쪽)"""
+    stack: List[FrameKey] = []
+    obj = task.get_coro()
+    while obj is not None and len(stack) < max_depth:
+        frame = (
+            getattr(obj, "cr_frame", None)
+            or getattr(obj, "ag_frame", None)
+            or getattr(obj, "gi_frame", None)
+        )
+        if frame is None:
+            break
+        stack.append(_frame_key(frame))
+        obj = (
+            getattr(obj, "cr_await", None)
+            or getattr(obj, "ag_await", None)
+            or getattr(obj, "gi_yieldfrom", None)
+        )
+    if obj is not None:
+        # Future 등 더 따라갈 수 없는 대기 대상
+        stack.append((f"<{type(obj).__name__}>", "", 0))
+    return stack
+
+
+class _SamplerThread:
+    def __init__(self, interval: float, max_depth: int):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.recorder = _Recorder()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.started_at: Optional[datetime] = None
+        self._started = 0.0
+        self._stopped = 0.0
+
+    def start(self) -> None:
+        self.started_at = datetime.now(UTC)
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._stopped = time.perf_counter()
+
+    @property
+    def duration(self) -> float:
+        return (self._stopped or time.perf_counter()) - self._started
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            self.sample(now - last)
+            self.samples += 1
+            last = now
+
+    def sample(self, elapsed: float) -> None:
+        raise NotImplementedError
+
+
+class StackSampler(_SamplerThread):
+    """프로세스 전체 스레드 샘플링. 스레드 이름별 프로파일을 만든다"""
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 128):
+        super().__init__(interval, max_depth)
+        self._names: Dict[int, str] = {}
+
+    def sample(self, elapsed: float) -> None:
+        me = threading.get_ident()
+        frames = sys._current_frames()
+        if any(ident not in self._names for ident in frames):
+            self._names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in frames.items():
+            if ident == me:
+                continue
+            name = self._names.get(ident, str(ident))
+            self.recorder.add(name, _thread_stack(frame, self.max_depth), elapsed)
+
+    def result(self, name: str) -> dict:
+        return self.recorder.to_speedscope(name, self.duration)
+
+
+class TaskSampler(_SamplerThread):
+    """
+    요청 하나에서 파생된 태스크만 샘플링
+    활성화된 동안 이벤트 루프에 태스크 팩토리를 설치해 요청 컨텍스트에서 생성된 태스크를 추적한다.
+    """
+
+    _active: Dict[asyncio.AbstractEventLoop, int] = {}
+    _previous_factory: Dict[asyncio.AbstractEventLoop, object] = {}
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 128):
+        super().__init__(interval, max_depth)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[int] = None
+        self.tasks: "weakref.WeakSet[asyncio.Task]" = weakref.WeakSet()
+        self._token: Optional[contextvars.Token] = None
+
+    def attach(self) -> None:
+        """현재 태스크와, 이후 현재 컨텍스트에서 생성되는 태스크를 추적 대상으로 등록"""
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread = threading.get_ident()
+        self.tasks.add(asyncio.current_task())
+        self._token = _session_var.set(self)
+        self._install_factory(self.loop)
+        self.start()
+
+    def detach(self) -> None:
+        """태스크 추적 해제. 샘플러 스레드 종료(stop)는 블로킹이므로 호출자가 별도로 수행"""
+        self._stop.set()
+        if self._token is not None:
+            try:
+                _session_var.reset(self._token)
+            except ValueError:
+                _session_var.set(None)
+        self._uninstall_factory(self.loop)
+
+    @classmethod
+    def _install_factory(cls, loop: asyncio.AbstractEventLoop) -> None:
+        count = cls._active.get(loop, 0)
+        cls._active[loop] = count + 1
+        if count:
+            return
+
+        previous = loop.get_task_factory()
+        cls._previous_factory[loop] = previous
+
+        def factory(loop_, coro, context=None):
+            if previous is not None:
+                task = (
+                    previous(loop_, coro, context=context)
+                    if context is not None
+                    else previous(loop_, coro)
+                )
+            else:
+                task = asyncio.Task(coro, loop=loop_, context=context)
+            session = (context or contextvars.copy_context()).get(_session_var)
+            if session is not None:
+                session.tasks.add(task)
+            return task
+
+        loop.set_task_factory(factory)
+
+    @classmethod
+    def _uninstall_factory(cls, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        if loop is None:
+            return
+        cls._active[loop] -= 1
+        if cls._active[loop] == 0:
+            del cls._active[loop]
+            loop.set_task_factory(cls._previous_factory.pop(loop))
+
+    def sample(self, elapsed: float) -> None:
+        tasks = _snapshot(self.tasks)
+        if not tasks:
+            return
+
+        running = asyncio.tasks._current_tasks.get(self.loop)
+        if running in tasks:
+            frame = sys._current_frames().get(self.loop_thread)
+            if frame is not None:
+                self.recorder.add("cpu", _thread_stack(frame, self.max_depth), elapsed)
+
+        for task in tasks:
+            if task is running or task.done():
+                continue
+            stack = [(f"task {task.get_name()}", "", 0)]
+            stack += _await_stack(task, self.max_depth)
+            self.recorder.add("await", stack, elapsed)
+
+    def result(self, name: str) -> dict:
+        return self.recorder.to_speedscope(name, self.duration)
+
+
+def _snapshot(tasks: "weakref.WeakSet[asyncio.Task]") -> List[asyncio.Task]:
+    # 이벤트 루프 스레드에서 태스크가 추가되는 중일 수 있음
+    for _ in range(3):
+        try:
+            return list(tasks)
+        except RuntimeError:
+            continue
+    return []
+
+
+class Profiler:
+    """워커 단위 프로파일 실행 / 저장 진입점 (컨테이너 Singleton)"""
+
+    def __init__(
+        self,
+        output_dir: str,
+        interval_ms: float = 5,
+        max_seconds: float = 60,
+    ):
+        self.output_dir = output_dir
+        self.interval = interval_ms / 1000
+        self.max_seconds = max_seconds
+        self._lock = asyncio.Lock()
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    async def sample(self, seconds: float, interval_ms: Optional[float] = None) -> dict:
+        """seconds 동안 프로세스 전체를 샘플링한 speedscope 프로파일"""
+        if self.busy:
+            raise ProfilerBusyError("이미 프로파일링 중입니다")
+        seconds = min(seconds, self.max_seconds)
+        async with self._lock:
+            sampler = StackSampler(
+                interval=(interval_ms / 1000) if interval_ms else self.interval
+            )
+            sampler.start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                await asyncio.to_thread(sampler.stop)
+            return sampler.result(f"pid {os.getpid()} {seconds:g}s")
+
+    def start_task_session(self) -> TaskSampler:
+        """현재 요청 태스크 프로파일 시작 (종료: detach() 후 stop())"""
+        session = TaskSampler(interval=self.interval)
+        session.attach()
+        return session
+
+    def new_profile_id(self) -> str:
+        return f"{datetime.now(UTC):%Y%m%dT%H%M%S}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+    def path(self, profile_id: str) -> str:
+        return os.path.join(self.output_dir, f"{profile_id}.speedscope.json")
+
+    def save(self, profile_id: str, profile: dict) -> str:
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = self.path(profile_id)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(profile, f)
+        return path
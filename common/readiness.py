@@ -0,0 +1,66 @@
+"""
+워커 준비 상태(readiness) 게이트
+
+기동 작업(모델 warmup 등)마다 게이트를 등록하고, 모두 열려야 ready 로 본다.
+/ready 는 ready 가 아니면 503 을 반환하여 로드밸런서가 트래픽을 보내지 않게 한다.
+
+    readiness.add_gate("llm_warmup")
+    ...
+    readiness.open("llm_warmup", detail={"gemma3": "warm"})
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class Gate:
+    name: str
+    is_open: bool = False
+    created_at: float = field(default_factory=time.monotonic)
+    opened_at: Optional[float] = None
+    detail: Any = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = (self.opened_at or time.monotonic()) - self.created_at
+        return {
+            "open": self.is_open,
+            "seconds": round(elapsed, 3),
+            "detail": self.detail,
+        }
+
+
+class Readiness:
+    def __init__(self):
+        self._gates: Dict[str, Gate] = {}
+
+    def add_gate(self, name: str) -> None:
+        self._gates[name] = Gate(name)
+
+    def open(self, name: str, detail: Any = None) -> None:
+        gate = self._gates.setdefault(name, Gate(name))
+        gate.is_open = True
+        gate.opened_at = time.monotonic()
+        if detail is not None:
+            gate.detail = detail
+
+    def close(self, name: str, detail: Any = None) -> None:
+        gate = self._gates.setdefault(name, Gate(name))
+        gate.is_open = False
+        gate.opened_at = None
+        if detail is not None:
+            gate.detail = detail
+
+    def update(self, name: str, detail: Any) -> None:
+        self._gates.setdefault(name, Gate(name)).detail = detail
+
+    @property
+    def ready(self) -> bool:
+        return all(gate.is_open for gate in self._gates.values())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "gates": {name: gate.to_dict() for name, gate in self._gates.items()},
+        }
@@ -0,0 +1,85 @@
+import asyncio
+import random
+from collections import deque
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """최근 N 개 호출의 지연 시간(초)을 보관하고 백분위를 계산"""
+
+    def __init__(self, window: int = 500, min_samples: int = 20):
+        self._samples: deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """표본이 min_samples 보다 적으면 None"""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        idx = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+        return ordered[idx]
+
+
+async def retry_with_jitter(
+    fn: Callable[[], Awaitable[T]],
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    on_retry: Optional[Callable[[int, BaseException], None]] = None,
+) -> T:
+    """
+    실패 시 지수 백오프 + full jitter 로 최대 max_retries 번 재시도
+    """
+    attempt = 0
+    while True:
+        try:
+            return await fn()
+        except retry_on as e:
+            if attempt >= max_retries:
+                raise
+            attempt += 1
+            if on_retry:
+                on_retry(attempt, e)
+            await asyncio.sleep(
+                random.uniform(0, min(max_delay, base_delay * 2**attempt))
+            )
+
+
+async def hedged(
+    fn: Callable[[], Awaitable[T]],
+    delay: float,
+    on_hedge: Optional[Callable[[], None]] = None,
+) -> T:
+    """
+    첫 요청이 delay 초 안에 끝나지 않으면 동일 요청을 한 번 더 보내고,
+    먼저 성공한 결과를 반환한다. 나머지 요청은 취소한다.
+    """
+    primary = asyncio.create_task(fn())
+    tasks = {primary}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            if on_hedge:
+                on_hedge()
+            tasks.add(asyncio.create_task(fn()))
+
+        error: Optional[BaseException] = None
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
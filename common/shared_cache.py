@@ -0,0 +1,115 @@
+"""
+워커 간 공유 캐시 계층(L2) 인터페이스
+
+TieredCache 의 프로세스 LRU(L1) 뒤에 위치한다. 값은 직렬화된 bytes 로 저장하고,
+무효화 이벤트는 모든 워커에 전파되어 각 워커의 L1 에서도 해당 key 를 제거한다.
+구현: infra/cache/mongo_cache_tier.py (Mongo), infra/cache/shm_cache_tier.py (같은 호스트 /dev/shm)
+"""
+
+import logging
+import os
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+KEY_SEPARATOR = "\x1f"
+
+
+def key_str(key) -> str:
+    """L1 key(문자열 / 튜플) → 공유 계층 key"""
+    if isinstance(key, tuple):
+        return KEY_SEPARATOR.join(str(part) for part in key)
+    return str(key)
+
+
+@dataclass
+class SharedEntry:
+    value: bytes
+    expires_at: float  # epoch seconds (워커 간 공유되므로 monotonic 이 아닌 wall clock)
+
+
+@dataclass
+class InvalidationEvent:
+    """keys / prefix 가 모두 없으면 namespace 전체 무효화"""
+
+    namespace: str
+    keys: Optional[List[str]] = None
+    prefix: Optional[str] = None
+    origin: str = ""
+
+    def matches(self, key: str) -> bool:
+        if self.keys is not None:
+            return key in self.keys
+        if self.prefix is not None:
+            return key.startswith(self.prefix)
+        return True
+
+    def to_dict(self) -> dict:
+        return {
+            "namespace": self.namespace,
+            "keys": self.keys,
+            "prefix": self.prefix,
+            "origin": self.origin,
+        }
+
+
+InvalidationHandler = Callable[[InvalidationEvent], None]
+
+
+class SharedCacheTier(ABC):
+    def __init__(self):
+        # 자신이 보낸 무효화 이벤트는 이미 로컬에 반영되어 있으므로 무시
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._handlers: Dict[str, InvalidationHandler] = {}
+        self.events_received = 0
+
+    def subscribe(self, namespace: str, handler: InvalidationHandler) -> None:
+        self._handlers[namespace] = handler
+
+    def dispatch(self, event: InvalidationEvent) -> None:
+        if event.origin == self.origin:
+            return
+        handler = self._handlers.get(event.namespace)
+        if handler is None:
+            return
+        self.events_received += 1
+        try:
+            handler(event)
+        except Exception as e:
+            logger.warning(f"[SharedCache] '{event.namespace}' 무효화 처리 실패: {e}")
+
+    @abstractmethod
+    async def start(self) -> None:
+        """무효화 이벤트 구독 시작 (lifespan)"""
+        pass
+
+    @abstractmethod
+    async def aclose(self) -> None:
+        pass
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Optional[SharedEntry]:
+        """만료되지 않은 값만 반환"""
+        pass
+
+    @abstractmethod
+    async def set(
+        self, namespace: str, key: str, value: bytes, expires_at: float
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate(self, event: InvalidationEvent) -> None:
+        """공유 계층에서 삭제한 뒤 다른 워커에 이벤트 전파"""
+        pass
+
+    def stats(self) -> dict:
+        return {
+            "backend": type(self).__name__,
+            "origin": self.origin,
+            "subscribed": sorted(self._handlers),
+            "events_received": self.events_received,
+        }
@@ -1,7 +1,10 @@
+import asyncio
 import logging
 import multiprocessing
 import threading
+import time
 from datetime import UTC, datetime
+from typing import List, Optional
 
 from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
@@ -9,6 +12,7 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 from config import get_settings
 
 MONGO = get_settings().mongo
+LOG = get_settings().log
 
 
 class SystemLogger:
@@ -20,7 +24,14 @@ class SystemLogger:
         "CRITICAL": 50,
     }
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        batch_size: int = LOG.log_batch_size,
+        flush_interval_ms: float = LOG.log_flush_interval_ms,
+        queue_max: int = LOG.log_queue_max,
+        stdout_level: str = LOG.log_stdout_level,
+    ):
         self.collection = db[MONGO.mongodb_log]
         self.stdout_logger = logging.getLogger("SystemLogger")
         if not self.stdout_logger.handlers:
@@ -31,18 +42,30 @@ class SystemLogger:
             handler.setFormatter(formatter)
             self.stdout_logger.addHandler(handler)
             self.stdout_logger.setLevel(logging.DEBUG)
+        # stdout 출력은 요청 경로가 아닌 flush 에서 stdout_level 이상만
+        self.stdout_level = self.LEVEL_MAP.get(stdout_level.upper(), logging.INFO)
+        self._process_name = multiprocessing.current_process().name
 
-    async def log(self, level: str, message: dict):
-        now = datetime.now(UTC)
-        level_number = self.LEVEL_MAP.get(level.upper(), 0)
+        # submit() 로 들어온 레코드는 모아서 insert_many 로 기록
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.queue_max = queue_max
+        self.dropped = 0
+        self._buffer: List[dict] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
 
+    def _record(self, level: str, message: dict) -> dict:
+        """요청 경로에서는 dict 만 구성 (when 은 epoch 초, 기록 시 ISO 문자열로 변환)"""
+        level_name = level.upper()
         record = {
-            "when": now.isoformat(),
-            "levelName": level.upper(),
-            "levelNumber": level_number,
+            "when": time.time(),
+            "levelName": level_name,
+            "levelNumber": self.LEVEL_MAP.get(level_name, 0),
             "fileName": message.get("fileName"),
             "functionName": message.get("functionName"),
-            "processName": multiprocessing.current_process().name,
+            "processName": self._process_name,
             "threadName": threading.current_thread().name,
             "user_id": message.get("user_id"),
             "trace_id": message.get("trace_id"),
@@ -50,8 +73,21 @@ class SystemLogger:
             "detail": message.get("detail"),
             "args": message.get("args", {}),
         }
+        for key in ("http", "elapsed_ms"):
+            if key in message:
+                record[key] = message[key]
+        return record
+
+    def _prepare(self, records: List[dict]) -> List[dict]:
+        """기록 직전 처리: when 변환, stdout_level 이상 레코드 출력"""
+        for record in records:
+            record["when"] = datetime.fromtimestamp(record["when"], UTC).isoformat()
+            if record["levelNumber"] >= self.stdout_level:
+                self.stdout_logger.log(record["levelNumber"], "%s", record)
+        return records
 
-        self.stdout_logger.log(level_number, str(record))
+    async def log(self, level: str, message: dict):
+        (record,) = self._prepare([self._record(level, message)])
 
         try:
             await self.collection.insert_one(record)
@@ -61,6 +97,54 @@ class SystemLogger:
                 detail=str(e),
             )
 
+    def submit(self, level: str, message: dict) -> None:
+        """요청 경로용: Mongo 기록을 기다리지 않고 배치 큐에 적재"""
+        record = self._record(level, message)
+        if len(self._buffer) >= self.queue_max:
+            self.dropped += 1
+            return
+        self._buffer.append(record)
+
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(
+                self._flush_loop(), name="system-logger-flush"
+            )
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    async def _flush_loop(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        while self._buffer:
+            batch = self._prepare(self._buffer[: self.batch_size])
+            del self._buffer[: self.batch_size]
+            try:
+                await self.collection.insert_many(batch, ordered=False)
+            except Exception as e:
+                self.dropped += len(batch)
+                self.stdout_logger.warning(f"로그 {len(batch)}건 기록 실패: {e}")
+
+    async def aclose(self) -> None:
+        # 진행 중인 insert_many 가 끝날 때까지 기다린 뒤 남은 레코드 기록
+        self._closing = True
+        if self._task is not None:
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
     async def info(self, message: dict):
         await self.log("INFO", message)
 
@@ -0,0 +1,409 @@
+"""
+프로세스 내 경량 트레이싱
+
+요청 단위 Trace 에 단계별 Span(시작 오프셋 / 소요 시간 / 속성)을 기록한다.
+활성 Trace 가 없으면 span() / traced() 는 아무 것도 기록하지 않는다.
+
+    with tracer.trace("message_turn", chat_id=chat_id) as trace:
+        with span("planner", app_id=app_id):
+            ...
+
+    @traced("mongo.message.update")
+    async def update(...): ...
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from common.metrics import STAGE_DURATION, observe_operation
+
+# 루트 직속 span 외에 단계 메트릭으로 집계할 span 접두어
+STAGE_PREFIXES = ("step.", "retrieval.")
+
+logger = logging.getLogger(__name__)
+
+_trace_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "trace_id", default=None
+)
+_trace_var: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar(
+    "trace", default=None
+)
+_span_var: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+    "span", default=None
+)
+
+
+def set_trace_id(trace_id: str) -> None:
+    """요청 로그(log_request)의 trace_id 를 이후 생성되는 Trace 에 전파"""
+    _trace_id_var.set(trace_id)
+
+
+def current_trace_id() -> Optional[str]:
+    trace = _trace_var.get()
+    return trace.trace_id if trace else _trace_id_var.get()
+
+
+def current_trace() -> Optional["Trace"]:
+    return _trace_var.get()
+
+
+def _reset(var: contextvars.ContextVar, token: contextvars.Token, previous) -> None:
+    # 비동기 제너레이터가 다른 컨텍스트에서 정리되는 경우 token 사용 불가
+    try:
+        var.reset(token)
+    except ValueError:
+        var.set(previous)
+
+
+class Span:
+    __slots__ = ("trace", "index", "name", "parent", "start", "end", "attrs", "error")
+
+    def __init__(
+        self, trace: "Trace", index: int, name: str, parent: Optional[int], attrs: dict
+    ):
+        self.trace = trace
+        self.index = index
+        self.name = name
+        self.parent = parent
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.attrs = attrs
+        self.error: Optional[str] = None
+
+    def set(self, key: str, value: Any) -> None:
+        self.attrs[key] = value
+
+    def mark(self, event: str) -> None:
+        """span 시작 이후 이벤트 시점(ms)을 속성으로 기록 (최초 1회)"""
+        key = f"{event}_ms"
+        if key not in self.attrs:
+            self.attrs[key] = round((time.perf_counter() - self.start) * 1000, 3)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        if self.end is None:
+            self.end = time.perf_counter()
+            if error is not None:
+                self.error = type(error).__name__
+
+    def to_dict(self) -> dict:
+        end = self.end if self.end is not None else time.perf_counter()
+        record = {
+            "name": self.name,
+            "start_ms": round((self.start - self.trace.start) * 1000, 3),
+            "duration_ms": round((end - self.start) * 1000, 3),
+        }
+        if self.parent is not None:
+            record["parent"] = self.parent
+        if self.attrs:
+            record["attrs"] = self.attrs
+        if self.error:
+            record["error"] = self.error
+        return record
+
+
+class _NoopSpan:
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def mark(self, event: str) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """요청 하나의 Span 타임라인. 0 번 span 은 Trace 전체(root) 이다"""
+
+    def __init__(self, name: str, trace_id: Optional[str] = None, max_spans: int = 512):
+        self.trace_id = trace_id or _trace_id_var.get() or str(uuid.uuid4())
+        self.started_at = datetime.now(UTC)
+        self.start = time.perf_counter()
+        self.max_spans = max_spans
+        self.dropped = 0
+        self.spans: List[Span] = []
+        self.root = self.open(name, None, {})
+
+    @property
+    def name(self) -> str:
+        return self.root.name
+
+    def open(self, name: str, parent: Optional[int], attrs: dict) -> Optional[Span]:
+        if len(self.spans) >= self.max_spans:
+            self.dropped += 1
+            return None
+        span_ = Span(self, len(self.spans), name, parent, attrs)
+        self.spans.append(span_)
+        return span_
+
+    @contextmanager
+    def activate(self) -> Iterator["Trace"]:
+        previous_trace, previous_span = _trace_var.get(), _span_var.get()
+        trace_token = _trace_var.set(self)
+        span_token = _span_var.set(self.root.index)
+        try:
+            yield self
+        except BaseException as e:
+            self.root.finish(e)
+            raise
+        finally:
+            self.root.finish()
+            _reset(_span_var, span_token, previous_span)
+            _reset(_trace_var, trace_token, previous_trace)
+
+    def timeline(self) -> dict:
+        """AIMessage 에 저장할 압축 타임라인"""
+        timeline = {
+            "trace_id": self.trace_id,
+            "started_at": self.started_at,
+            "duration_ms": self.spans[0].to_dict()["duration_ms"],
+            "spans": [s.to_dict() for s in self.spans[1:]],
+        }
+        if self.dropped:
+            timeline["dropped"] = self.dropped
+        return timeline
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Span | _NoopSpan]:
+    """
+    활성 Trace 에 하위 span 을 기록하고 블록 동안 현재 span 으로 지정한다.
+    비동기 제너레이터 안에서 yield 를 감싸면 소비자가 그 사이에 연 span 도 하위로 기록되므로,
+    다른 코드가 소비하는 스트림에는 start_span() 을 사용한다.
+    """
+    trace = _trace_var.get()
+    if trace is None:
+        yield NOOP_SPAN
+        return
+
+    previous = _span_var.get()
+    span_ = trace.open(name, previous, attrs)
+    if span_ is None:
+        yield NOOP_SPAN
+        return
+
+    token = _span_var.set(span_.index)
+    try:
+        yield span_
+    except BaseException as e:
+        span_.finish(e)
+        raise
+    finally:
+        span_.finish()
+        _reset(_span_var, token, previous)
+
+
+def start_span(name: str, **attrs: Any) -> Optional[Span]:
+    """
+    현재 span 을 부모로 하는 span 을 열되 현재 span 으로 지정하지 않는다. (활성 Trace 없으면 None)
+    yield 사이에 호출자의 span 이 바뀌지 않으므로 스트림 구간 기록에 사용하고, 호출자가 finish() 한다.
+    """
+    trace = _trace_var.get()
+    return trace.open(name, _span_var.get(), attrs) if trace else None
+
+
+def traced(name: str):
+    """
+    async 함수 / async 제너레이터 전체를 span 으로 기록하는 데코레이터
+    활성 Trace 와 무관하게 소요 시간은 메트릭(observe_operation)으로 집계한다.
+    """
+
+    def decorator(func):
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def gen_wrapper(*args, **kwargs):
+                span_ = start_span(name)
+                started = time.perf_counter()
+                count = 0
+                error = False
+                try:
+                    async for item in func(*args, **kwargs):
+                        if span_ is not None and count == 0:
+                            span_.mark("first_item")
+                        count += 1
+                        yield item
+                except BaseException as e:
+                    error = not isinstance(e, GeneratorExit)
+                    if span_ is not None:
+                        span_.finish(e)
+                    raise
+                finally:
+                    observe_operation(name, time.perf_counter() - started, error)
+                    if span_ is not None:
+                        span_.set("items", count)
+                        span_.finish()
+
+            return gen_wrapper
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            error = True
+            try:
+                with span(name):
+                    result = await func(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                observe_operation(name, time.perf_counter() - started, error)
+
+        return wrapper
+
+    return decorator
+
+
+class Tracer:
+    """Trace 생성 / 활성화 / 내보내기 진입점 (컨테이너 Singleton)"""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_spans: int = 512,
+        exporter: Optional["OtlpFileExporter"] = None,
+    ):
+        self.enabled = enabled
+        self.max_spans = max_spans
+        self.exporter = exporter
+
+    @contextmanager
+    def trace(self, name: str, **attrs: Any) -> Iterator[Optional[Trace]]:
+        if not self.enabled:
+            yield None
+            return
+
+        trace = Trace(name, max_spans=self.max_spans)
+        trace.root.attrs.update(attrs)
+        try:
+            with trace.activate():
+                yield trace
+        finally:
+            self._observe_stages(trace)
+            if self.exporter is not None:
+                self.exporter.export(trace)
+
+    @staticmethod
+    def _observe_stages(trace: Trace) -> None:
+        for span_ in trace.spans[1:]:
+            if span_.end is not None and (
+                span_.parent == 0 or span_.name.startswith(STAGE_PREFIXES)
+            ):
+                STAGE_DURATION.observe(
+                    span_.end - span_.start, pipeline=trace.name, stage=span_.name
+                )
+
+
+class OtlpFileExporter:
+    """
+    Trace 를 OTLP/JSON (ExportTraceServiceRequest) 형식으로 한 줄씩 파일에 기록한다.
+    파일 쓰기는 별도 스레드에서 처리하여 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(self, path: str, service_name: str = "chat-api"):
+        self.path = Path(path)
+        self.service_name = service_name
+        self._queue: queue.SimpleQueue[Optional[dict]] = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._thread = threading.Thread(
+                        target=self._run, name="trace-exporter", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put(self.to_otlp(trace))
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def shutdown(self, timeout: float = 5) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            payload = self._queue.get()
+            if payload is None:
+                return
+            try:
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            except Exception as e:
+                logger.warning(f"[Tracing] trace 기록 실패: {e}")
+
+    def to_otlp(self, trace: Trace) -> dict:
+        trace_hex = _trace_hex(trace.trace_id)
+        base_ns = int(trace.started_at.timestamp() * 1e9)
+        span_ids = [uuid.uuid4().hex[:16] for _ in trace.spans]
+
+        spans = []
+        for span_ in trace.spans:
+            record = span_.to_dict()
+            start_ns = base_ns + int(record["start_ms"] * 1e6)
+            otlp_span = {
+                "traceId": trace_hex,
+                "spanId": span_ids[span_.index],
+                "name": span_.name,
+                "kind": 1,
+                "startTimeUnixNano": str(start_ns),
+                "endTimeUnixNano": str(start_ns + int(record["duration_ms"] * 1e6)),
+                "attributes": [
+                    _otlp_attribute(k, v) for k, v in record.get("attrs", {}).items()
+                ],
+                "status": (
+                    {"code": 2, "message": span_.error} if span_.error else {"code": 1}
+                ),
+            }
+            if span_.parent is not None:
+                otlp_span["parentSpanId"] = span_ids[span_.parent]
+            spans.append(otlp_span)
+
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            _otlp_attribute("service.name", self.service_name)
+                        ]
+                    },
+                    "scopeSpans": [
+                        {"scope": {"name": "common.tracing"}, "spans": spans}
+                    ],
+                }
+            ]
+        }
+
+
+def _trace_hex(trace_id: str) -> str:
+    try:
+        return uuid.UUID(trace_id).hex
+    except ValueError:
+        return uuid.uuid5(uuid.NAMESPACE_OID, trace_id).hex
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
@@ -1,11 +1,24 @@
 from functools import lru_cache
 
+from config.admin_setting import AdminSetting
+from config.breaker_setting import BreakerSetting
+from config.cache_setting import CacheSetting
+from config.drain_setting import DrainSetting
 from config.haiqv_setting import HaiqvSetting
+from config.http_setting import HttpSetting
 from config.jwt_setting import JWTSetting
+from config.llm_warmup_setting import LlmWarmupSetting
+from config.log_setting import LogSetting
+from config.loop_monitor_setting import LoopMonitorSetting
+from config.metrics_setting import MetricsSetting
 from config.ml_setting import MLSetting
 from config.mongo_setting import MongoSetting
+from config.profiler_setting import ProfilerSetting
 from config.rerank_setting import RerankSetting
+from config.retrieval_setting import RetrievalSetting
+from config.stream_setting import StreamSetting
 from config.studio_setting import StudioSetting
+from config.tracing_setting import TracingSetting
 
 
 class Settings:
@@ -16,6 +29,19 @@ class Settings:
         self.studio = StudioSetting()
         self.rerank = RerankSetting()
         self.ml = MLSetting()
+        self.cache = CacheSetting()
+        self.http = HttpSetting()
+        self.admin = AdminSetting()
+        self.retrieval = RetrievalSetting()
+        self.breaker = BreakerSetting()
+        self.tracing = TracingSetting()
+        self.metrics = MetricsSetting()
+        self.profiler = ProfilerSetting()
+        self.loop_monitor = LoopMonitorSetting()
+        self.log = LogSetting()
+        self.llm_warmup = LlmWarmupSetting()
+        self.drain = DrainSetting()
+        self.stream = StreamSetting()
 
 
 @lru_cache()
@@ -0,0 +1,7 @@
+from typing import List
+
+from config.setting import BaseAppSettings
+
+
+class AdminSetting(BaseAppSettings):
+    admin_user_ids: List[str] = []
@@ -0,0 +1,12 @@
+from config.setting import BaseAppSettings
+
+
+class BreakerSetting(BaseAppSettings):
+    breaker_window_seconds: float = 60
+    breaker_min_calls: int = 10
+    breaker_failure_ratio: float = 0.5
+    breaker_slow_call_ratio: float = 0.5
+    breaker_open_seconds: float = 30
+    rerank_slow_call_seconds: float = 10
+    ml_slow_call_seconds: float = 15
+    llm_slow_call_seconds: float = 60
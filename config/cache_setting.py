@@ -0,0 +1,25 @@
+from typing import List
+
+from config.setting import BaseAppSettings
+
+
+class CacheSetting(BaseAppSettings):
+    app_info_cache_ttl: int = 3600
+    app_info_cache_stale_ttl: int = 86400
+    app_info_cache_max_size: int = 256
+    app_info_prefetch_ids: List[str] = []
+    app_info_prefetch_user_id: str = "system"
+    rerank_score_cache_enabled: bool = True
+    rerank_score_cache_ttl: int = 604800
+    rerank_score_cache_memory_ttl: int = 3600
+    rerank_score_cache_max_size: int = 50000
+    search_cache_ttl: int = 300
+    search_cache_max_size: int = 4096
+    prompt_cache_ttl: int = 300
+    prompt_cache_max_size: int = 256
+    user_cache_ttl: int = 60
+    user_cache_max_size: int = 4096
+    shared_cache_backend: str = "none"
+    shared_cache_shm_path: str = "/dev/shm/chat-cache.sqlite3"
+    shared_cache_poll_interval_ms: float = 200
+    shared_cache_event_log_bytes: int = 1048576
@@ -0,0 +1,8 @@
+from config.setting import BaseAppSettings
+
+
+class DrainSetting(BaseAppSettings):
+    drain_enabled: bool = True
+    drain_timeout_seconds: float = 25
+    drain_flush_seconds: float = 5
+    drain_retry_after_seconds: int = 5
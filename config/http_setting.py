@@ -0,0 +1,12 @@
+from config.setting import BaseAppSettings
+
+
+class HttpSetting(BaseAppSettings):
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http2_enabled: bool = False
+    studio_timeout: float = 30.0
+    rerank_timeout: float = 600.0
+    ml_connect_timeout: float = 10.0
+    ml_timeout: float = 60.0
@@ -0,0 +1,12 @@
+from typing import List
+
+from config.setting import BaseAppSettings
+
+
+class LlmWarmupSetting(BaseAppSettings):
+    llm_warmup_enabled: bool = True
+    llm_warmup_models: List[str] = []
+    llm_keep_alive: str = "30m"
+    llm_warmup_timeout: float = 120
+    llm_keep_alive_refresh_seconds: float = 600
+    llm_cold_load_threshold_seconds: float = 0.5
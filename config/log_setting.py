@@ -0,0 +1,11 @@
+from config.setting import BaseAppSettings
+
+
+class LogSetting(BaseAppSettings):
+    log_start_sample_rate: float = 1.0
+    log_arg_max_chars: int = 4096
+    log_arg_max_items: int = 100
+    log_batch_size: int = 200
+    log_flush_interval_ms: float = 500
+    log_queue_max: int = 10000
+    log_stdout_level: str = "INFO"
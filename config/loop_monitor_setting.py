@@ -0,0 +1,8 @@
+from config.setting import BaseAppSettings
+
+
+class LoopMonitorSetting(BaseAppSettings):
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval_ms: float = 100
+    loop_monitor_block_threshold_ms: float = 100
+    loop_monitor_capture_stacks: bool = False
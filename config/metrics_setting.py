@@ -0,0 +1,7 @@
+from config.setting import BaseAppSettings
+
+
+class MetricsSetting(BaseAppSettings):
+    metrics_enabled: bool = True
+    metrics_multiprocess_dir: str = ""
+    metrics_flush_interval: float = 2.0
@@ -0,0 +1,9 @@
+from config.setting import BaseAppSettings
+
+
+class ProfilerSetting(BaseAppSettings):
+    profiler_enabled: bool = True
+    profiler_output_dir: str = "/tmp/chat-profiles"
+    profiler_interval_ms: float = 5
+    profiler_max_seconds: float = 60
+    profiler_signal_seconds: float = 10
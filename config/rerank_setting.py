@@ -1,3 +1,5 @@
+from typing import Literal
+
 from config.setting import BaseAppSettings
 
 
@@ -5,3 +7,13 @@ class RerankSetting(BaseAppSettings):
     rerank_host: str
     rerank_port: str
     max_len: int
+    rerank_tokenizer: str = ""
+    rerank_passage_max_tokens: int = 384
+    rerank_passage_overlap: int = 32
+    rerank_max_passages: int = 128
+    rerank_aggregation: Literal["max", "mean_top_k"] = "max"
+    rerank_aggregation_top_k: int = 2
+    rerank_score_normalization: Literal["none", "minmax", "sigmoid"] = "minmax"
+    rerank_mmr_enabled: bool = False
+    rerank_mmr_lambda: float = 0.7
+    rerank_mmr_pool_factor: int = 3
@@ -0,0 +1,12 @@
+from config.setting import BaseAppSettings
+
+
+class RetrievalSetting(BaseAppSettings):
+    search_hedge_percentile: float = 0.95
+    search_hedge_min_delay: float = 0.2
+    search_hedge_default_delay: float = 1.0
+    search_max_retries: int = 2
+    search_retry_base_delay: float = 0.1
+    search_retry_max_delay: float = 1.0
+    search_quorum_ratio: float = 0.6
+    search_deadline: float = 3.0
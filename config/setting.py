@@ -1,9 +1,72 @@
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Mapping, Optional
+
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+
+@lru_cache()
+def _read_env_file(
+    file_path: Path,
+    encoding: Optional[str],
+    case_sensitive: bool,
+    ignore_empty: bool,
+    parse_none_str: Optional[str],
+) -> Mapping[str, Optional[str]]:
+    return DotEnvSettingsSource._static_read_env_file(
+        file_path,
+        encoding=encoding,
+        case_sensitive=case_sensitive,
+        ignore_empty=ignore_empty,
+        parse_none_str=parse_none_str,
+    )
+
+
+class _CachedDotEnvSettingsSource(DotEnvSettingsSource):
+    """.env 파일을 설정 클래스마다 다시 파싱하지 않고 프로세스당 한 번만 읽는다"""
+
+    def _read_env_file(self, file_path: Path) -> Mapping[str, Optional[str]]:
+        return dict(
+            _read_env_file(
+                file_path,
+                self.env_file_encoding,
+                self.case_sensitive,
+                self.env_ignore_empty,
+                self.env_parse_none_str,
+            )
+        )
+
+
+ENV_FILE = ".env"
+ENV_FILE_ENCODING = "utf-8"
 
 
 class BaseAppSettings(BaseSettings):
+    # 기본 dotenv 소스는 설정 클래스마다 .env 를 다시 파싱하므로 비활성화하고 캐시 소스로 대체
     model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
+        env_file=None,
         extra="ignore",
     )
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (
+            init_settings,
+            env_settings,
+            _CachedDotEnvSettingsSource(
+                settings_cls, env_file=ENV_FILE, env_file_encoding=ENV_FILE_ENCODING
+            ),
+            file_secret_settings,
+        )
@@ -0,0 +1,7 @@
+from config.setting import BaseAppSettings
+
+
+class StreamSetting(BaseAppSettings):
+    sse_token_window_ms: int = 30
+    sse_token_max_bytes: int = 1024
+    sse_plan_window_ms: int = 100
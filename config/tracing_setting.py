@@ -0,0 +1,8 @@
+from config.setting import BaseAppSettings
+
+
+class TracingSetting(BaseAppSettings):
+    tracing_enabled: bool = True
+    tracing_max_spans: int = 512
+    tracing_export_path: str = ""
+    tracing_service_name: str = "chat-api"
@@ -1,3 +1,5 @@
+from typing import List, Tuple
+
 from dependency_injector import containers, providers
 
 from application.agents.retrieval import RetrievalAgent
@@ -24,18 +26,59 @@ from application.service.tts_service import TTSService
 from application.service.validator import Validator
 from application.users.login import Login
 from application.users.signup import SignUp
+from infra.api.http_client import create_http_client
+from infra.api.rerank_client import RerankClient
+from infra.api.llm_warmup import LlmWarmup
 from infra.api.ml_repository_impl import MLRepositoryImpl
 from infra.api.rerank_repository_impl import RerankRepositoryImpl
 from infra.api.studio_repository_impl import StudioRepositoryImpl
+from infra.cache.mongo_cache_tier import MongoCacheTier
+from infra.cache.shm_cache_tier import ShmCacheTier
 from infra.implement.chat_repository_impl import ChatInfoRepository
 from infra.implement.message_repository_impl import MessageRepository
 from infra.implement.prompt_repository_impl import PromptRepositoryImpl
+from infra.implement.rerank_score_cache_repository_impl import (
+    RerankScoreCacheRepository,
+)
 from infra.implement.user_repository_impl import UserRepositoryImpl
 from infra.service.crypto_service import CryptoService
 from infra.service.token_service import TokenService
+import httpx
+
+from common.cache import AsyncTTLCache, TieredCache
+from common.circuit_breaker import CircuitBreaker
+from common.drain import DrainController
+from common.loop_monitor import LoopMonitor
+from common.profiler import Profiler
+from common.readiness import Readiness
+from common.resilience import LatencyTracker
 from common.system_logger import SystemLogger
+from common.tracing import OtlpFileExporter, Tracer
+from config import get_settings
 from database.mongo import get_async_mongo_client, get_async_mongo_database
+from domain.api.models import AppInfo, SearchResponse
+from domain.chats.models.stream_options import StreamOptions
+from domain.users.models import BaseUser
 from infra.wrapper.haiqv_chat_ollama import HaiqvChatOllama
+from utils.passage_utils import PassageSlicer
+
+settings = get_settings()
+cache_settings = settings.cache
+http_settings = settings.http
+breaker_settings = settings.breaker
+tracing_settings = settings.tracing
+profiler_settings = settings.profiler
+loop_monitor_settings = settings.loop_monitor
+warmup_settings = settings.llm_warmup
+drain_settings = settings.drain
+stream_settings = settings.stream
+breaker_kwargs = dict(
+    window_seconds=breaker_settings.breaker_window_seconds,
+    min_calls=breaker_settings.breaker_min_calls,
+    failure_ratio=breaker_settings.breaker_failure_ratio,
+    slow_call_ratio=breaker_settings.breaker_slow_call_ratio,
+    open_seconds=breaker_settings.breaker_open_seconds,
+)
 
 
 class Container(containers.DeclarativeContainer):
@@ -57,100 +100,313 @@ class Container(containers.DeclarativeContainer):
     # logger
     system_logger = providers.Singleton(SystemLogger, db=motor_db)
 
+    # tracing
+    trace_exporter = (
+        providers.Singleton(
+            OtlpFileExporter,
+            path=tracing_settings.tracing_export_path,
+            service_name=tracing_settings.tracing_service_name,
+        )
+        if tracing_settings.tracing_export_path
+        else providers.Object(None)
+    )
+    tracer = providers.Singleton(
+        Tracer,
+        enabled=tracing_settings.tracing_enabled,
+        max_spans=tracing_settings.tracing_max_spans,
+        exporter=trace_exporter,
+    )
+
+    # profiler
+    profiler = providers.Singleton(
+        Profiler,
+        output_dir=profiler_settings.profiler_output_dir,
+        interval_ms=profiler_settings.profiler_interval_ms,
+        max_seconds=profiler_settings.profiler_max_seconds,
+    )
+
+    # event loop lag
+    loop_monitor = providers.Singleton(
+        LoopMonitor,
+        interval_ms=loop_monitor_settings.loop_monitor_interval_ms,
+        block_threshold_ms=loop_monitor_settings.loop_monitor_block_threshold_ms,
+        capture_stacks=loop_monitor_settings.loop_monitor_capture_stacks,
+    )
+
+    # readiness (기동 작업별 게이트, /ready)
+    readiness = providers.Singleton(Readiness)
+
+    # graceful shutdown (SSE 스트림 드레인)
+    stream_options = providers.Object(
+        StreamOptions(
+            token_window_ms=stream_settings.sse_token_window_ms,
+            token_max_bytes=stream_settings.sse_token_max_bytes,
+            plan_window_ms=stream_settings.sse_plan_window_ms,
+        )
+    )
+    drain = providers.Singleton(
+        DrainController,
+        readiness=readiness,
+        timeout=drain_settings.drain_timeout_seconds,
+        flush_timeout=drain_settings.drain_flush_seconds,
+    )
+
+    # circuit breaker (업스트림별)
+    llm_breaker = providers.Singleton(
+        CircuitBreaker,
+        name="llm",
+        slow_call_seconds=breaker_settings.llm_slow_call_seconds,
+        **breaker_kwargs,
+    )
+    rerank_breaker = providers.Singleton(
+        CircuitBreaker,
+        name="rerank",
+        slow_call_seconds=breaker_settings.rerank_slow_call_seconds,
+        **breaker_kwargs,
+    )
+    ml_breaker = providers.Singleton(
+        CircuitBreaker,
+        name="ml",
+        slow_call_seconds=breaker_settings.ml_slow_call_seconds,
+        **breaker_kwargs,
+    )
+
     # api
-    haiqv_ollama_llm = providers.Singleton(HaiqvChatOllama)
+    haiqv_ollama_llm = providers.Singleton(
+        HaiqvChatOllama,
+        circuit_breaker=llm_breaker,
+    )
+    llm_warmup = providers.Singleton(
+        LlmWarmup,
+        llm=haiqv_ollama_llm,
+        readiness=readiness,
+        models=warmup_settings.llm_warmup_models,
+        keep_alive=warmup_settings.llm_keep_alive,
+        timeout=warmup_settings.llm_warmup_timeout,
+        refresh_seconds=warmup_settings.llm_keep_alive_refresh_seconds,
+        cold_threshold_seconds=warmup_settings.llm_cold_load_threshold_seconds,
+    )
+
+    # http client (업스트림별 공유 커넥션 풀, lifespan 종료 시 정리)
+    studio_http_client = providers.Singleton(
+        create_http_client,
+        base_url=f"http://{settings.studio.studio_host}:{settings.studio.studio_port}",
+        timeout=httpx.Timeout(http_settings.studio_timeout),
+    )
+    rerank_http_client = providers.Singleton(
+        create_http_client,
+        base_url=f"http://{settings.rerank.rerank_host}:{settings.rerank.rerank_port}",
+        timeout=httpx.Timeout(http_settings.rerank_timeout),
+        verify=False,
+    )
+    ml_http_client = providers.Singleton(
+        create_http_client,
+        base_url=settings.ml.ml_url,
+        timeout=httpx.Timeout(
+            http_settings.ml_timeout,
+            connect=http_settings.ml_connect_timeout,
+        ),
+    )
+
+    # cache: 프로세스 LRU + 워커 공유 계층 (SHARED_CACHE_BACKEND=none 이면 프로세스 LRU 만)
+    shared_cache_tier = {
+        "mongo": providers.Singleton(MongoCacheTier, db=motor_db),
+        "shm": providers.Singleton(
+            ShmCacheTier,
+            path=cache_settings.shared_cache_shm_path,
+            poll_interval_ms=cache_settings.shared_cache_poll_interval_ms,
+        ),
+    }.get(cache_settings.shared_cache_backend, providers.Object(None))
+    app_info_cache = providers.Singleton(
+        TieredCache,
+        ttl=cache_settings.app_info_cache_ttl,
+        stale_ttl=cache_settings.app_info_cache_stale_ttl,
+        max_size=cache_settings.app_info_cache_max_size,
+        name="app_info",
+        tier=shared_cache_tier,
+        value_type=AppInfo,
+    )
+    tool_prompt_cache = providers.Singleton(
+        TieredCache,
+        ttl=cache_settings.app_info_cache_ttl,
+        stale_ttl=cache_settings.app_info_cache_stale_ttl,
+        max_size=cache_settings.app_info_cache_max_size,
+        name="tool_prompt",
+        tier=shared_cache_tier,
+        value_type=str,
+    )
+    prompt_cache = providers.Singleton(
+        TieredCache,
+        ttl=cache_settings.prompt_cache_ttl,
+        max_size=cache_settings.prompt_cache_max_size,
+        name="prompt",
+        tier=shared_cache_tier,
+        value_type=str,
+    )
+    user_cache = providers.Singleton(
+        TieredCache,
+        ttl=cache_settings.user_cache_ttl,
+        max_size=cache_settings.user_cache_max_size,
+        name="user",
+        tier=shared_cache_tier,
+        value_type=BaseUser,
+    )
+
+    # latency
+    search_latency_tracker = providers.Singleton(LatencyTracker)
+    search_cache = providers.Singleton(
+        TieredCache,
+        ttl=cache_settings.search_cache_ttl,
+        max_size=cache_settings.search_cache_max_size,
+        name="search",
+        tier=shared_cache_tier,
+        value_type=Tuple[List[SearchResponse], float],
+    )
+
+    # 아래 서비스 / 저장소 / 에이전트 / 유스케이스는 요청 간 상태가 없으므로 Singleton 으로 공유한다.
+    # 요청별 상태가 필요한 경우 인스턴스 속성이 아닌 호출 인자 / contextvar 로 전달할 것
+    # (validate_container 가 Singleton → Factory 의존을 기동 시 거부한다)
 
     # base service
-    token_service = providers.Factory(TokenService)
-    crypto_service = providers.Factory(CryptoService)
+    token_service = providers.Singleton(TokenService)
+    crypto_service = providers.Singleton(CryptoService)
 
     # repository
-    user_repository = providers.Factory(
+    user_repository = providers.Singleton(
         UserRepositoryImpl,
         db=motor_db,
     )
-    chat_info_repository = providers.Factory(
+    chat_info_repository = providers.Singleton(
         ChatInfoRepository,
         db=motor_db,
     )
-    message_repository = providers.Factory(
+    message_repository = providers.Singleton(
         MessageRepository,
         db=motor_db,
     )
-    prompt_repository = providers.Factory(
+    prompt_repository = providers.Singleton(
         PromptRepositoryImpl,
         db=motor_db,
     )
-    studio_repository = providers.Factory(
+    studio_repository = providers.Singleton(
         StudioRepositoryImpl,
         token_service=token_service,
+        client=studio_http_client,
+    )
+    rerank_client = providers.Singleton(
+        RerankClient,
+        client=rerank_http_client,
+        breaker=rerank_breaker,
+    )
+    passage_slicer = providers.Singleton(
+        PassageSlicer,
+        # tokenizer 미설정 시 MAX_LEN 글자 기준으로 분할
+        max_tokens=(
+            settings.rerank.rerank_passage_max_tokens
+            if settings.rerank.rerank_tokenizer
+            else settings.rerank.max_len
+        ),
+        overlap=settings.rerank.rerank_passage_overlap,
+        max_passages=settings.rerank.rerank_max_passages,
+        tokenizer_name=settings.rerank.rerank_tokenizer,
+    )
+    rerank_score_memory_cache = providers.Singleton(
+        AsyncTTLCache,
+        ttl=cache_settings.rerank_score_cache_memory_ttl,
+        max_size=cache_settings.rerank_score_cache_max_size,
+        name="rerank_score",
+    )
+    rerank_score_cache = providers.Singleton(
+        RerankScoreCacheRepository,
+        db=motor_db,
+        memory=rerank_score_memory_cache,
+    )
+    rerank_repository = providers.Singleton(
+        RerankRepositoryImpl,
+        client=rerank_client,
+        slicer=passage_slicer,
+        score_cache=(
+            rerank_score_cache
+            if cache_settings.rerank_score_cache_enabled
+            else providers.Object(None)
+        ),
+    )
+    ml_repository = providers.Singleton(
+        MLRepositoryImpl,
+        client=ml_http_client,
+        breaker=ml_breaker,
     )
-    rerank_repository = providers.Factory(RerankRepositoryImpl)
-    ml_repository = providers.Factory(MLRepositoryImpl)
 
     # agent
-    retrieval_agent = providers.Factory(
+    retrieval_agent = providers.Singleton(
         RetrievalAgent,
         studio_repository=studio_repository,
         rerank_repository=rerank_repository,
         llm=haiqv_ollama_llm,
+        search_latency=search_latency_tracker,
+        search_cache=search_cache,
     )
-    summarization_agent = providers.Factory(
+    summarization_agent = providers.Singleton(
         SummarizationAgent,
         llm=haiqv_ollama_llm,
     )
-    translation_agent = providers.Factory(
+    translation_agent = providers.Singleton(
         TranslationAgent,
         llm=haiqv_ollama_llm,
     )
 
     # service
-    validator = providers.Factory(
+    validator = providers.Singleton(
         Validator,
         user_repository=user_repository,
         chat_info_repository=chat_info_repository,
         prompt_repository=prompt_repository,
+        user_cache=user_cache,
     )
-    chat_service = providers.Factory(
+    chat_service = providers.Singleton(
         ChatService,
         chat_info_repository=chat_info_repository,
         message_repository=message_repository,
     )
-    prompt_service = providers.Factory(
+    prompt_service = providers.Singleton(
         PromptService,
         prompt_repository=prompt_repository,
         studio_repository=studio_repository,
+        app_info_cache=app_info_cache,
+        tool_prompt_cache=tool_prompt_cache,
+        prompt_cache=prompt_cache,
     )
-    handler = providers.Factory(
+    handler = providers.Singleton(
         HandlerService,
         message_repository=message_repository,
     )
-    planner = providers.Factory(
+    planner = providers.Singleton(
         PlannerService,
         prompt_service=prompt_service,
+        llm=haiqv_ollama_llm,
     )
-    executor = providers.Factory(
+    executor = providers.Singleton(
         ExecutorService,
         retrieval_agent=retrieval_agent,
         summarization_agent=summarization_agent,
         translation_agent=translation_agent,
     )
-    generator = providers.Factory(
+    generator = providers.Singleton(
         GeneratorService,
         prompt_service=prompt_service,
         handler=handler,
         llm=haiqv_ollama_llm,
     )
-    title_service = providers.Factory(
+    title_service = providers.Singleton(
         TitleService,
         chat_info_repository=chat_info_repository,
         llm=haiqv_ollama_llm,
     )
-    stt_service = providers.Factory(
+    stt_service = providers.Singleton(
         STTService,
         ml_repository=ml_repository,
     )
-    tts_service = providers.Factory(
+    tts_service = providers.Singleton(
         TTSService,
         llm=haiqv_ollama_llm,
         prompt_service=prompt_service,
@@ -158,12 +414,12 @@ class Container(containers.DeclarativeContainer):
     )
 
     # users
-    signup = providers.Factory(
+    signup = providers.Singleton(
         SignUp,
         user_repository=user_repository,
         crypto_service=crypto_service,
     )
-    login = providers.Factory(
+    login = providers.Singleton(
         Login,
         user_repository=user_repository,
         validator=validator,
@@ -172,28 +428,28 @@ class Container(containers.DeclarativeContainer):
     )
 
     # chat
-    chat_list = providers.Factory(
+    chat_list = providers.Singleton(
         ChatList,
         chat_info_repository=chat_info_repository,
     )
-    create_chat = providers.Factory(
+    create_chat = providers.Singleton(
         CreateChat,
         chat_info_repository=chat_info_repository,
         chat_service=chat_service,
     )
-    delete_chat = providers.Factory(
+    delete_chat = providers.Singleton(
         DeleteChat,
         chat_info_repository=chat_info_repository,
         validator=validator,
     )
 
     # message
-    message_list = providers.Factory(
+    message_list = providers.Singleton(
         MessageList,
         message_repository=message_repository,
         validator=validator,
     )
-    message_generator = providers.Factory(
+    message_generator = providers.Singleton(
         MessageGenerator,
         validator=validator,
         chat_service=chat_service,
@@ -202,8 +458,12 @@ class Container(containers.DeclarativeContainer):
         handler=handler,
         executor=executor,
         generator=generator,
+        llm_breaker=llm_breaker,
+        tracer=tracer,
+        drain=drain,
+        stream_options=stream_options,
     )
-    audio_generator = providers.Factory(
+    audio_generator = providers.Singleton(
         AudioGenerator,
         validator=validator,
         chat_service=chat_service,
@@ -214,19 +474,55 @@ class Container(containers.DeclarativeContainer):
         generator=generator,
         stt_service=stt_service,
         tts_service=tts_service,
+        llm_breaker=llm_breaker,
+        tracer=tracer,
+        drain=drain,
+        stream_options=stream_options,
     )
 
     # prompt
-    create_prompt = providers.Factory(
+    create_prompt = providers.Singleton(
         CreatePrompt,
         prompt_repository=prompt_repository,
+        prompt_cache=prompt_cache,
     )
-    get_prompt = providers.Factory(
+    get_prompt = providers.Singleton(
         GetPrompt,
         validator=validator,
     )
-    update_prompt = providers.Factory(
+    update_prompt = providers.Singleton(
         UpdatePrompt,
         prompt_repository=prompt_repository,
         validator=validator,
+        tool_prompt_cache=tool_prompt_cache,
+        prompt_cache=prompt_cache,
     )
+
+
+def validate_container(container: Container) -> None:
+    """
+    기동 시 의존성 그래프 검증
+    - Singleton 이 Factory 에 의존하면 첫 호출 시 생성된 인스턴스가 모든 요청에 고정되므로 거부
+    - 모든 Singleton 을 미리 생성하여 누락된 설정 / 생성 오류를 첫 요청 전에 드러낸다
+    """
+    errors = []
+    names = {provider: name for name, provider in container.providers.items()}
+    for name, provider in container.providers.items():
+        if not isinstance(provider, providers.Singleton):
+            continue
+        for dependency in provider.related:
+            if isinstance(dependency, providers.Factory):
+                errors.append(
+                    f"{name}: Singleton 이 Factory "
+                    f"{names.get(dependency, dependency)} 에 의존"
+                )
+
+    for name, provider in container.providers.items():
+        if isinstance(provider, providers.Singleton):
+            try:
+                provider()
+            except Exception as e:
+                errors.append(f"{name}: {type(e).__name__}: {e}")
+
+    if errors:
+        raise RuntimeError("의존성 그래프 검증 실패\n" + "\n".join(errors))
@@ -1,4 +1,9 @@
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from database.setup.set_index import rerank_score_cache_indexes, shared_cache_indexes
+from config import get_settings
+
 async def set_all_indexes(db: AsyncIOMotorDatabase):
-    pass
+    await rerank_score_cache_indexes(db)
+    if get_settings().cache.shared_cache_backend == "mongo":
+        await shared_cache_indexes(db)
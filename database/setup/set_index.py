@@ -1,4 +1,7 @@
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import CollectionInvalid, OperationFailure
+
+from config import get_settings
 
 COLLECTION_NAME = "prompt"
 
@@ -9,3 +12,47 @@ async def indexes(db: AsyncIOMotorDatabase):
         unique=True,
         name="name_unique",
     )
+
+
+RERANK_SCORE_CACHE_COLLECTION = "rerank_score_cache"
+
+
+async def rerank_score_cache_indexes(db: AsyncIOMotorDatabase):
+    ttl = get_settings().cache.rerank_score_cache_ttl
+    collection = db[RERANK_SCORE_CACHE_COLLECTION]
+    try:
+        await collection.create_index(
+            [("created_at", 1)],
+            expireAfterSeconds=ttl,
+            name="created_at_ttl",
+        )
+    except OperationFailure:
+        # TTL 설정이 바뀐 경우 기존 인덱스의 만료 시간만 변경
+        await db.command(
+            "collMod",
+            RERANK_SCORE_CACHE_COLLECTION,
+            index={"name": "created_at_ttl", "expireAfterSeconds": ttl},
+        )
+
+
+SHARED_CACHE_COLLECTION = "shared_cache"
+CACHE_INVALIDATION_COLLECTION = "cache_invalidations"
+
+
+async def shared_cache_indexes(db: AsyncIOMotorDatabase):
+    """SHARED_CACHE_BACKEND=mongo: 값 만료 TTL 인덱스 + 무효화 전파용 capped 컬렉션"""
+    await db[SHARED_CACHE_COLLECTION].create_index(
+        [("expires_at", 1)],
+        expireAfterSeconds=0,
+        name="expires_at_ttl",
+    )
+    if CACHE_INVALIDATION_COLLECTION not in await db.list_collection_names():
+        try:
+            await db.create_collection(
+                CACHE_INVALIDATION_COLLECTION,
+                capped=True,
+                size=get_settings().cache.shared_cache_event_log_bytes,
+            )
+        except CollectionInvalid:
+            # 다른 워커가 먼저 생성
+            pass
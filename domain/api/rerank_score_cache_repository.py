@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+
+class IRerankScoreCacheRepository(ABC):
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> Dict[str, float]:
+        """캐시에 있는 key 의 점수만 반환"""
+        pass
+
+    @abstractmethod
+    async def set_many(self, scores: Dict[str, float]) -> None:
+        pass
@@ -12,6 +12,8 @@ class ControlSignal(BaseModel):
             "error_occurred",
             "stt_completed",
             "primary_page",
+            "degraded",
+            "stalled",
         ],
         Field(description="제어 신호"),
     ]
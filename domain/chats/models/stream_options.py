@@ -0,0 +1,39 @@
+from typing import Annotated, Optional
+
+from pydantic import BaseModel, Field
+
+
+class StreamOptions(BaseModel):
+    """
+    SSE 프레임 묶음 설정
+    토큰 / 플랜 갱신을 window 동안 모아 한 프레임으로 보낸다. (0 이면 매번 전송)
+    """
+
+    token_window_ms: Annotated[
+        int, Field(ge=0, le=1000, description="토큰 프레임 최소 간격(ms)")
+    ] = 30
+    token_max_bytes: Annotated[
+        int,
+        Field(
+            ge=0,
+            le=65536,
+            description="모인 토큰이 이 크기(UTF-8 바이트) 이상이면 간격과 무관하게 전송 (0: 제한 없음)",
+        ),
+    ] = 1024
+    plan_window_ms: Annotated[
+        int, Field(ge=0, le=5000, description="플랜 갱신 프레임 최소 간격(ms)")
+    ] = 100
+
+    def merge(self, overrides: Optional["StreamOptionsOverride"]) -> "StreamOptions":
+        """클라이언트가 지정한 값만 덮어쓴 설정"""
+        if overrides is None:
+            return self
+        return self.model_copy(update=overrides.model_dump(exclude_none=True))
+
+
+class StreamOptionsOverride(BaseModel):
+    """요청 본문의 클라이언트별 설정 (지정하지 않은 값은 서버 기본값)"""
+
+    token_window_ms: Annotated[Optional[int], Field(ge=0, le=1000)] = None
+    token_max_bytes: Annotated[Optional[int], Field(ge=0, le=65536)] = None
+    plan_window_ms: Annotated[Optional[int], Field(ge=0, le=5000)] = None
@@ -9,6 +9,7 @@ from domain.api.models import RerankOutput
 from domain.chats.models.identifiers import ChatId
 
 from domain.messages.models.identifiers import MessageId
+from domain.messages.models.trace import TraceTimeline
 from domain.plans.plan import PlanInfo
 
 
@@ -82,6 +83,9 @@ class AIMessage(BaseMessage):
     primary_page_list: Annotated[list[RerankOutput] | None, Field()] = Field(
         default=None, description="메시지의 주요 페이지"
     )
+    trace: Annotated[TraceTimeline | None, Field()] = Field(
+        default=None, description="응답 생성 단계별 소요 시간"
+    )
 
 
 MessageUnion = Union[SystemMessage, HumanMessage, AIMessage]
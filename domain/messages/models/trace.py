@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class SpanRecord(BaseModel):
+    name: str
+    start_ms: float = Field(description="trace 시작 기준 오프셋")
+    duration_ms: float
+    parent: int | None = Field(
+        default=None, description="부모 span 의 인덱스 (0 = root)"
+    )
+    attrs: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class TraceTimeline(BaseModel):
+    trace_id: str
+    started_at: datetime
+    duration_ms: float
+    spans: list[SpanRecord] = Field(default_factory=list)
+    dropped: int | None = None
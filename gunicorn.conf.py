@@ -0,0 +1,44 @@
+"""
+gunicorn 설정 (preload 모드)
+
+마스터 프로세스가 main:app 을 한 번 import 한 뒤 워커를 fork 한다.
+LangChain / transformers 등 무거운 모듈 import 와 설정 파싱을 워커마다 반복하지 않으며,
+로드된 모듈 메모리는 워커 간 copy-on-write 로 공유된다.
+Mongo 클라이언트 / HTTP 커넥션 풀 / 백그라운드 태스크는 fork 이후 각 워커의 lifespan 에서 생성된다.
+
+    gunicorn -c gunicorn.conf.py main:app
+"""
+
+import gc
+import os
+
+from common.metrics import clear_multiprocess_dir, mark_process_dead
+from config import get_settings
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = os.getenv("PRELOAD_APP", "true").lower() == "true"
+loglevel = os.getenv("LOG_LEVEL", "debug")
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))
+# SIGTERM 후 워커를 강제 종료하기까지의 시간: SSE 드레인(DRAIN_TIMEOUT + DRAIN_FLUSH)보다 길어야 한다
+# 앱과 같은 설정(.env / 환경 변수)에서 읽는다
+_drain = get_settings().drain
+graceful_timeout = int(_drain.drain_timeout_seconds + _drain.drain_flush_seconds + 5)
+_metrics_dir = get_settings().metrics.metrics_multiprocess_dir
+
+
+def on_starting(server):
+    # 이전 실행의 워커 스냅샷이 합산되지 않도록 비움
+    clear_multiprocess_dir(_metrics_dir)
+
+
+def child_exit(server, worker):
+    # 종료된 워커의 카운터 / 히스토그램은 dead.json 으로 합치고 pid 파일 삭제 (gauge 는 버림)
+    mark_process_dead(worker.pid, _metrics_dir)
+
+
+def pre_fork(server, worker):
+    # preload 로 생성된 객체를 GC 추적 대상에서 제외하여
+    # 워커의 GC 가 공유 페이지를 건드려 복사가 일어나는 것을 줄인다
+    gc.freeze()
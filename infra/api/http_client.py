@@ -0,0 +1,137 @@
+import importlib.util
+import logging
+import weakref
+from typing import AsyncIterator
+
+import httpx
+
+from config import get_settings
+
+http_settings = get_settings().http
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    if not http_settings.http2_enabled:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning(
+            "HTTP2_ENABLED=true 이지만 h2 패키지가 없어 HTTP/1.1 로 동작합니다."
+        )
+        return False
+    return True
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """응답 본문이 닫힐 때 진행 중 요청 수를 줄인다"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, transport: "CountingTransport"):
+        self._stream = stream
+        self._transport = transport
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._transport.in_flight -= 1
+        await self._stream.aclose()
+
+
+class CountingTransport(httpx.AsyncBaseTransport):
+    """
+    AsyncHTTPTransport 를 감싸 요청 수 / 진행 중 요청(응답 본문을 닫기 전까지) / 오류 / HTTP 버전을 센다.
+    httpx / httpcore 내부 속성에 의존하지 않고 풀 사용량을 보기 위한 것이다.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.errors = 0
+        self.http_versions: dict[str, int] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self.in_flight -= 1
+            self.errors += 1
+            raise
+
+        version = response.extensions.get("http_version", b"HTTP/1.1").decode()
+        self.http_versions[version] = self.http_versions.get(version, 0) + 1
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_TrackedStream(response.stream, self),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# create_http_client 로 만든 client 의 transport (get_pool_stats 용)
+_transports: "weakref.WeakKeyDictionary[httpx.AsyncClient, CountingTransport]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def create_http_client(
+    base_url: str,
+    timeout: httpx.Timeout,
+    verify: bool = True,
+) -> httpx.AsyncClient:
+    """
+    업스트림별 공유 AsyncClient 생성.
+    Container 의 Singleton 으로 등록되며, 종료는 lifespan 에서 aclose 로 처리한다.
+    """
+    transport = CountingTransport(
+        httpx.AsyncHTTPTransport(
+            verify=verify,
+            http2=_http2_available(),
+            limits=httpx.Limits(
+                max_connections=http_settings.http_max_connections,
+                max_keepalive_connections=http_settings.http_max_keepalive_connections,
+                keepalive_expiry=http_settings.http_keepalive_expiry,
+            ),
+        )
+    )
+    client = httpx.AsyncClient(base_url=base_url, timeout=timeout, transport=transport)
+    _transports[client] = transport
+    return client
+
+
+def get_pool_stats(client: httpx.AsyncClient) -> dict:
+    """
+    AsyncClient 의 설정된 풀 한도와 앱에서 센 요청 현황
+    (커넥션 단위 상태는 httpcore 내부에만 있으므로 제공하지 않는다)
+    """
+    stats = {
+        "base_url": str(client.base_url),
+        "closed": client.is_closed,
+        "http2_enabled": _http2_available(),
+        "max_connections": http_settings.http_max_connections,
+        "max_keepalive_connections": http_settings.http_max_keepalive_connections,
+        "keepalive_expiry": http_settings.http_keepalive_expiry,
+    }
+    transport = _transports.get(client)
+    if transport is None:
+        return stats
+    return {
+        **stats,
+        "requests": transport.requests,
+        "in_flight": transport.in_flight,
+        "peak_in_flight": transport.peak_in_flight,
+        "errors": transport.errors,
+        "http_versions": dict(transport.http_versions),
+    }
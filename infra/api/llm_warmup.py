@@ -0,0 +1,124 @@
+"""
+LLM 모델 warmup / keep_alive 관리
+
+- 기동 시 설정된 모델마다 빈 프롬프트로 /api/generate 를 호출하여 모델을 미리 적재한다.
+  (실패하면 timeout 까지 재시도, timeout 이 지나면 포기하고 readiness 게이트를 연다)
+- 이후 refresh_seconds 마다 같은 요청으로 keep_alive 를 갱신하여, 트래픽이 없는 동안
+  모델이 내려가 첫 요청이 콜드 스타트가 되는 것을 막는다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from common.metrics import LLM_MODEL_LOAD, LLM_MODEL_WARM
+from common.readiness import Readiness
+from infra.wrapper.haiqv_chat_ollama import HaiqvChatOllama
+
+logger = logging.getLogger(__name__)
+
+READINESS_GATE = "llm_warmup"
+
+
+class LlmWarmup:
+    def __init__(
+        self,
+        llm: HaiqvChatOllama,
+        readiness: Readiness,
+        models: Optional[List[str]] = None,
+        keep_alive: str = "30m",
+        timeout: float = 120,
+        refresh_seconds: float = 600,
+        cold_threshold_seconds: float = 0.5,
+    ):
+        self._llm = llm
+        self._readiness = readiness
+        # 기본 모델 + 단계별 추가 모델 (중복 제거, 순서 유지)
+        self.models = list(dict.fromkeys([llm.model, *(models or [])]))
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.refresh_seconds = refresh_seconds
+        self.cold_threshold = cold_threshold_seconds
+        self.status: Dict[str, str] = {model: "pending" for model in self.models}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """readiness 게이트를 닫고 warmup → keep_alive 갱신 태스크 시작"""
+        self._readiness.add_gate(READINESS_GATE)
+        self._readiness.update(READINESS_GATE, self.status)
+        self._task = asyncio.create_task(self._run(), name="llm-warmup")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        await self.warmup()
+        if self.refresh_seconds <= 0:
+            return
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            for model in self.models:
+                try:
+                    await self._load(model, trigger="refresh")
+                except Exception as e:
+                    LLM_MODEL_WARM.set(0, model=model)
+                    self.status[model] = "failed"
+                    logger.warning(f"[LlmWarmup] {model} keep_alive 갱신 실패: {e}")
+
+    async def warmup(self) -> None:
+        started = time.monotonic()
+        await asyncio.gather(
+            *(
+                self._warmup_model(model, started + self.timeout)
+                for model in self.models
+            )
+        )
+        self._readiness.open(READINESS_GATE, detail=self.status)
+        logger.info(
+            f"[LlmWarmup] {time.monotonic() - started:.1f}s 소요: {self.status}"
+        )
+
+    async def _warmup_model(self, model: str, deadline: float) -> None:
+        delay = 1.0
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._load(model, trigger="warmup"),
+                    timeout=max(deadline - time.monotonic(), 0.001),
+                )
+                return
+            except Exception as e:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.status[model] = "failed"
+                    logger.warning(f"[LlmWarmup] {model} warmup 포기: {e!r}")
+                    return
+                logger.info(f"[LlmWarmup] {model} warmup 재시도 ({e!r})")
+                await asyncio.sleep(min(delay, remaining))
+                delay = min(delay * 2, 10)
+
+    async def _load(self, model: str, trigger: str) -> None:
+        # 빈 프롬프트는 모델 적재 / keep_alive 갱신만 하고 토큰을 생성하지 않는다
+        response = await self._llm._async_client.generate(
+            model=model, prompt="", keep_alive=self.keep_alive
+        )
+        load_seconds = (response.get("load_duration") or 0) / 1e9
+        if load_seconds >= self.cold_threshold:
+            LLM_MODEL_LOAD.observe(load_seconds, model=model, trigger=trigger)
+        LLM_MODEL_WARM.set(1, model=model)
+        self.status[model] = "warm"
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "models": dict(self.status),
+            "keep_alive": self.keep_alive,
+            "refresh_seconds": self.refresh_seconds,
+        }
@@ -1,43 +1,55 @@
 from typing import AsyncGenerator
 import httpx
+from common.circuit_breaker import CircuitBreaker
+from common.tracing import traced
 from domain.api.ml_repository import IMLRepository
 from config import get_settings
 from domain.api.models import STTResponse
 
-ml_settings = get_settings().ml
+http_settings = get_settings().http
 
 
 class MLRepositoryImpl(IMLRepository):
-    def __init__(self):
-        self.base_url = f"{ml_settings.ml_url}"
+    def __init__(self, client: httpx.AsyncClient, breaker: CircuitBreaker):
+        self.client = client
+        self.breaker = breaker
 
+    @traced("ml.stt")
     async def stt(self, audio_encoding: str) -> str:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/stt",
+        async with self.breaker.guard():
+            response = await self.client.post(
+                "/stt",
                 json={"waveform": audio_encoding},
             )
             response.raise_for_status()
-            json_data = response.json()
-            return STTResponse(**json_data)
+        json_data = response.json()
+        return STTResponse(**json_data)
 
+    @traced("ml.tts")
     async def tts(self, text: str) -> AsyncGenerator[bytes, None]:
-        timeout = httpx.Timeout(connect=10.0, read=None, write=10.0, pool=None)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            async with client.stream(
-                "POST",
-                url=f"{self.base_url}/tts",
-                json={
-                    "text": text,
-                    "voice_name": "af_heart",
-                    "speed": 1,
-                    "numpy": False,
-                    "streaming": True,
-                },
-            ) as response:
-                response.raise_for_status()
+        # 음성 스트림은 길어질 수 있으므로 read 타임아웃 없이 수신
+        timeout = httpx.Timeout(
+            connect=http_settings.ml_connect_timeout,
+            read=None,
+            write=http_settings.ml_connect_timeout,
+            pool=None,
+        )
+        async with self.breaker.guard() as call, self.client.stream(
+            "POST",
+            url="/tts",
+            json={
+                "text": text,
+                "voice_name": "af_heart",
+                "speed": 1,
+                "numpy": False,
+                "streaming": True,
+            },
+            timeout=timeout,
+        ) as response:
+            response.raise_for_status()
 
-                async for chunk in response.aiter_bytes():
-                    if not chunk:  # keep-alive 패킷 방지
-                        continue
-                    yield chunk  # bytes (raw)
+            async for chunk in response.aiter_bytes():
+                if not chunk:  # keep-alive 패킷 방지
+                    continue
+                call.mark()  # 첫 음성 청크까지를 지연으로 기록
+                yield chunk  # bytes (raw)
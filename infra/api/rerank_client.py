@@ -0,0 +1,61 @@
+from typing import List
+
+import httpx
+from fastapi import HTTPException
+
+from common.circuit_breaker import CircuitBreaker
+
+
+class RerankClient:
+    """
+    리랭크 API 클라이언트 (query 하나당 /rerank 한 번, 서킷 브레이커로 보호)
+
+    요청을 모아 보내는 배치 처리는 업스트림에 배치 엔드포인트가 생길 때까지 두지 않는다.
+    (질의 하나씩만 받는 현재 API 에서는 동일 질의만 합칠 수 있어 효과 없이 window 만큼 지연됨)
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        breaker: CircuitBreaker,
+        path: str = "/rerank",
+    ):
+        self.client = client
+        self.breaker = breaker
+        self.path = path
+
+    async def score(self, query: str, passages: List[str]) -> List[float]:
+        """query 에 대한 passages 의 점수 목록 (passages 순서 유지)"""
+        async with self.breaker.guard():
+            try:
+                resp = await self.client.post(
+                    self.path,
+                    json={"query": query, "passage_list": passages},
+                    headers={"accept": "application/json"},
+                )
+            except httpx.RequestError as e:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"ReRank 엔드포인트({self.client.base_url}{self.path}) 요청 실패: {e}",
+                )
+
+            if resp.status_code != 200:
+                raise HTTPException(
+                    status_code=resp.status_code,
+                    detail=f"ReRank 서버 오류: {resp.text}",
+                )
+
+            try:
+                scores: List[float] = resp.json()["scores"]
+            except (KeyError, ValueError) as e:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"ReRank 응답 파싱 실패: {e}, 응답 내용: {resp.text}",
+                )
+
+        if len(scores) != len(passages):
+            raise HTTPException(
+                status_code=500,
+                detail="ReRank 응답 길이가 요청과 일치하지 않습니다.",
+            )
+        return scores
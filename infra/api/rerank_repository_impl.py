@@ -1,83 +1,96 @@
-import httpx
-from typing import Sequence, List
+from typing import List, Optional, Sequence
 from langchain_core.documents.compressor import BaseDocumentCompressor
 from langchain_core.callbacks import Callbacks
-from fastapi import HTTPException
-import numpy as np
+from pydantic import ConfigDict
 
+from common.tracing import traced
 from config import get_settings
 from domain.api.models import RerankSchema, SearchResponse
 from domain.api.rerank_repository import IRerankRepository
+from domain.api.rerank_score_cache_repository import IRerankScoreCacheRepository
+from infra.api.rerank_client import RerankClient
+from utils.passage_utils import PassageSlicer
+from utils.rerank_utils import (
+    aggregate_scores,
+    lexical_vectors,
+    mmr_select,
+    normalize_query,
+    normalize_scores,
+    score_cache_key,
+    top_n_indices,
+)
 
 rerank = get_settings().rerank
-MAX_LEN = rerank.max_len
 
 
-def slice_by_len(text: str, limit: int = MAX_LEN) -> List[str]:
-    """limit 길이 이하로 단순 슬라이스."""
-    return [text[i : i + limit] for i in range(0, len(text), limit)] or [""]
+class RerankRepositoryImpl(IRerankRepository, BaseDocumentCompressor):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    client: RerankClient
+    slicer: PassageSlicer
+    score_cache: Optional[IRerankScoreCacheRepository] = None
 
-class RerankRepositoryImpl(IRerankRepository, BaseDocumentCompressor):
-    endpoint_url: str = f"http://{rerank.rerank_host}:{rerank.rerank_port}/rerank"
+    async def _score(self, query: str, passages: List[str]) -> List[float]:
+        if self.score_cache is None:
+            return await self.client.score(query, passages)
+
+        normalized = normalize_query(query)
+        keys = [score_cache_key(normalized, p) for p in passages]
+        cached = await self.score_cache.get_many(keys)
+
+        # 같은 passage 가 여러 번 나오면 한 번만 요청
+        miss_keys = list(dict.fromkeys(k for k in keys if k not in cached))
+        if miss_keys:
+            passage_by_key = dict(zip(keys, passages))
+            fresh = await self.client.score(
+                query, [passage_by_key[k] for k in miss_keys]
+            )
+            fresh_scores = dict(zip(miss_keys, fresh))
+            await self.score_cache.set_many(fresh_scores)
+            cached.update(fresh_scores)
 
+        return [cached[k] for k in keys]
+
+    @traced("rerank.compress_documents")
     async def compress_documents(
         self,
         rerank_schema: RerankSchema,
         callbacks: Callbacks | None = None,
     ) -> List[SearchResponse]:
-        # 1) passage_list 및 매핑 구성
-        passages: List[str] = []
-        origin_map: List[int] = []
-        for idx, doc in enumerate(rerank_schema.documents):
-            for chunk in slice_by_len(doc.content):
-                passages.append(chunk)
-                origin_map.append(idx)
+        # 1) passage_list 및 매핑 구성 (문장 경계 / 토큰 길이 기준)
+        passages, origin_map = self.slicer.slice_documents(
+            [doc.content for doc in rerank_schema.documents]
+        )
 
-        payload = {
-            "query": rerank_schema.query,
-            "passage_list": passages,
-        }
+        # 2) 리랭크 요청 (캐시 미스만 전송)
+        scores = await self._score(rerank_schema.query, passages)
 
-        # 2) HTTP 요청 (httpx 비동기 사용)
-        try:
-            async with httpx.AsyncClient(timeout=600, verify=False) as client:
-                resp = await client.post(
-                    self.endpoint_url,
-                    json=payload,
-                    headers={"accept": "application/json"},
-                )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"ReRank 엔드포인트({self.endpoint_url}) 요청 실패: {e}",
-            )
+        # 3) 문서별 점수 집계 및 정규화
+        doc_scores = aggregate_scores(
+            scores,
+            origin_map,
+            len(rerank_schema.documents),
+            method=rerank.rerank_aggregation,
+            top_k=rerank.rerank_aggregation_top_k,
+        )
+        doc_scores = normalize_scores(doc_scores, rerank.rerank_score_normalization)
 
-        if resp.status_code != 200:
-            raise HTTPException(
-                status_code=resp.status_code,
-                detail=f"ReRank 서버 오류: {resp.text}",
+        # 4) Top-N 선택 (MMR 사용 시 상위 후보 중 중복이 적은 문서 우선)
+        if rerank.rerank_mmr_enabled:
+            pool = top_n_indices(
+                doc_scores, rerank_schema.top_n * rerank.rerank_mmr_pool_factor
             )
-
-        try:
-            scores: List[float] = resp.json()["scores"]
-        except (KeyError, ValueError) as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"ReRank 응답 파싱 실패: {e}, 응답 내용: {resp.text}",
+            vectors = lexical_vectors(
+                [rerank_schema.documents[i].content for i in pool]
             )
-
-        if len(scores) != len(passages):
-            raise HTTPException(
-                status_code=500,
-                detail="ReRank 응답 길이가 요청과 일치하지 않습니다.",
+            picked = mmr_select(
+                doc_scores[pool],
+                vectors,
+                rerank_schema.top_n,
+                lambda_=rerank.rerank_mmr_lambda,
             )
+            top_n_idx = pool[picked]
+        else:
+            top_n_idx = top_n_indices(doc_scores, rerank_schema.top_n)
 
-        # 3) 문서별 최고 점수 집계
-        doc_scores = np.full(len(rerank_schema.documents), -np.inf)
-        for score, doc_idx in zip(scores, origin_map):
-            doc_scores[doc_idx] = max(doc_scores[doc_idx], score)
-
-        # 4) Top-N 선택
-        top_n_idx = np.argsort(doc_scores)[::-1][: rerank_schema.top_n]
         return [rerank_schema.documents[i] for i in top_n_idx]
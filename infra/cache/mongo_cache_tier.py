@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import re
+from datetime import UTC, datetime
+from typing import Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import CursorType
+
+from common.shared_cache import InvalidationEvent, SharedCacheTier, SharedEntry
+from common.tracing import traced
+
+ENTRY_COLLECTION = "shared_cache"
+EVENT_COLLECTION = "cache_invalidations"
+
+logger = logging.getLogger(__name__)
+
+
+def _doc_id(namespace: str, key: str) -> str:
+    return f"{namespace}:{key}"
+
+
+def _epoch(value: datetime) -> float:
+    # motor 는 기본적으로 naive(UTC) datetime 을 반환
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+class MongoCacheTier(SharedCacheTier):
+    """
+    Mongo 공유 캐시 계층
+    - 값: shared_cache 컬렉션 (_id = "<namespace>:<key>", expires_at TTL 인덱스)
+    - 무효화 전파: capped 컬렉션 cache_invalidations 를 tailable cursor 로 구독
+      (change stream 과 달리 replica set 이 아니어도 동작)
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase, retry_seconds: float = 1.0):
+        super().__init__()
+        self.entries = db[ENTRY_COLLECTION]
+        self.events = db[EVENT_COLLECTION]
+        self.retry_seconds = retry_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        last = await self.events.find_one({}, {"_id": 1}, sort=[("$natural", -1)])
+        self._task = asyncio.create_task(
+            self._listen(last["_id"] if last else None), name="cache-invalidations"
+        )
+
+    async def aclose(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @traced("mongo.shared_cache.get")
+    async def get(self, namespace: str, key: str) -> Optional[SharedEntry]:
+        doc = await self.entries.find_one(
+            {"_id": _doc_id(namespace, key)}, {"value": 1, "expires_at": 1}
+        )
+        if doc is None:
+            return None
+        # TTL 인덱스 삭제는 주기적(60초)이므로 만료 여부는 직접 확인
+        return SharedEntry(bytes(doc["value"]), _epoch(doc["expires_at"]))
+
+    @traced("mongo.shared_cache.set")
+    async def set(
+        self, namespace: str, key: str, value: bytes, expires_at: float
+    ) -> None:
+        await self.entries.update_one(
+            {"_id": _doc_id(namespace, key)},
+            {
+                "$set": {
+                    "namespace": namespace,
+                    "value": value,
+                    "expires_at": datetime.fromtimestamp(expires_at, UTC),
+                }
+            },
+            upsert=True,
+        )
+
+    @traced("mongo.shared_cache.invalidate")
+    async def invalidate(self, event: InvalidationEvent) -> None:
+        if event.keys is not None:
+            query = {"_id": {"$in": [_doc_id(event.namespace, k) for k in event.keys]}}
+        else:
+            # 앞부분이 고정된 정규식은 _id 인덱스 범위 조회로 처리된다
+            prefix = _doc_id(event.namespace, event.prefix or "")
+            query = {"_id": {"$regex": f"^{re.escape(prefix)}"}}
+        await self.entries.delete_many(query)
+        await self.events.insert_one(
+            {**event.to_dict(), "created_at": datetime.now(UTC)}
+        )
+
+    async def _listen(self, last_id: Optional[ObjectId]) -> None:
+        while True:
+            query = {"_id": {"$gt": last_id}} if last_id is not None else {}
+            cursor = self.events.find(query, cursor_type=CursorType.TAILABLE_AWAIT)
+            try:
+                while cursor.alive:
+                    async for doc in cursor:
+                        last_id = doc["_id"]
+                        self.dispatch(
+                            InvalidationEvent(
+                                namespace=doc["namespace"],
+                                keys=doc.get("keys"),
+                                prefix=doc.get("prefix"),
+                                origin=doc.get("origin", ""),
+                            )
+                        )
+            except Exception as e:
+                logger.warning(f"[MongoCacheTier] 무효화 구독 오류: {e}")
+            # 빈 capped 컬렉션 / 연결 오류 시 커서가 닫히므로 잠시 후 다시 연다
+            await asyncio.sleep(self.retry_seconds)
@@ -0,0 +1,183 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from common.shared_cache import InvalidationEvent, SharedCacheTier, SharedEntry
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    namespace TEXT NOT NULL,
+    keys TEXT,
+    prefix TEXT,
+    origin TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+class ShmCacheTier(SharedCacheTier):
+    """
+    같은 호스트 워커 간 공유 캐시 계층
+    tmpfs(/dev/shm) 위의 SQLite(WAL) 파일을 공유 메모리로 사용한다. 프로세스 간 잠금은 SQLite 가 처리하고,
+    무효화 이벤트는 events 테이블에 기록하여 각 워커가 poll_interval 마다 새 seq 를 읽는다.
+    SQLite 호출은 블로킹이므로 스레드에서 수행한다.
+    """
+
+    def __init__(
+        self,
+        path: str = "/dev/shm/chat-cache.sqlite3",
+        poll_interval_ms: float = 200,
+        max_events: int = 10000,
+        vacuum_interval: float = 60,
+    ):
+        super().__init__()
+        self.path = path
+        self.poll_interval = poll_interval_ms / 1000
+        self.max_events = max_events
+        self.vacuum_interval = vacuum_interval
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, timeout=5, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")  # tmpfs: 내구성 불필요
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    async def start(self) -> None:
+        rows = await asyncio.to_thread(
+            self._execute, "SELECT COALESCE(MAX(seq), 0) FROM events"
+        )
+        self._task = asyncio.create_task(
+            self._poll(rows[0][0]), name="cache-invalidations"
+        )
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def get(self, namespace: str, key: str) -> Optional[SharedEntry]:
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        )
+        return SharedEntry(rows[0][0], rows[0][1]) if rows else None
+
+    async def set(
+        self, namespace: str, key: str, value: bytes, expires_at: float
+    ) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR REPLACE INTO entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (namespace, key, value, expires_at),
+        )
+
+    async def invalidate(self, event: InvalidationEvent) -> None:
+        await asyncio.to_thread(self._invalidate, event)
+
+    def _invalidate(self, event: InvalidationEvent) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                if event.keys is not None:
+                    conn.executemany(
+                        "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                        [(event.namespace, key) for key in event.keys],
+                    )
+                elif event.prefix:
+                    # key >= prefix AND key < prefix + U+FFFF: 기본 키 범위 조회
+                    conn.execute(
+                        "DELETE FROM entries WHERE namespace = ? AND key >= ? AND key < ?",
+                        (event.namespace, event.prefix, event.prefix + "\uffff"),
+                    )
+                else:
+                    conn.execute(
+                        "DELETE FROM entries WHERE namespace = ?", (event.namespace,)
+                    )
+                conn.execute(
+                    "INSERT INTO events (namespace, keys, prefix, origin, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        event.namespace,
+                        json.dumps(event.keys) if event.keys is not None else None,
+                        event.prefix,
+                        event.origin,
+                        time.time(),
+                    ),
+                )
+
+    def _read_events(self, after: int) -> List[Tuple]:
+        return self._execute(
+            "SELECT seq, namespace, keys, prefix, origin FROM events WHERE seq > ? ORDER BY seq",
+            (after,),
+        )
+
+    def _vacuum(self) -> None:
+        """만료된 값과 오래된 이벤트 정리 (여러 워커가 수행해도 무방)"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM entries WHERE expires_at < ?", (time.time(),))
+            conn.execute(
+                "DELETE FROM events WHERE seq <= (SELECT MAX(seq) FROM events) - ?",
+                (self.max_events,),
+            )
+
+    async def _poll(self, last_seq: int) -> None:
+        next_vacuum = time.monotonic() + self.vacuum_interval
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                rows = await asyncio.to_thread(self._read_events, last_seq)
+                for seq, namespace, keys, prefix, origin in rows:
+                    last_seq = seq
+                    self.dispatch(
+                        InvalidationEvent(
+                            namespace=namespace,
+                            keys=json.loads(keys) if keys is not None else None,
+                            prefix=prefix,
+                            origin=origin,
+                        )
+                    )
+                if time.monotonic() >= next_vacuum:
+                    next_vacuum = time.monotonic() + self.vacuum_interval
+                    await asyncio.to_thread(self._vacuum)
+            except sqlite3.Error as e:
+                logger.warning(f"[ShmCacheTier] 무효화 이벤트 조회 실패: {e}")
+
+    def stats(self) -> dict:
+        return {**super().stats(), "path": self.path}
@@ -6,6 +6,7 @@ from domain.chats.models.chat_info import ChatInfo
 from domain.chats.models.identifiers import ChatId
 from domain.chats.repository.repository import IChatInfoRepository
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from common.tracing import traced
 
 
 COLLECTION_NAME = "chat_info"
@@ -35,16 +36,19 @@ class ChatInfoRepository(IChatInfoRepository):
             query["is_hidden"] = False
         return query
 
+    @traced("mongo.chat.find_by_id")
     async def find_by_id(self, chat_id: ChatId) -> ChatInfo | None:
         doc = await self.collection.find_one({"_id": ObjectId(chat_id)})
         return self.deserialize(doc) if doc else None
 
+    @traced("mongo.chat.is_chat_owner")
     async def is_chat_owner(self, chat_id: ChatId, owner_id: str) -> bool:
         count = await self.collection.count_documents(
             {"owner_id": owner_id, "_id": ObjectId(chat_id)}
         )
         return count > 0
 
+    @traced("mongo.chat.find_last_by_owner_id")
     async def find_last_by_owner_id(
         self,
         owner_id: str,
@@ -54,6 +58,7 @@ class ChatInfoRepository(IChatInfoRepository):
         doc = await self.collection.find_one(query, sort=[("_id", -1)])
         return self.deserialize(doc) if doc else None
 
+    @traced("mongo.chat.list_all_by_owner_id")
     async def list_all_by_owner_id(
         self,
         owner_id: str,
@@ -63,6 +68,7 @@ class ChatInfoRepository(IChatInfoRepository):
         cursor = self.collection.find(query).sort([("_id", -1)])
         return [self.deserialize(doc) async for doc in cursor]
 
+    @traced("mongo.chat.count_by_owner_id")
     async def count_by_owner_id(
         self,
         owner_id: str,
@@ -71,6 +77,7 @@ class ChatInfoRepository(IChatInfoRepository):
         query = self.make_find_query(owner_id, include_hidden)
         return await self.collection.count_documents(query)
 
+    @traced("mongo.chat.list_sliced")
     async def list_sliced(
         self,
         owner_id: str,
@@ -113,6 +120,7 @@ class ChatInfoRepository(IChatInfoRepository):
             next_start_offset if next_start_offset > 0 else None
         )
 
+    @traced("mongo.chat.save")
     async def save(self, chat_info: ChatInfo) -> ChatId:
         if chat_info.id:
             await self.collection.update_one(
@@ -125,6 +133,7 @@ class ChatInfoRepository(IChatInfoRepository):
             result = await self.collection.insert_one(self.serialize(chat_info))
             return ChatId(result.inserted_id)
 
+    @traced("mongo.chat.soft_delete")
     async def soft_delete(self, chat_id: ChatId) -> bool:
         try:
             chat_info = await self.find_by_id(chat_id)
@@ -135,6 +144,7 @@ class ChatInfoRepository(IChatInfoRepository):
         except Exception:
             return False
 
+    @traced("mongo.chat.update")
     async def update(self, chat_id: ChatId, primary_page: int) -> bool:
         try:
             result = await self.collection.update_one(
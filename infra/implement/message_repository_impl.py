@@ -5,6 +5,7 @@ from domain.messages.models.identifiers import MessageId
 from domain.messages.models.message import BaseMessage, MessageAdapter
 from domain.messages.repository.repository import IMessageRepository
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from common.tracing import traced
 
 
 COLLECTION_NAME = "message"
@@ -29,6 +30,7 @@ class MessageRepository(IMessageRepository):
             | {"_id": str(document["_id"]), "chat_id": str(document["chat_id"])}
         )
 
+    @traced("mongo.message.list_all_by_chat_id")
     async def list_all_by_chat_id(self, chat_id: ChatId) -> list[BaseMessage]:
         cursor = self.collection.find({"chat_id": ObjectId(chat_id)}).sort("_id", 1)
         messages = []
@@ -36,9 +38,11 @@ class MessageRepository(IMessageRepository):
             messages.append(self.deserialize(doc))
         return messages
 
+    @traced("mongo.message.count_by_chat_id")
     async def count_by_chat_id(self, chat_id: ChatId) -> int:
         return await self.collection.count_documents({"chat_id": ObjectId(chat_id)})
 
+    @traced("mongo.message.list_sliced")
     async def list_sliced(
         self, chat_id: ChatId, max_count: int, start_offset: int | None = None
     ) -> tuple[list[BaseMessage], int | None]:
@@ -73,6 +77,7 @@ class MessageRepository(IMessageRepository):
 
         return sliced_message_list, next_start_offset if next_start_offset > 0 else None
 
+    @traced("mongo.message.insert")
     async def insert(self, message: BaseMessage) -> MessageId:
         assert message.id is None, ValueError(
             "이미 ID가 부여된 메시지입니다. Message 를 중복으로 추가하려고 하는 것은 아닌지 점검하세요."
@@ -80,6 +85,7 @@ class MessageRepository(IMessageRepository):
         result = await self.collection.insert_one(self.serialize(message))
         return MessageId(result.inserted_id)
 
+    @traced("mongo.message.update")
     async def update(self, message: BaseMessage) -> bool:
         assert message.id, ValueError(
             "ID가 부여되지 않은 메시지입니다. Message 객체의 id를 확인해주세요. id는 add_message 를 호출 시 부여됩니다."
@@ -2,6 +2,7 @@ from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from domain.prompts.models import Prompt
 from domain.prompts.repository import IPromptRepository
+from common.tracing import traced
 
 
 COLLECTION_NAME = "prompt"
@@ -11,6 +12,7 @@ class PromptRepositoryImpl(IPromptRepository):
     def __init__(self, db: AsyncIOMotorDatabase):
         self.collection = db[COLLECTION_NAME]
 
+    @traced("mongo.prompt.create")
     async def create(
         self,
         prompt: Prompt,
@@ -20,6 +22,7 @@ class PromptRepositoryImpl(IPromptRepository):
         )
         return res.inserted_id
 
+    @traced("mongo.prompt.get")
     async def get(
         self,
         prompt_id: ObjectId,
@@ -27,6 +30,7 @@ class PromptRepositoryImpl(IPromptRepository):
         d = await self.collection.find_one({"_id": prompt_id})
         return Prompt.model_validate(d) if d else None
 
+    @traced("mongo.prompt.get_by_name")
     async def get_by_name(
         self,
         name: str,
@@ -34,6 +38,7 @@ class PromptRepositoryImpl(IPromptRepository):
         d = await self.collection.find_one({"name": name})
         return Prompt.model_validate(d) if d else None
 
+    @traced("mongo.prompt.update")
     async def update(
         self,
         prompt_id: ObjectId,
@@ -47,6 +52,7 @@ class PromptRepositoryImpl(IPromptRepository):
             ),
         )
 
+    @traced("mongo.prompt.delete")
     async def delete(
         self,
         prompt_id: ObjectId,
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+from datetime import UTC, datetime
+from typing import Dict, List, Set
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from common.cache import AsyncTTLCache
+from common.metrics import CACHE_LOOKUPS
+from common.tracing import traced
+from domain.api.rerank_score_cache_repository import IRerankScoreCacheRepository
+
+COLLECTION_NAME = "rerank_score_cache"
+
+logger = logging.getLogger(__name__)
+
+
+class RerankScoreCacheRepository(IRerankScoreCacheRepository):
+    """
+    (질의, passage) 리랭크 점수 캐시
+    프로세스 메모리 LRU 를 먼저 조회하고, 없으면 Mongo(TTL 인덱스) 를 조회한다.
+    Mongo 오류는 캐시 미스로 처리하여 리랭크 흐름을 막지 않는다.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase, memory: AsyncTTLCache[str, float]):
+        self.collection = db[COLLECTION_NAME]
+        self.memory = memory
+        self._writes: Set[asyncio.Task] = set()
+
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    @traced("rerank_score_cache.get_many")
+    async def get_many(self, keys: List[str]) -> Dict[str, float]:
+        found: Dict[str, float] = {}
+        missing: List[str] = []
+        keys = list(dict.fromkeys(keys))
+        for key in keys:
+            score = self.memory.get(key)
+            if score is None:
+                missing.append(key)
+            else:
+                found[key] = score
+
+        self.memory_hits += len(found)
+        CACHE_LOOKUPS.inc(len(found), cache="rerank_score", tier="local", result="hit")
+        if not missing:
+            return found
+        CACHE_LOOKUPS.inc(
+            len(missing), cache="rerank_score", tier="local", result="miss"
+        )
+
+        try:
+            async for doc in self.collection.find(
+                {"_id": {"$in": missing}}, {"score": 1}
+            ):
+                found[doc["_id"]] = doc["score"]
+                self.memory.set(doc["_id"], doc["score"])
+        except Exception as e:
+            logger.warning(f"[RerankScoreCache] Mongo 조회 실패: {e}")
+
+        store_hits = len(found) - (len(keys) - len(missing))
+        self.store_hits += store_hits
+        self.misses += len(keys) - len(found)
+        CACHE_LOOKUPS.inc(store_hits, cache="rerank_score", tier="shared", result="hit")
+        CACHE_LOOKUPS.inc(
+            len(missing) - store_hits,
+            cache="rerank_score",
+            tier="shared",
+            result="miss",
+        )
+        return found
+
+    def stats(self) -> dict:
+        return {
+            "memory_size": len(self.memory),
+            "memory_hits": self.memory_hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "pending_writes": len(self._writes),
+        }
+
+    async def set_many(self, scores: Dict[str, float]) -> None:
+        if not scores:
+            return
+        for key, score in scores.items():
+            self.memory.set(key, score)
+
+        # Mongo 저장은 응답 지연에 포함하지 않음
+        task = asyncio.create_task(self._persist(scores))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _persist(self, scores: Dict[str, float]) -> None:
+        now = datetime.now(UTC)
+        try:
+            await self.collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": key},
+                        {"$set": {"score": score, "created_at": now}},
+                        upsert=True,
+                    )
+                    for key, score in scores.items()
+                ],
+                ordered=False,
+            )
+        except Exception as e:
+            logger.warning(f"[RerankScoreCache] Mongo 저장 실패: {e}")
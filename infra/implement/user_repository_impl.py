@@ -2,6 +2,7 @@ from bson import ObjectId
 from domain.users.models import UserCreate, User
 from domain.users.repository import IUserRepository
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from common.tracing import traced
 
 
 COLLECTION_NAME = "user"
@@ -12,11 +13,13 @@ class UserRepositoryImpl(IUserRepository):
     def __init__(self, db: AsyncIOMotorDatabase):
         self.collection = db[COLLECTION_NAME]
 
+    @traced("mongo.user.get_by_user_id")
     async def get_by_user_id(self, user_id: str) -> User | None:
 
         d = await self.collection.find_one({"user_id": user_id})
         return User.model_validate(d) if d else None
 
+    @traced("mongo.user.save")
     async def save(self, user: UserCreate) -> None:
         await self.collection.insert_one(
             user.model_dump(by_alias=True, exclude={"id"}),
@@ -1,3 +1,5 @@
+import asyncio
+
 from passlib.context import CryptContext
 
 
@@ -13,3 +15,10 @@ class CryptoService:
 
     def verify(self, secret, hashed_secret):
         return self.pwd_context.verify(secret, hashed_secret)
+
+    # bcrypt 는 의도적으로 느린 연산이므로 이벤트 루프 밖에서 수행
+    async def aencrypt(self, secret):
+        return await asyncio.to_thread(self.encrypt, secret)
+
+    async def averify(self, secret, hashed_secret):
+        return await asyncio.to_thread(self.verify, secret, hashed_secret)
@@ -1,11 +1,23 @@
-from typing import Any
+import time
+from typing import Any, AsyncIterator, Iterator, Mapping, Optional, Union
+from langchain_core.messages import BaseMessage
 from langchain_ollama import ChatOllama
+from pydantic import Field
+from common.circuit_breaker import CircuitBreaker
+from common.metrics import (
+    LLM_MODEL_LOAD,
+    LLM_TOKENS,
+    LLM_TOKENS_PER_SECOND,
+    LLM_TTFT,
+)
+from common.tracing import start_span
 from config import get_settings
 
 __all__ = ["HaiqvChatOllama"]
 
 
 haiqv_setting = get_settings().haiqv
+warmup_setting = get_settings().llm_warmup
 
 
 class HaiqvChatOllama(ChatOllama):
@@ -21,11 +33,16 @@ class HaiqvChatOllama(ChatOllama):
     # Change only the default – users can still override it
     base_url: str = haiqv_setting.haiqv_url
     model: str = haiqv_setting.haiqv_model
+    # 요청마다 keep_alive 를 보내 모델이 내려가지 않게 한다 (LlmWarmup 이 유휴 시간에도 갱신)
+    keep_alive: Optional[Union[int, str]] = warmup_setting.llm_keep_alive
 
     # Optionally provide a friendlier alias so users don’t have to
     #      remember the long URL every time
     _HAIQV_BASE_URL: str = base_url  # for backwards-compat docs/examples
 
+    # Optional upstream circuit breaker – every chat call is recorded on it
+    circuit_breaker: Optional[CircuitBreaker] = Field(default=None, exclude=True)
+
     # No __init__ override – let Pydantic handle construction
 
     # If you really want custom logic (e.g., inject client_kwargs)
@@ -40,3 +57,113 @@ class HaiqvChatOllama(ChatOllama):
 
         # Call parent post-init to build HTTP clients
         super().model_post_init(__context)
+
+    # ainvoke / astream / invoke / stream all funnel through these two methods
+    async def _acreate_chat_stream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Union[Mapping[str, Any], str]]:
+        started = time.perf_counter()
+        first_chunk: Optional[float] = None
+        chunks = 0
+        load_duration = 0
+        # 소비자가 청크 사이에 연 span 이 llm 하위로 기록되지 않도록 현재 span 으로 지정하지 않음
+        llm_span = start_span("llm", model=self.model)
+        try:
+            async for part in self._aguarded_chat_stream(messages, stop, **kwargs):
+                if first_chunk is None:
+                    first_chunk = time.perf_counter()
+                    if llm_span is not None:
+                        llm_span.mark("first_chunk")
+                chunks += 1
+                load_duration = _load_duration(part) or load_duration
+                yield part
+        except BaseException as e:
+            if llm_span is not None:
+                llm_span.finish(e)
+            raise
+        finally:
+            if llm_span is not None:
+                llm_span.finish()
+            self._observe_stream(started, first_chunk, chunks, load_duration)
+
+    async def _aguarded_chat_stream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Union[Mapping[str, Any], str]]:
+        if self.circuit_breaker is None:
+            async for part in super()._acreate_chat_stream(messages, stop, **kwargs):
+                yield part
+            return
+
+        async with self.circuit_breaker.guard() as call:
+            async for part in super()._acreate_chat_stream(messages, stop, **kwargs):
+                call.mark()  # latency = time to first chunk
+                yield part
+
+    def _create_chat_stream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        **kwargs: Any,
+    ) -> Iterator[Union[Mapping[str, Any], str]]:
+        started = time.perf_counter()
+        first_chunk: Optional[float] = None
+        chunks = 0
+        load_duration = 0
+        try:
+            for part in self._guarded_chat_stream(messages, stop, **kwargs):
+                if first_chunk is None:
+                    first_chunk = time.perf_counter()
+                chunks += 1
+                load_duration = _load_duration(part) or load_duration
+                yield part
+        finally:
+            self._observe_stream(started, first_chunk, chunks, load_duration)
+
+    def _guarded_chat_stream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        **kwargs: Any,
+    ) -> Iterator[Union[Mapping[str, Any], str]]:
+        if self.circuit_breaker is None:
+            yield from super()._create_chat_stream(messages, stop, **kwargs)
+            return
+
+        with self.circuit_breaker.guard_sync() as call:
+            for part in super()._create_chat_stream(messages, stop, **kwargs):
+                call.mark()
+                yield part
+
+    def _observe_stream(
+        self,
+        started: float,
+        first_chunk: Optional[float],
+        chunks: int,
+        load_duration: int = 0,
+    ) -> None:
+        if first_chunk is None:
+            return
+        # load_duration(ns) 은 마지막 청크에만 온다: 임계값 이상이면 모델 적재를 기다린 요청
+        load_seconds = load_duration / 1e9
+        cold = load_seconds >= warmup_setting.llm_cold_load_threshold_seconds
+        LLM_TTFT.observe(
+            first_chunk - started, model=self.model, load="cold" if cold else "warm"
+        )
+        if cold:
+            LLM_MODEL_LOAD.observe(load_seconds, model=self.model, trigger="request")
+        LLM_TOKENS.inc(chunks, model=self.model)
+        streamed = time.perf_counter() - first_chunk
+        if chunks > 1 and streamed > 0:
+            LLM_TOKENS_PER_SECOND.observe((chunks - 1) / streamed, model=self.model)
+
+
+def _load_duration(part: Union[Mapping[str, Any], str]) -> int:
+    if isinstance(part, str):
+        return 0
+    return part.get("load_duration") or 0
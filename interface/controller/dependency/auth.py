@@ -1,12 +1,15 @@
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends
+from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from application.service.validator import Validator
 from domain.users.models import BaseUser
 from infra.service.token_service import TokenService
+from config import get_settings
 from containers import Container
 
+admin_settings = get_settings().admin
+
 
 security = HTTPBearer()
 
@@ -22,13 +25,25 @@ async def get_current_user(
     """
     decoded = token_service.validate_token(cred.credentials)
 
-    _user = await validator.user_validator(decoded.get("user_id"))
+    user = await validator.current_user(decoded.get("user_id"))
+
+    from middleware.request_context import set_request_user
 
-    user = BaseUser.model_validate(_user)
+    set_request_user(user)
+
+    return user
 
-    from middleware.request_context import get_request
 
-    request = get_request()
-    request.state.user = user
+async def get_admin_user(
+    user: BaseUser = Depends(get_current_user),
+) -> BaseUser:
+    """
+    - ADMIN_USER_IDS 에 등록된 유저만 허용
+    """
+    if user.user_id not in admin_settings.admin_user_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="권한이 없습니다.",
+        )
 
     return user
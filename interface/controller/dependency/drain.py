@@ -0,0 +1,25 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, HTTPException, status
+
+from common.drain import DrainController
+from config import get_settings
+from containers import Container
+
+drain_settings = get_settings().drain
+
+
+@inject
+async def reject_when_draining(
+    drain: DrainController = Depends(Provide[Container.drain]),
+) -> DrainController:
+    """
+    - 종료 드레인 중에는 새 스트림을 받지 않음 (다른 워커로 재시도)
+    """
+    if drain.draining:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="서버가 종료 중입니다.",
+            headers={"Retry-After": str(drain_settings.drain_retry_after_seconds)},
+        )
+
+    return drain
@@ -0,0 +1,151 @@
+import os
+import re
+from typing import Optional
+
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse, JSONResponse
+from dependency_injector.wiring import Provide, inject
+
+from common.cache import TieredCache
+from common.circuit_breaker import CircuitBreaker
+from common.log_wrapper import log_request
+from common.profiler import Profiler, ProfilerBusyError
+from common.shared_cache import SharedCacheTier
+from config import get_settings
+from containers import Container
+from domain.users.models import BaseUser
+from infra.api.http_client import get_pool_stats
+from interface.controller.dependency.auth import get_admin_user
+
+router = APIRouter(prefix="/admin")
+
+profiler_settings = get_settings().profiler
+
+PROFILE_ID_PATTERN = re.compile(r"^[0-9A-Za-z-]+$")
+
+
+@router.get("/http-pools")
+@log_request()
+@inject
+async def get_http_pool_stats(
+    user: BaseUser = Depends(get_admin_user),
+    studio_client: httpx.AsyncClient = Depends(Provide[Container.studio_http_client]),
+    rerank_client: httpx.AsyncClient = Depends(Provide[Container.rerank_http_client]),
+    ml_client: httpx.AsyncClient = Depends(Provide[Container.ml_http_client]),
+):
+    """
+    업스트림별 공유 HTTP 커넥션 풀 상태 조회
+    """
+    return {
+        "studio": get_pool_stats(studio_client),
+        "rerank": get_pool_stats(rerank_client),
+        "ml": get_pool_stats(ml_client),
+    }
+
+
+@router.get("/breakers")
+@log_request()
+@inject
+async def get_breaker_stats(
+    user: BaseUser = Depends(get_admin_user),
+    llm_breaker: CircuitBreaker = Depends(Provide[Container.llm_breaker]),
+    rerank_breaker: CircuitBreaker = Depends(Provide[Container.rerank_breaker]),
+    ml_breaker: CircuitBreaker = Depends(Provide[Container.ml_breaker]),
+):
+    """
+    업스트림별 서킷 브레이커 상태 조회
+    """
+    return [breaker.stats() for breaker in (llm_breaker, rerank_breaker, ml_breaker)]
+
+
+@router.get("/caches")
+@log_request()
+@inject
+async def get_cache_stats(
+    user: BaseUser = Depends(get_admin_user),
+    app_info_cache: TieredCache = Depends(Provide[Container.app_info_cache]),
+    tool_prompt_cache: TieredCache = Depends(Provide[Container.tool_prompt_cache]),
+    prompt_cache: TieredCache = Depends(Provide[Container.prompt_cache]),
+    user_cache: TieredCache = Depends(Provide[Container.user_cache]),
+    search_cache: TieredCache = Depends(Provide[Container.search_cache]),
+    shared_cache_tier: Optional[SharedCacheTier] = Depends(
+        Provide[Container.shared_cache_tier]
+    ),
+):
+    """
+    이 워커의 캐시별 hit ratio / 공유 계층 상태 조회
+    """
+    caches = (app_info_cache, tool_prompt_cache, prompt_cache, user_cache, search_cache)
+    return {
+        "caches": [cache.stats() for cache in caches],
+        "shared": shared_cache_tier.stats() if shared_cache_tier else None,
+    }
+
+
+@router.delete("/search-cache/{app_id}")
+@log_request()
+@inject
+async def invalidate_search_cache(
+    app_id: str,
+    user: BaseUser = Depends(get_admin_user),
+    search_cache: TieredCache = Depends(Provide[Container.search_cache]),
+):
+    """
+    앱의 문서가 바뀐 경우 해당 앱의 유사도 검색 캐시 삭제 (모든 워커 / 공유 계층)
+    """
+    invalidated = search_cache.invalidate_prefix((app_id.upper(),))
+    return {"app_id": app_id, "invalidated": invalidated}
+
+
+@router.post("/profile")
+@log_request()
+@inject
+async def capture_profile(
+    seconds: float = Query(default=10, gt=0),
+    interval_ms: float = Query(default=5, ge=1, le=100),
+    user: BaseUser = Depends(get_admin_user),
+    profiler: Profiler = Depends(Provide[Container.profiler]),
+):
+    """
+    요청을 받은 워커의 모든 스레드를 seconds 동안 샘플링하여 speedscope 파일로 반환
+    (최대 PROFILER_MAX_SECONDS, 워커당 동시에 하나)
+    """
+    if not profiler_settings.profiler_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로파일러가 비활성화되어 있습니다.",
+        )
+    try:
+        profile = await profiler.sample(seconds, interval_ms)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    profile_id = profiler.new_profile_id()
+    return JSONResponse(
+        profile,
+        headers={
+            "Content-Disposition": f'attachment; filename="{profile_id}.speedscope.json"'
+        },
+    )
+
+
+@router.get("/profiles/{profile_id}")
+@log_request()
+@inject
+async def get_profile(
+    profile_id: str,
+    user: BaseUser = Depends(get_admin_user),
+    profiler: Profiler = Depends(Provide[Container.profiler]),
+):
+    """
+    X-Profile 헤더 / SIGUSR2 로 저장된 프로파일 조회
+    """
+    path = profiler.path(profile_id)
+    if not PROFILE_ID_PATTERN.match(profile_id) or not os.path.exists(path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="프로파일이 없습니다."
+        )
+    return FileResponse(
+        path, media_type="application/json", filename=os.path.basename(path)
+    )
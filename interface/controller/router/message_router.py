@@ -6,12 +6,14 @@ from application.messages.audio_generator import AudioGenerator
 from application.messages.message_generator import MessageGenerator
 from application.messages.message_list import MessageList
 from application.service.stt_service import STTService
+from common.drain import DrainController
 from common.log_wrapper import log_request
 from containers import Container
 from domain.chats.models.control import ControlSignal
 from domain.chats.models.identifiers import ChatId
 from domain.users.models import BaseUser
 from interface.controller.dependency.auth import get_current_user
+from interface.controller.dependency.drain import reject_when_draining
 from interface.dto.message_dto import (
     AudioRequestBody,
     MessageListResponse,
@@ -24,6 +26,9 @@ from interface.mapper.message_mapper import MessageMapper
 
 router = APIRouter(prefix="/v2")
 
+# 드레인 timeout 으로 중단된 스트림의 마지막 프레임 (메시지는 stalled 로 저장됨)
+STALLED_FRAME = f"data:{ControlSignal(control_signal='stalled', detail='shutdown').model_dump_json()}\n\n"
+
 
 @router.get("/chats/{chat_id}/messages")
 @log_request()
@@ -73,6 +78,7 @@ async def handle_message_request(
     request: MessagesRequestBody,
     user: BaseUser = Depends(get_current_user),
     message_generator: MessageGenerator = Depends(Provide[Container.message_generator]),
+    drain: DrainController = Depends(reject_when_draining),
     app_id: Optional[str] = "ford",
 ):
     """
@@ -81,11 +87,15 @@ async def handle_message_request(
 
     async def sse():
         try:
-            async for chunk in message_generator(
-                chat_id=chat_id,
-                user_id=user.user_id,
-                user_query=request.user_query,
-                app_id=app_id,
+            async for chunk in drain.guard(
+                message_generator(
+                    chat_id=chat_id,
+                    user_id=user.user_id,
+                    user_query=request.user_query,
+                    app_id=app_id,
+                    stream_options=request.stream,
+                ),
+                stalled_frame=STALLED_FRAME,
             ):
                 yield chunk
         except Exception as e:
@@ -105,6 +115,7 @@ async def handle_audio_request(
     request: AudioRequestBody,
     user: BaseUser = Depends(get_current_user),
     audio_generator: AudioGenerator = Depends(Provide[Container.audio_generator]),
+    drain: DrainController = Depends(reject_when_draining),
     app_id: Optional[str] = "ford",
 ):
     """
@@ -114,12 +125,16 @@ async def handle_audio_request(
 
     async def sse_audio():
         try:
-            async for chunk in audio_generator(
-                chat_id=chat_id,
-                user_id=user.user_id,
-                user_query=request.user_query,
-                audio_path=request.audio_path,
-                app_id=app_id,
+            async for chunk in drain.guard(
+                audio_generator(
+                    chat_id=chat_id,
+                    user_id=user.user_id,
+                    user_query=request.user_query,
+                    audio_path=request.audio_path,
+                    app_id=app_id,
+                    stream_options=request.stream,
+                ),
+                stalled_frame=STALLED_FRAME,
             ):
                 yield chunk
         except Exception as e:
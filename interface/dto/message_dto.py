@@ -6,17 +6,24 @@ from fastapi import Query
 
 
 from domain.api.models import RerankOutput
+from domain.chats.models.stream_options import StreamOptionsOverride
 from domain.messages.models.identifiers import MessageId
 from domain.plans.plan import PlanInfo
 
 
 class MessagesRequestBody(BaseModel):
     user_query: Annotated[str, Query(max_length=10240)]
+    stream: Optional[StreamOptionsOverride] = Field(
+        default=None, description="SSE 프레임 묶음 설정 (생략 시 서버 기본값)"
+    )
 
 
 class AudioRequestBody(BaseModel):
     user_query: Optional[str] = Field(default=None, description="사용자 질의")
     audio_path: Optional[str] = Field(default=None, description="오디오 경로")
+    stream: Optional[StreamOptionsOverride] = Field(
+        default=None, description="SSE 프레임 묶음 설정 (생략 시 서버 기본값)"
+    )
 
     @model_validator(mode="after")
     def validate_either_field_present(cls, values):
@@ -1,4 +1,7 @@
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+import signal
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import APIRouter, FastAPI, Request
 from fastapi.exceptions import RequestValidationError
@@ -7,14 +10,18 @@ from fastapi.openapi.docs import (
     get_swagger_ui_html,
     get_swagger_ui_oauth2_redirect_html,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.cors import CORSMiddleware
-from starlette_context.middleware import RawContextMiddleware
-from containers import Container
+from common.metrics import QUEUE_DEPTH, REGISTRY
+from config import get_settings
+from containers import Container, validate_container
 from database.setup import set_all_indexes
+from middleware.metrics import MetricsMiddleware
+from middleware.profiler import ProfilerMiddleware
 from middleware.request_context import RequestContextMiddleware
 
+from interface.controller.router.admin_router import router as admin_router
 from interface.controller.router.user_router import router as user_router
 from interface.controller.router.chat_router import router as chat_router
 from interface.controller.router.message_router import router as message_router
@@ -22,6 +29,75 @@ from interface.controller.router.prompt_router import router as prompt_router
 
 prefix = "/api"
 
+cache_settings = get_settings().cache
+metrics_settings = get_settings().metrics
+profiler_settings = get_settings().profiler
+loop_monitor_settings = get_settings().loop_monitor
+warmup_settings = get_settings().llm_warmup
+drain_settings = get_settings().drain
+
+
+async def refresh_tool_prompts(container: Container) -> None:
+    """프리페치 대상 앱의 툴 프롬프트를 TTL 보다 먼저 주기적으로 갱신"""
+    interval = max(cache_settings.app_info_cache_ttl * 0.8, 1)
+    while True:
+        await asyncio.sleep(interval)
+        await container.prompt_service().prefetch_tool_prompts(
+            app_ids=cache_settings.app_info_prefetch_ids,
+            user_id=cache_settings.app_info_prefetch_user_id,
+        )
+
+
+async def flush_metrics() -> None:
+    """다른 워커의 /metrics 응답에 포함되도록 스냅샷을 주기적으로 기록"""
+    while True:
+        await asyncio.sleep(metrics_settings.metrics_flush_interval)
+        try:
+            await asyncio.to_thread(REGISTRY.write_snapshot)
+        except OSError as e:
+            logging.warning(f"[Metrics] 스냅샷 기록 실패: {e}")
+
+
+def register_queue_metrics(container: Container) -> None:
+    if cache_settings.rerank_score_cache_enabled:
+        score_cache = container.rerank_score_cache()
+        QUEUE_DEPTH.set_function(
+            lambda: score_cache.stats()["pending_writes"],
+            queue="rerank_score_cache_writes",
+        )
+
+    exporter = container.trace_exporter()
+    if exporter is not None:
+        QUEUE_DEPTH.set_function(lambda: exporter.pending, queue="trace_export")
+
+    system_logger = container.system_logger()
+    QUEUE_DEPTH.set_function(lambda: system_logger.pending, queue="system_log")
+
+
+def install_profile_signal(container: Container) -> None:
+    """SIGUSR2 를 받으면 PROFILER_SIGNAL_SECONDS 동안 샘플링하여 파일로 저장"""
+    profiler = container.profiler()
+    tasks: set[asyncio.Task] = set()
+
+    async def _capture() -> None:
+        profile_id = profiler.new_profile_id()
+        try:
+            profile = await profiler.sample(profiler_settings.profiler_signal_seconds)
+            path = await asyncio.to_thread(profiler.save, profile_id, profile)
+            logging.warning(f"[Profiler] 프로파일 저장: {path}")
+        except Exception as e:
+            logging.warning(f"[Profiler] 프로파일 실패: {e}")
+
+    def _on_signal() -> None:
+        task = asyncio.create_task(_capture())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGUSR2, _on_signal)
+    except (NotImplementedError, RuntimeError):
+        pass
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -30,10 +106,98 @@ async def lifespan(app: FastAPI):
     db = container.motor_db()
     await set_all_indexes(db)
 
+    # 워커 공유 캐시 계층: 다른 워커의 무효화 이벤트 구독
+    shared_cache_tier = container.shared_cache_tier()
+    if shared_cache_tier is not None:
+        await shared_cache_tier.start()
+
+    # tokenizer 로드는 블로킹이므로 첫 요청 전에 스레드에서 미리 수행
+    await asyncio.to_thread(container.passage_slicer)
+    validate_container(container)
+
+    # 모델 적재는 수십 초 걸릴 수 있으므로 백그라운드로 수행, 끝날 때까지 /ready 는 503
+    if warmup_settings.llm_warmup_enabled:
+        container.llm_warmup().start()
+
+    prefetch_task = None
+    if cache_settings.app_info_prefetch_ids:
+        await container.prompt_service().prefetch_tool_prompts(
+            app_ids=cache_settings.app_info_prefetch_ids,
+            user_id=cache_settings.app_info_prefetch_user_id,
+        )
+        prefetch_task = asyncio.create_task(refresh_tool_prompts(container))
+
+    if profiler_settings.profiler_enabled:
+        install_profile_signal(container)
+
+    if loop_monitor_settings.loop_monitor_enabled:
+        container.loop_monitor().start()
+
+    metrics_task = None
+    if metrics_settings.metrics_enabled:
+        REGISTRY.configure(metrics_settings.metrics_multiprocess_dir)
+        register_queue_metrics(container)
+        if REGISTRY.multiprocess_dir is not None:
+            metrics_task = asyncio.create_task(flush_metrics())
+
+    # SIGTERM 시 uvicorn 종료 전에 드레인 시작 (readiness 해제, 새 스트림 거절)
+    drain = container.drain()
+    if drain_settings.drain_enabled:
+        drain.install_signal_handlers()
+
     yield
 
+    # 시그널 없이 종료되는 경우에도 남은 스트림을 정리
+    drain.begin()
+    await drain.wait()
+    drain.restore_signal_handlers()
+
+    if warmup_settings.llm_warmup_enabled:
+        await container.llm_warmup().stop()
+
+    if loop_monitor_settings.loop_monitor_enabled:
+        await container.loop_monitor().stop()
+
+    if metrics_task:
+        metrics_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await metrics_task
+        # 종료 직전까지의 카운터를 남김
+        REGISTRY.write_snapshot()
+
+    if prefetch_task:
+        prefetch_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await prefetch_task
+
+    for client in (
+        container.studio_http_client(),
+        container.rerank_http_client(),
+        container.ml_http_client(),
+    ):
+        await client.aclose()
+
+    exporter = container.trace_exporter()
+    if exporter is not None:
+        await asyncio.to_thread(exporter.shutdown)
+
+    if shared_cache_tier is not None:
+        await shared_cache_tier.aclose()
+
+    await container.system_logger().aclose()
+
+
+def configure_logging() -> None:
+    """애플리케이션 로거 설정 (모듈 import 시점이 아닌 앱 생성 시 한 번)"""
+    logging.basicConfig(
+        format="[%(asctime)s.%(msecs)03d] %(levelname)-8s %(message)s",
+        level=logging.INFO,
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
 
 def create_app() -> FastAPI:
+    configure_logging()
     app = FastAPI(
         title="Spider Chat API",
         lifespan=lifespan,
@@ -59,6 +223,7 @@ def create_app() -> FastAPI:
     api_router.include_router(chat_router, tags=["Chat"])
     api_router.include_router(message_router, tags=["Message"])
     api_router.include_router(prompt_router, tags=["Prompt"])
+    api_router.include_router(admin_router, tags=["Admin"])
 
     app.include_router(api_router)
     app.add_middleware(
@@ -67,8 +232,19 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    app.add_middleware(RawContextMiddleware)
     app.add_middleware(RequestContextMiddleware)
+    if profiler_settings.profiler_enabled:
+        app.add_middleware(ProfilerMiddleware)
+    if metrics_settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            # 다른 워커 스냅샷 파일 읽기는 블로킹이므로 스레드에서 수행
+            body = await asyncio.to_thread(REGISTRY.render)
+            return PlainTextResponse(
+                body, media_type="text/plain; version=0.0.4; charset=utf-8"
+            )
 
     return app
 
@@ -81,6 +257,12 @@ async def healthcheck():
     return {"ok": True}
 
 
+@app.get("/ready", include_in_schema=False)
+async def readiness(request: Request):
+    stats = request.app.container.readiness().stats()
+    return JSONResponse(stats, status_code=200 if stats["ready"] else 503)
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     return JSONResponse(
@@ -0,0 +1,54 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common.metrics import HTTP_DURATION, HTTP_REQUESTS, SSE_ACTIVE
+
+# 메트릭 수집 대상에서 제외 (스크레이프 자체)
+EXCLUDED_PATHS = {"/metrics"}
+
+
+class MetricsMiddleware:
+    """
+    라우트 템플릿 단위 요청 수 / 처리 시간 / 진행 중 SSE 스트림 수 집계
+    BaseHTTPMiddleware 를 거치지 않는 순수 ASGI 미들웨어로 스트리밍 응답을 버퍼링하지 않는다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        sse_route = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, sse_route
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = dict(message.get("headers") or [])
+                if headers.get(b"content-type", b"").startswith(b"text/event-stream"):
+                    sse_route = _route(scope)
+                    SSE_ACTIVE.inc(route=sse_route)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if sse_route is not None:
+                SSE_ACTIVE.dec(route=sse_route)
+            route = _route(scope)
+            HTTP_REQUESTS.inc(method=scope["method"], route=route, status=str(status))
+            HTTP_DURATION.observe(
+                time.perf_counter() - started, method=scope["method"], route=route
+            )
+
+
+def _route(scope: Scope) -> str:
+    # 경로 그대로 쓰면 chat_id 등으로 라벨이 무한히 늘어나므로 라우트 템플릿 사용
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
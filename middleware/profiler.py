@@ -0,0 +1,68 @@
+import asyncio
+import logging
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import get_settings
+
+admin_settings = get_settings().admin
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile"
+
+
+class ProfilerMiddleware:
+    """
+    관리자 토큰과 함께 X-Profile: 1 헤더가 온 요청만 태스크 단위로 프로파일링한다.
+    결과는 프로파일러 출력 디렉터리에 저장하고, 응답 헤더 X-Profile-Id 로 식별자를 알려준다.
+    (GET /api/admin/profiles/{profile_id} 로 조회)
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if headers.get(PROFILE_HEADER) != "1" or not _is_admin(scope, headers):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = scope["app"].container.profiler()
+        profile_id = profiler.new_profile_id()
+        session = profiler.start_task_session()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers") or []) + [
+                    (b"x-profile-id", profile_id.encode())
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            session.detach()
+            await asyncio.to_thread(session.stop)
+            profile = session.result(f"{scope['method']} {scope['path']}")
+            try:
+                await asyncio.to_thread(profiler.save, profile_id, profile)
+            except OSError as e:
+                logger.warning(f"[Profiler] 프로파일 저장 실패: {e}")
+
+
+def _is_admin(scope: Scope, headers: Headers) -> bool:
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        token_service = scope["app"].container.token_service()
+        user_id = token_service.validate_token(token).get("user_id")
+    except Exception:
+        return False
+    return user_id in admin_settings.admin_user_ids
@@ -1,22 +1,75 @@
 import contextvars
+import uuid
+from typing import Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common.tracing import set_trace_id
+
+REQUEST_ID_HEADER = b"x-request-id"
 
 _request_context_var: contextvars.ContextVar[Request] = contextvars.ContextVar(
     "request_context"
 )
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        token = _request_context_var.set(request)
+class RequestContextMiddleware:
+    """
+    요청 컨텍스트(Request / request_id / user) 전파
+    BaseHTTPMiddleware 와 달리 응답을 별도 태스크 / 메모리 스트림으로 감싸지 않으므로
+    SSE 스트리밍 응답의 청크마다 추가 비용이 없다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _header(scope, REQUEST_ID_HEADER) or uuid.uuid4().hex
+        # Request.state 는 scope["state"] 를 공유하므로 라우터 / 의존성에서 설정한 값도 보인다
+        scope.setdefault("state", {})["request_id"] = request_id
+        set_trace_id(request_id)
+        token = _request_context_var.set(Request(scope, receive))
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (REQUEST_ID_HEADER, request_id.encode("latin-1")),
+                ]
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         finally:
             _request_context_var.reset(token)
 
 
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
 def get_request() -> Request:
     return _request_context_var.get()
+
+
+def get_request_id() -> Optional[str]:
+    request = _request_context_var.get(None)
+    return request.state.request_id if request is not None else None
+
+
+def set_request_user(user) -> None:
+    """인증된 사용자를 요청 컨텍스트에 기록 (요청 로그 등에서 사용)"""
+    _request_context_var.get().state.user = user
+
+
+def get_request_user():
+    request = _request_context_var.get(None)
+    return getattr(request.state, "user", None) if request is not None else None
@@ -0,0 +1,83 @@
+"""
+이벤트 루프 블로킹 호출 점검
+
+앱을 같은 프로세스(같은 이벤트 루프)에서 기동하고 가입/로그인/채팅 생성 및 SSE 턴을 실행하는 동안
+루프가 threshold 이상 멈추면 해당 시점의 스택을 출력하고 exit 1 로 실패한다.
+Mongo 와 업스트림(tools.fake_servers 등)은 .env 설정을 그대로 사용한다.
+외부 서비스 없이 파이프라인만 점검하려면 tools.pipeline_blocking_check 를 사용한다.
+
+    python -m tools.fake_servers &
+    python -m tools.blocking_check --requests 10 --threshold-ms 50
+    python -m tools.blocking_check --audio-ratio 0.5    # STT 경로 포함
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import uuid
+
+import httpx
+
+from common.loop_monitor import BlockingCallError, detect_blocking
+from tools.load_test import prepare_sessions, run_stream
+
+
+async def main(args: argparse.Namespace) -> int:
+    from main import app
+
+    # 앱 기동(인덱스 생성, tokenizer 로드 등)은 점검 대상에서 제외
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://blocking-check/api",
+            timeout=args.timeout,
+        ) as client:
+            try:
+                async with detect_blocking(
+                    threshold_ms=args.threshold_ms, interval_ms=args.interval_ms
+                ) as monitor:
+                    sessions = await prepare_sessions(
+                        client, args.users, 1, uuid.uuid4().hex[:8]
+                    )
+                    results = await asyncio.gather(
+                        *(
+                            run_stream(
+                                client,
+                                sessions[i % len(sessions)],
+                                args.app_id,
+                                audio=random.random() < args.audio_ratio,
+                            )
+                            for i in range(args.requests)
+                        )
+                    )
+            except BlockingCallError as e:
+                print(e)
+                return 1
+
+    failed = [r for r in results if not r.ok]
+    print(
+        f"{len(results)} stream(s), {len(failed)} failed, "
+        f"max loop lag {monitor.max_lag * 1000:.1f}ms "
+        f"(threshold {args.threshold_ms:g}ms): no blocking calls"
+    )
+    for r in failed:
+        print(f"  {r.kind}: {r.error}")
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="event loop blocking check")
+    parser.add_argument("--app-id", default="ford")
+    parser.add_argument("--users", type=int, default=2)
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--audio-ratio", type=float, default=0.0)
+    parser.add_argument("--threshold-ms", type=float, default=50)
+    parser.add_argument("--interval-ms", type=float, default=10)
+    parser.add_argument("--timeout", type=float, default=120)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
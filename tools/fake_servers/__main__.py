@@ -0,0 +1,113 @@
+"""
+가짜 업스트림 서버(Studio, Rerank, ML, Ollama)를 한 번에 실행
+
+    python -m tools.fake_servers
+    python -m tools.fake_servers --studio-latency-ms 80 --rerank-error-rate 0.05 \\
+        --ollama-tokens-per-second 30 --ollama-rules rules.json
+
+실행 후 출력되는 환경변수를 .env 에 반영하면 API 서버가 가짜 서버를 사용한다.
+"""
+
+import argparse
+import asyncio
+import json
+
+import uvicorn
+
+from tools.fake_servers import ml, ollama, rerank, studio
+from tools.fake_servers.common import Behavior, add_behavior_args, behavior_from_args
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="fake upstream servers")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--studio-port", type=int, default=18100)
+    parser.add_argument("--rerank-port", type=int, default=18101)
+    parser.add_argument("--ml-port", type=int, default=18102)
+    parser.add_argument("--ollama-port", type=int, default=18103)
+
+    add_behavior_args(parser, "studio", Behavior(latency_ms=80))
+    add_behavior_args(parser, "ml", Behavior(latency_ms=200))
+    add_behavior_args(parser, "ollama", Behavior(latency_ms=300))
+
+    parser.add_argument("--rerank-base-ms", type=float, default=20)
+    parser.add_argument("--rerank-per-passage-ms", type=float, default=0.5)
+    parser.add_argument("--rerank-error-rate", type=float, default=0.0)
+    parser.add_argument("--rerank-jitter", type=float, default=0.0)
+
+    parser.add_argument("--ollama-tokens-per-second", type=float, default=40)
+    parser.add_argument(
+        "--ollama-load-ms",
+        type=float,
+        default=0,
+        help="모델 미적재(최초 / keep_alive 만료) 시 추가 지연",
+    )
+    parser.add_argument(
+        "--ollama-rules",
+        default="",
+        help='[{"match": "...", "response": "..."}] 형식의 JSON 파일',
+    )
+    parser.add_argument("--tts-realtime-factor", type=float, default=4.0)
+    return parser.parse_args()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    rules = None
+    if args.ollama_rules:
+        with open(args.ollama_rules, encoding="utf-8") as f:
+            rules = json.load(f)
+
+    apps = [
+        (studio.create_app(behavior_from_args(args, "studio")), args.studio_port),
+        (
+            rerank.create_app(
+                args.rerank_base_ms,
+                args.rerank_per_passage_ms,
+                args.rerank_error_rate,
+                args.rerank_jitter,
+            ),
+            args.rerank_port,
+        ),
+        (
+            ml.create_app(
+                behavior_from_args(args, "ml"),
+                realtime_factor=args.tts_realtime_factor,
+            ),
+            args.ml_port,
+        ),
+        (
+            ollama.create_app(
+                behavior_from_args(args, "ollama"),
+                tokens_per_second=args.ollama_tokens_per_second,
+                rules=rules,
+                load_ms=args.ollama_load_ms,
+            ),
+            args.ollama_port,
+        ),
+    ]
+    servers = [
+        uvicorn.Server(
+            uvicorn.Config(app, host=args.host, port=port, log_level="warning")
+        )
+        for app, port in apps
+    ]
+
+    print(
+        "\n".join(
+            [
+                "# fake upstream 환경변수",
+                f"STUDIO_HOST={args.host}",
+                f"STUDIO_PORT={args.studio_port}",
+                f"RERANK_HOST={args.host}",
+                f"RERANK_PORT={args.rerank_port}",
+                f"ML_URL=http://{args.host}:{args.ml_port}",
+                f"HAIQV_URL=http://{args.host}:{args.ollama_port}",
+            ]
+        ),
+        flush=True,
+    )
+    await asyncio.gather(*(server.serve() for server in servers))
+
+
+if __name__ == "__main__":
+    asyncio.run(serve(parse_args()))
@@ -0,0 +1,51 @@
+import argparse
+import asyncio
+import random
+from dataclasses import dataclass, fields
+
+from fastapi import HTTPException
+
+
+@dataclass
+class Behavior:
+    """
+    가짜 서버 응답 특성
+    - latency_ms: 지연 중앙값
+    - jitter: 로그정규분포 sigma (0 이면 고정 지연, 0.5 정도면 긴 꼬리)
+    - error_rate: 503 응답 비율
+    """
+
+    latency_ms: float = 50
+    jitter: float = 0.3
+    error_rate: float = 0.0
+
+    def delay(self) -> float:
+        factor = random.lognormvariate(0, self.jitter) if self.jitter else 1.0
+        return self.latency_ms / 1000 * factor
+
+    async def wait(self) -> None:
+        await asyncio.sleep(self.delay())
+
+    def maybe_fail(self) -> None:
+        if self.error_rate and random.random() < self.error_rate:
+            raise HTTPException(status_code=503, detail="fake upstream error")
+
+
+def add_behavior_args(
+    parser: argparse.ArgumentParser, prefix: str, defaults: Behavior
+) -> None:
+    for field in fields(Behavior):
+        parser.add_argument(
+            f"--{prefix}-{field.name.replace('_', '-')}",
+            type=float,
+            default=getattr(defaults, field.name),
+        )
+
+
+def behavior_from_args(args: argparse.Namespace, prefix: str) -> Behavior:
+    return Behavior(
+        **{
+            field.name: getattr(args, f"{prefix}_{field.name}")
+            for field in fields(Behavior)
+        }
+    )
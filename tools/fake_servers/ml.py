@@ -0,0 +1,67 @@
+"""
+가짜 ML 서버 (MLRepositoryImpl 프로토콜)
+
+    POST /stt   {"waveform"}  -> {"text", "token_count", "logprob"}
+    POST /tts   {"text", ...} -> raw PCM(16bit mono) 청크 스트림
+"""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from tools.fake_servers.common import Behavior
+
+
+class STTRequest(BaseModel):
+    waveform: str
+
+
+class TTSRequest(BaseModel):
+    text: str
+    voice_name: str = "af_heart"
+    speed: float = 1
+    numpy: bool = False
+    streaming: bool = True
+
+
+def create_app(
+    behavior: Behavior = Behavior(latency_ms=200),
+    stt_text: str = "서울 지하철 노선을 알려줘",
+    sample_rate: int = 24000,
+    chunk_ms: int = 200,
+    ms_per_char: float = 60,
+    realtime_factor: float = 4.0,
+) -> FastAPI:
+    """
+    tts 는 글자당 ms_per_char 길이의 무음을 chunk_ms 단위로 전송하며,
+    realtime_factor 배속으로 생성하는 것처럼 청크 간격을 둔다.
+    """
+    app = FastAPI(title="fake-ml")
+    chunk = b"\x00\x00" * int(sample_rate * chunk_ms / 1000)
+
+    @app.post("/stt")
+    async def stt(request: STTRequest):
+        await behavior.wait()
+        behavior.maybe_fail()
+        return {
+            "text": stt_text,
+            "token_count": len(stt_text.split()),
+            "logprob": -0.12,
+        }
+
+    @app.post("/tts")
+    async def tts(request: TTSRequest):
+        behavior.maybe_fail()
+        n_chunks = max(1, int(len(request.text) * ms_per_char / chunk_ms))
+
+        async def _stream():
+            await behavior.wait()  # 첫 청크까지의 지연
+            for _ in range(n_chunks):
+                yield chunk
+                await asyncio.sleep(chunk_ms / 1000 / realtime_factor)
+
+        return StreamingResponse(_stream(), media_type="application/octet-stream")
+
+    return app
@@ -0,0 +1,178 @@
+"""
+가짜 Ollama 서버 (HaiqvChatOllama / ChatOllama 가 사용하는 /api/chat)
+
+stream=true 이면 NDJSON 으로 토큰을 tokens_per_second 속도로 전송하고,
+첫 토큰 전까지 behavior 지연(TTFT)을 둔다.
+load_ms 를 주면 모델이 적재되지 않은 상태(최초 / keep_alive 만료)의 요청은
+load_ms 만큼 더 지연되고 load_duration 으로 보고된다. /api/generate (빈 프롬프트) 로 적재만 할 수 있다.
+응답 내용은 프롬프트에 포함된 문자열로 고른다 (rules 파일로 덮어쓰기 가능).
+"""
+
+import asyncio
+import json
+import re
+import time
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from tools.fake_servers.common import Behavior
+
+DEFAULT_ANSWER = (
+    "요청하신 내용은 검색된 문서를 바탕으로 정리하면 다음과 같습니다. "
+    "서울 지하철은 1974년 1호선 개통 이후 꾸준히 확장되었고, "
+    "현재는 수도권 전철망과 연결되어 하루 수백만 명이 이용합니다. "
+    "자세한 노선 정보는 첨부된 문서의 해당 페이지를 참고해 주세요."
+)
+PLAN = json.dumps(
+    [{"agent": "retrieval", "thought": "문서에서 질문과 관련된 내용을 검색한다."}],
+    ensure_ascii=False,
+)
+_TOKEN_RE = re.compile(r"\S+\s*|\s+")
+
+
+class ChatRequest(BaseModel):
+    model: str
+    messages: List[Dict[str, Any]]
+    stream: bool = True
+    format: Optional[Any] = None
+    options: Optional[Dict[str, Any]] = None
+    keep_alive: Optional[Any] = None
+
+
+class GenerateRequest(BaseModel):
+    model: str
+    prompt: str = ""
+    stream: bool = False
+    keep_alive: Optional[Any] = None
+
+
+_DURATION_RE = re.compile(r"^(-?\d+(?:\.\d+)?)(ms|s|m|h)?$")
+_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, None: 1}
+
+
+def keep_alive_seconds(value: Any) -> float:
+    """Ollama keep_alive (초 / "30m" 등, 음수면 무기한) → 초"""
+    if value is None:
+        return 300
+    match = _DURATION_RE.match(str(value).strip())
+    if not match:
+        return 300
+    seconds = float(match[1]) * _UNITS[match[2]]
+    return float("inf") if seconds < 0 else seconds
+
+
+def default_response(messages: List[Dict[str, Any]]) -> str:
+    prompt = "\n".join(str(m.get("content", "")) for m in messages)
+    if "keyword_string_list" in prompt:
+        last = str(messages[-1].get("content", "")) if messages else ""
+        words = [w for w in re.findall(r"\w+", last) if len(w) > 1] or ["문서"]
+        return json.dumps(
+            {"keyword_string_list": [" ".join(words[i : i + 2]) for i in range(3)]},
+            ensure_ascii=False,
+        )
+    if '"title"' in prompt:
+        return json.dumps({"title": "문서 검색 문의"}, ensure_ascii=False)
+    if "agent" in prompt:
+        return PLAN
+    return DEFAULT_ANSWER
+
+
+def create_app(
+    behavior: Behavior = Behavior(latency_ms=300),
+    tokens_per_second: float = 40,
+    rules: Optional[List[Dict[str, str]]] = None,
+    load_ms: float = 0,
+) -> FastAPI:
+    """rules: [{"match": "프롬프트 부분 문자열", "response": "응답"}] (앞에서부터 우선)"""
+    app = FastAPI(title="fake-ollama")
+    # 모델별 적재 만료 시각 (monotonic)
+    loaded: Dict[str, float] = {}
+
+    async def _load(model: str, keep_alive: Any) -> int:
+        """적재에 걸린 시간(ns). 이미 적재된 모델은 0"""
+        now = time.monotonic()
+        duration = 0
+        if load_ms and loaded.get(model, 0) <= now:
+            await asyncio.sleep(load_ms / 1000)
+            duration = int(load_ms * 1e6)
+        loaded[model] = time.monotonic() + keep_alive_seconds(keep_alive)
+        return duration
+
+    def _respond(messages: List[Dict[str, Any]]) -> str:
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        for rule in rules or []:
+            if rule["match"] in prompt:
+                return rule["response"]
+        return default_response(messages)
+
+    def _frame(model: str, content: str, done: bool, **extra) -> dict:
+        return {
+            "model": model,
+            "created_at": datetime.now(UTC).isoformat(),
+            "message": {"role": "assistant", "content": content},
+            "done": done,
+            **extra,
+        }
+
+    @app.post("/api/chat")
+    async def chat(request: ChatRequest):
+        behavior.maybe_fail()
+        load_duration = await _load(request.model, request.keep_alive)
+        answer = _respond(request.messages)
+        tokens = _TOKEN_RE.findall(answer)
+        prompt_tokens = (
+            sum(len(str(m.get("content", ""))) for m in request.messages) // 3
+        )
+
+        def _final(started: float) -> dict:
+            elapsed = int((time.perf_counter() - started) * 1e9)
+            return dict(
+                done_reason="stop",
+                total_duration=elapsed,
+                load_duration=load_duration,
+                prompt_eval_count=prompt_tokens,
+                prompt_eval_duration=0,
+                eval_count=len(tokens),
+                eval_duration=elapsed,
+            )
+
+        if not request.stream:
+            started = time.perf_counter()
+            await behavior.wait()
+            await asyncio.sleep(len(tokens) / tokens_per_second)
+            return _frame(request.model, answer, True, **_final(started))
+
+        async def _stream():
+            started = time.perf_counter()
+            await behavior.wait()
+            for token in tokens:
+                yield json.dumps(
+                    _frame(request.model, token, False), ensure_ascii=False
+                ) + "\n"
+                await asyncio.sleep(1 / tokens_per_second)
+            yield json.dumps(_frame(request.model, "", True, **_final(started))) + "\n"
+
+        return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+    @app.post("/api/generate")
+    async def generate(request: GenerateRequest):
+        # 빈 프롬프트: 모델 적재 / keep_alive 갱신만 수행
+        load_duration = await _load(request.model, request.keep_alive)
+        return {
+            "model": request.model,
+            "created_at": datetime.now(UTC).isoformat(),
+            "response": "",
+            "done": True,
+            "done_reason": "load",
+            "load_duration": load_duration,
+        }
+
+    @app.get("/api/tags")
+    async def tags():
+        return {"models": []}
+
+    return app
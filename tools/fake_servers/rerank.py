@@ -0,0 +1,87 @@
+"""
+로컬 개발 / 벤치마크용 가짜 리랭크 서버
+
+GPU 리랭크 서버처럼 한 번에 하나의 요청만 처리하며,
+처리 시간은 base_ms + per_passage_ms * passage 수 로 흉내낸다.
+
+    python -m tools.fake_servers.rerank --port 8000 --base-ms 20 --per-passage-ms 0.5
+"""
+
+import argparse
+import asyncio
+import random
+from typing import List
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+
+class RerankRequest(BaseModel):
+    query: str
+    passage_list: List[str]
+
+
+def lexical_score(query: str, passage: str) -> float:
+    """질의 토큰이 passage 에 포함된 비율 (결정적인 가짜 점수)"""
+    tokens = query.lower().split()
+    if not tokens:
+        return 0.0
+    text = passage.lower()
+    return sum(1 for t in tokens if t in text) / len(tokens)
+
+
+def create_app(
+    base_ms: float = 20,
+    per_passage_ms: float = 0.5,
+    error_rate: float = 0.0,
+    jitter: float = 0.0,
+) -> FastAPI:
+    app = FastAPI(title="fake-rerank")
+    gpu = asyncio.Lock()
+    app.state.calls = 0
+    app.state.passages = 0
+
+    @app.post("/rerank")
+    async def rerank(request: RerankRequest):
+        if error_rate and random.random() < error_rate:
+            raise HTTPException(status_code=503, detail="fake rerank error")
+
+        total = len(request.passage_list)
+        async with gpu:
+            app.state.calls += 1
+            app.state.passages += total
+            factor = random.lognormvariate(0, jitter) if jitter else 1.0
+            await asyncio.sleep((base_ms + per_passage_ms * total) / 1000 * factor)
+        return {
+            "scores": [lexical_score(request.query, p) for p in request.passage_list]
+        }
+
+    @app.get("/stats")
+    async def stats():
+        return {"calls": app.state.calls, "passages": app.state.passages}
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="fake rerank server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--base-ms", type=float, default=20)
+    parser.add_argument("--per-passage-ms", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        create_app(args.base_ms, args.per_passage_ms, args.error_rate, args.jitter),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+가짜 Studio 서버 (StudioRepositoryImpl 프로토콜)
+
+    GET  /app/name/{app_id}
+    POST /embedding/search   {"query", "k", "app_name", "model_type"}
+"""
+
+import hashlib
+from typing import List
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from tools.fake_servers.common import Behavior
+
+CORPUS = [
+    "서울특별시는 대한민국의 수도이며 정치, 경제, 사회, 문화의 중심지이다.",
+    "지하철은 1974년 1호선 개통 이후 꾸준히 확장되어 수도권 전철망과 연결되어 있다.",
+    "The reranker scores each passage against the user query.",
+    "Long documents are split into passages that fit the model context window.",
+    "주요 관광지로는 경복궁, 창덕궁, 남산서울타워, 북촌한옥마을 등이 있다.",
+    "Batching many short passages is cheaper than sending a few very long ones.",
+    "한강을 중심으로 강북과 강남으로 나뉘며, 25개의 자치구로 구성되어 있다.",
+    "Quarterly reports are published on the first business day of each quarter.",
+]
+
+
+class SearchRequest(BaseModel):
+    query: str
+    k: int
+    app_name: str
+    model_type: str = "nomic"
+
+
+def _pick(app_name: str, query: str, k: int, corpus_size: int) -> List[int]:
+    """질의에 따라 결정적으로 문서를 고름 (비슷한 질의는 일부 결과가 겹침)"""
+    ids = []
+    for token in [query, *query.split()]:
+        digest = hashlib.sha1(f"{app_name}:{token}".encode()).digest()
+        ids.append(int.from_bytes(digest[:4], "big") % corpus_size)
+    n = 0
+    while len(dict.fromkeys(ids)) < min(k, corpus_size):
+        ids.append((ids[0] + n) % corpus_size)
+        n += 1
+    return list(dict.fromkeys(ids))[:k]
+
+
+def create_app(behavior: Behavior = Behavior(), corpus_size: int = 200) -> FastAPI:
+    app = FastAPI(title="fake-studio")
+
+    @app.get("/app/name/{app_id}")
+    async def app_info(app_id: str):
+        await behavior.wait()
+        behavior.maybe_fail()
+        return {
+            "description": f"{app_id} 앱의 사내 문서 모음",
+            "keywords": ["서울", "지하철", "rerank", "report"],
+        }
+
+    @app.post("/embedding/search")
+    async def search(request: SearchRequest):
+        await behavior.wait()
+        behavior.maybe_fail()
+        return {
+            "search_response_list": [
+                {
+                    "chunk_id": f"{request.app_name}-{idx}",
+                    "document_name": f"document_{idx // 10}.pdf",
+                    "page": idx % 10 + 1,
+                    "content": CORPUS[idx % len(CORPUS)] + f" ({idx})",
+                    "tags": [request.app_name.lower()],
+                    "file_creation_date": "2024-01-01T00:00:00",
+                    "file_modification_date": None,
+                }
+                for idx in _pick(
+                    request.app_name, request.query, request.k, corpus_size
+                )
+            ]
+        }
+
+    return app
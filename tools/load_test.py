@@ -0,0 +1,310 @@
+"""
+채팅 SSE 부하 테스트
+
+사용자 가입/로그인 → 채팅 생성 후, 동시 concurrency 개의 SSE 스트림
+(POST /v2/chats/{chat_id}/messages, 일부는 /audio)을 총 requests 개 실행하고
+첫 이벤트 / 첫 토큰 / 토큰 간격 / 완료 시간 백분위를 JSON 리포트로 남긴다.
+
+    python -m tools.load_test --base-url http://localhost:8000/api \\
+        --users 20 --concurrency 50 --requests 500 --audio-ratio 0.2 \\
+        --output reports/load_$(git rev-parse --short HEAD).json
+
+    # 이전 리포트와 비교
+    python -m tools.load_test ... --compare reports/load_abc123.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Dict, List, Optional
+
+import httpx
+
+QUERIES = [
+    "서울 지하철 노선에 대해 알려줘",
+    "분기 보고서는 언제 발행돼?",
+    "문서에서 리랭크 설명 부분을 요약해줘",
+    "How are long documents split into passages?",
+    "경복궁 관람 시간 알려줘",
+]
+PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass
+class StreamResult:
+    kind: str
+    status: int = 0
+    ok: bool = False
+    error: Optional[str] = None
+    first_event: Optional[float] = None
+    first_token: Optional[float] = None
+    first_audio: Optional[float] = None
+    completed: Optional[float] = None
+    events: int = 0
+    tokens: int = 0
+    degraded: int = 0
+    token_gaps: List[float] = field(default_factory=list)
+
+
+@dataclass
+class Session:
+    token: str
+    chat_ids: List[str]
+
+
+async def prepare_sessions(
+    client: httpx.AsyncClient, users: int, chats_per_user: int, run_id: str
+) -> List[Session]:
+    async def _prepare(idx: int) -> Session:
+        user_id = f"load-{run_id}-{idx}"
+        password = "load-test-password"
+        await client.post(
+            "/users/signup",
+            json={"user_id": user_id, "user_name": user_id, "password": password},
+        )
+        resp = await client.post(
+            "/users/login", json={"userId": user_id, "password": password}
+        )
+        resp.raise_for_status()
+        token = resp.json()["data"]["token"]
+
+        headers = {"Authorization": f"Bearer {token}"}
+        chat_ids = []
+        for _ in range(chats_per_user):
+            resp = await client.post("/v2/chats", headers=headers)
+            resp.raise_for_status()
+            chat_ids.append(resp.json()["id"])
+        return Session(token=token, chat_ids=chat_ids)
+
+    return await asyncio.gather(*(_prepare(i) for i in range(users)))
+
+
+async def run_stream(
+    client: httpx.AsyncClient,
+    session: Session,
+    app_id: str,
+    audio: bool,
+) -> StreamResult:
+    result = StreamResult(kind="audio" if audio else "text")
+    chat_id = random.choice(session.chat_ids)
+    path = f"/v2/chats/{chat_id}/{'audio' if audio else 'messages'}"
+
+    started = time.perf_counter()
+    last_token: Optional[float] = None
+    try:
+        async with client.stream(
+            "POST",
+            path,
+            params={"app_id": app_id},
+            json={"user_query": random.choice(QUERIES)},
+            headers={"Authorization": f"Bearer {session.token}"},
+        ) as resp:
+            result.status = resp.status_code
+            if resp.status_code != 200:
+                result.error = f"HTTP {resp.status_code}"
+                return result
+
+            async for line in resp.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                now = time.perf_counter() - started
+                result.events += 1
+                if result.first_event is None:
+                    result.first_event = now
+
+                try:
+                    frame = json.loads(line[5:].strip())
+                except ValueError:
+                    continue
+                if not isinstance(frame, dict):
+                    continue
+
+                if "v" in frame:
+                    result.tokens += 1
+                    if result.first_token is None:
+                        result.first_token = now
+                    if last_token is not None:
+                        result.token_gaps.append(now - last_token)
+                    last_token = now
+                elif "a" in frame and result.first_audio is None:
+                    result.first_audio = now
+                elif frame.get("control_signal") == "error_occurred":
+                    result.error = frame.get("detail") or "error_occurred"
+                elif frame.get("control_signal") == "degraded":
+                    result.degraded += 1
+
+        result.completed = time.perf_counter() - started
+        result.ok = result.error is None
+    except httpx.HTTPError as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {f"p{p}": None for p in PERCENTILES} | {"max": None, "count": 0}
+    ordered = sorted(values)
+    summary = {
+        f"p{p}": round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))], 4)
+        for p in PERCENTILES
+    }
+    return summary | {"max": round(ordered[-1], 4), "count": len(ordered)}
+
+
+def summarize(results: List[StreamResult], elapsed: float) -> dict:
+    ok = [r for r in results if r.ok]
+    errors: Dict[str, int] = {}
+    for r in results:
+        if r.error:
+            errors[r.error[:120]] = errors.get(r.error[:120], 0) + 1
+
+    return {
+        "requests": len(results),
+        "succeeded": len(ok),
+        "failed": len(results) - len(ok),
+        "degraded": sum(1 for r in results if r.degraded),
+        "elapsed_seconds": round(elapsed, 3),
+        "streams_per_second": round(len(ok) / elapsed, 3) if elapsed else 0,
+        "tokens_per_second": (
+            round(sum(r.tokens for r in ok) / elapsed, 1) if elapsed else 0
+        ),
+        "time_to_first_event": percentiles(
+            [r.first_event for r in ok if r.first_event is not None]
+        ),
+        "time_to_first_token": percentiles(
+            [r.first_token for r in ok if r.first_token is not None]
+        ),
+        "time_to_first_audio": percentiles(
+            [r.first_audio for r in ok if r.first_audio is not None]
+        ),
+        "inter_token_gap": percentiles([g for r in ok for g in r.token_gaps]),
+        "completion_time": percentiles(
+            [r.completed for r in ok if r.completed is not None]
+        ),
+        "errors": errors,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def print_summary(summary: dict, baseline: Optional[dict] = None) -> None:
+    print(
+        f"requests {summary['requests']}  ok {summary['succeeded']}"
+        f"  failed {summary['failed']}  degraded {summary['degraded']}"
+        f"  {summary['streams_per_second']} streams/s"
+        f"  {summary['tokens_per_second']} tokens/s"
+    )
+    for metric in (
+        "time_to_first_event",
+        "time_to_first_token",
+        "time_to_first_audio",
+        "inter_token_gap",
+        "completion_time",
+    ):
+        row = summary[metric]
+        line = f"{metric:<22}" + "".join(
+            f"  p{p} {_ms(row[f'p{p}'])}" for p in PERCENTILES
+        )
+        if baseline and baseline.get(metric, {}).get("p95") and row["p95"]:
+            delta = (row["p95"] / baseline[metric]["p95"] - 1) * 100
+            line += f"  (p95 {delta:+.1f}% vs baseline)"
+        print(line)
+    for error, count in summary["errors"].items():
+        print(f"  error x{count}: {error}")
+
+
+def _ms(value: Optional[float]) -> str:
+    return f"{value * 1000:>8.1f}ms" if value is not None else "       -  "
+
+
+async def main(args: argparse.Namespace) -> dict:
+    run_id = uuid.uuid4().hex[:8]
+    limits = httpx.Limits(max_connections=args.concurrency + args.users)
+    timeout = httpx.Timeout(args.timeout, connect=10)
+
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=timeout
+    ) as client:
+        sessions = await prepare_sessions(
+            client, args.users, args.chats_per_user, run_id
+        )
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        ramp_step = args.ramp_seconds / max(1, args.concurrency)
+
+        async def _one(idx: int) -> StreamResult:
+            if idx < args.concurrency and ramp_step:
+                await asyncio.sleep(idx * ramp_step)
+            async with semaphore:
+                return await run_stream(
+                    client,
+                    sessions[idx % len(sessions)],
+                    args.app_id,
+                    audio=random.random() < args.audio_ratio,
+                )
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(_one(i) for i in range(args.requests)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "run_id": run_id,
+        "commit": git_commit(),
+        "started_at": datetime.now(UTC).isoformat(),
+        "config": {
+            k: v for k, v in vars(args).items() if k not in ("output", "compare")
+        },
+        "summary": summarize(results, elapsed),
+        "by_kind": {
+            kind: summarize([r for r in results if r.kind == kind], elapsed)
+            for kind in ("text", "audio")
+            if any(r.kind == kind for r in results)
+        },
+        "raw": [asdict(r) for r in results] if args.raw else None,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="chat SSE load test")
+    parser.add_argument("--base-url", default="http://localhost:8000/api")
+    parser.add_argument("--app-id", default="ford")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--chats-per-user", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--audio-ratio", type=float, default=0.0)
+    parser.add_argument("--ramp-seconds", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--output", default="")
+    parser.add_argument("--compare", default="", help="비교할 이전 리포트 JSON")
+    parser.add_argument("--raw", action="store_true", help="스트림별 원자료 포함")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["summary"]
+    print_summary(report["summary"], baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"report: {args.output}")
@@ -0,0 +1,234 @@
+"""
+메시지 파이프라인 이벤트 루프 블로킹 점검 (외부 서비스 없이)
+
+컨테이너의 실제 서비스 / 에이전트 / 캐시 / 프레임 묶음 경로로 MessageGenerator 턴을 동시에 실행하되,
+Mongo 저장소와 LLM 은 메모리 가짜로, Studio / 리랭크 업스트림은 tools.fake_servers 앱을
+ASGITransport 로 같은 프로세스에서 호출한다. (소켓 / .env 업스트림 불필요)
+실행 중 루프가 threshold 이상 멈추면 해당 시점의 스택을 출력하고 exit 1 로 실패한다.
+
+    python -m tools.pipeline_blocking_check
+    python -m tools.pipeline_blocking_check --turns 20 --threshold-ms 30
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import re
+import sys
+from itertools import count
+from typing import Dict, List, Optional
+
+import httpx
+import langchain_core.messages
+from dependency_injector import providers
+
+from common.loop_monitor import BlockingCallError, detect_blocking
+from containers import Container
+from domain.chats.models.chat_info import ChatInfo
+from domain.chats.models.identifiers import ChatId
+from domain.messages.models.identifiers import MessageId
+from domain.messages.models.message import BaseMessage
+from domain.prompts.models import Prompt
+from tools.fake_servers import rerank, studio
+from tools.fake_servers.ollama import default_response
+
+PROMPTS = {
+    "planner_system": "Choose agent steps for {user_msg}. History: {chat_history}",
+    "final_answer_system": "Steps: {last_steps} {tts_summary}",
+    "final_answer_persona": "You are helpful. Tools: {tool_description}",
+    "tool_list": "{description} / {keywords}",
+    "tts_summary": "Summarize {last_steps}",
+}
+_TOKEN_RE = re.compile(r"\S+\s*|\s+")
+_ids = count(1)
+
+
+class FakeUserRepository:
+    async def get_by_user_id(self, user_id: str) -> None:
+        await asyncio.sleep(0)
+        return None
+
+
+class FakeChatInfoRepository:
+    def __init__(self):
+        self.chats: Dict[str, ChatInfo] = {}
+
+    async def find_by_id(self, chat_id: ChatId) -> Optional[ChatInfo]:
+        await asyncio.sleep(0)
+        chat_info = self.chats.get(chat_id)
+        return chat_info.model_copy() if chat_info else None
+
+    async def save(self, chat_info: ChatInfo) -> ChatId:
+        await asyncio.sleep(0)
+        chat_info.id = chat_info.id or ChatId(f"chat-{next(_ids)}")
+        self.chats[chat_info.id] = chat_info.model_copy()
+        return chat_info.id
+
+    async def update(self, chat_id: ChatId, primary_page: int) -> bool:
+        await asyncio.sleep(0)
+        self.chats[chat_id].primary_page = primary_page
+        return True
+
+
+class FakeMessageRepository:
+    def __init__(self):
+        self.messages: Dict[str, List[BaseMessage]] = {}
+
+    async def count_by_chat_id(self, chat_id: ChatId) -> int:
+        await asyncio.sleep(0)
+        return len(self.messages.get(chat_id, []))
+
+    async def list_sliced(
+        self, chat_id: ChatId, max_count: int, start_offset: int | None = None
+    ) -> tuple[list[BaseMessage], int | None]:
+        await asyncio.sleep(0)
+        messages = self.messages.get(chat_id, [])
+        end = len(messages) if start_offset is None else start_offset
+        sliced = messages[max(0, end - max_count) : end]
+        next_start_offset = end - len(sliced)
+        return [m.model_copy() for m in sliced], next_start_offset or None
+
+    async def insert(self, message: BaseMessage) -> MessageId:
+        await asyncio.sleep(0)
+        message_id = MessageId(f"message-{next(_ids)}")
+        self.messages.setdefault(message.chat_id, []).append(
+            message.model_copy(update={"id": message_id})
+        )
+        return message_id
+
+    async def update(self, message: BaseMessage) -> bool:
+        await asyncio.sleep(0)
+        messages = self.messages[message.chat_id]
+        for i, saved in enumerate(messages):
+            if saved.id == message.id:
+                messages[i] = message.model_copy()
+        return True
+
+
+class FakePromptRepository:
+    async def get_by_name(self, name: str) -> Optional[Prompt]:
+        await asyncio.sleep(0)
+        if name not in PROMPTS:
+            return None
+        return Prompt(name=name, content=PROMPTS[name], creator="check")
+
+
+class FakeLLM:
+    """tools.fake_servers.ollama 와 같은 규칙으로 응답, astream 은 interval 초 간격 토큰"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+
+    @staticmethod
+    def _respond(messages) -> str:
+        return default_response([{"content": m.content} for m in messages])
+
+    async def ainvoke(self, input, **kwargs):
+        await asyncio.sleep(self.interval)
+        return langchain_core.messages.AIMessage(content=self._respond(input))
+
+    async def astream(self, input, **kwargs):
+        for token in _TOKEN_RE.findall(self._respond(input)):
+            await asyncio.sleep(self.interval)
+            yield langchain_core.messages.AIMessageChunk(content=token)
+
+
+def build_container(args: argparse.Namespace) -> Container:
+    container = Container()
+    container.motor_db.override(providers.Object(None))
+    container.shared_cache_tier.override(providers.Object(None))
+    container.rerank_score_cache.override(providers.Object(None))
+    container.user_repository.override(providers.Singleton(FakeUserRepository))
+    container.chat_info_repository.override(providers.Singleton(FakeChatInfoRepository))
+    container.message_repository.override(providers.Singleton(FakeMessageRepository))
+    container.prompt_repository.override(providers.Singleton(FakePromptRepository))
+    container.haiqv_ollama_llm.override(
+        providers.Object(FakeLLM(args.token_interval_ms / 1000))
+    )
+    container.studio_http_client.override(
+        providers.Object(
+            httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=studio.create_app()),
+                base_url="http://studio",
+            )
+        )
+    )
+    container.rerank_http_client.override(
+        providers.Object(
+            httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=rerank.create_app(base_ms=5)),
+                base_url="http://rerank",
+            )
+        )
+    )
+    return container
+
+
+async def run_turn(container: Container, user_id: str, query: str) -> List[str]:
+    chat_id = await container.chat_info_repository().save(ChatInfo(owner_id=user_id))
+    frames = []
+    async for frame in container.message_generator()(
+        chat_id=chat_id,
+        user_id=user_id,
+        user_query=query,
+        app_id="ford",
+        verbose=False,
+    ):
+        frames.append(frame.removeprefix("data:"))
+    return frames
+
+
+def turn_error(frames: List[str]) -> Optional[str]:
+    """완료되지 않은 턴의 사유 (참조 문서 프레임은 JSON 이 아니므로 접두어로만 구분)"""
+    for frame in frames:
+        if frame.startswith('{"control_signal":"error_occurred"'):
+            return json.loads(frame)["detail"] or "error_occurred"
+    if not any(frame.startswith('{"v":') for frame in frames):
+        return "답변 토큰 없음"
+    return None
+
+
+async def main(args: argparse.Namespace) -> int:
+    container = build_container(args)
+    queries = ["서울 지하철 노선", "rerank passage batching", "분기 보고서 일정"]
+    # 첫 턴의 초기화(Singleton 생성, tokenizer 로드 등)는 점검 대상에서 제외
+    await run_turn(container, "warmup", "warmup")
+    # 운영 워커와 같이 기동 시점 객체를 GC 대상에서 제외 (gunicorn.conf.py pre_fork)
+    gc.freeze()
+    try:
+        async with detect_blocking(
+            threshold_ms=args.threshold_ms, interval_ms=args.interval_ms
+        ) as monitor:
+            results = await asyncio.gather(
+                *(
+                    run_turn(container, f"user-{i % 3}", queries[i % len(queries)])
+                    for i in range(args.turns)
+                )
+            )
+    except BlockingCallError as e:
+        print(e)
+        return 1
+
+    errors = [error for error in map(turn_error, results) if error]
+    print(
+        f"{len(results)} turn(s), {len(errors)} failed, "
+        f"max loop lag {monitor.max_lag * 1000:.1f}ms "
+        f"(threshold {args.threshold_ms:g}ms): no blocking calls"
+    )
+    for error in errors:
+        print(f"  {error}")
+    return 1 if errors else 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="pipeline blocking check (offline)")
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--token-interval-ms", type=float, default=2)
+    parser.add_argument("--threshold-ms", type=float, default=50)
+    parser.add_argument("--interval-ms", type=float, default=10)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,392 @@
+"""
+로그 컬렉션 기반 요청 재현(replay)
+
+log_request 가 남긴 START 로그(http / args) 중 시간 구간 내 요청을 읽어,
+원래 간격을 speed 배로 압축해 대상 배포에 다시 보내고 원 실행과 지연 / 오류를 비교한다.
+대상은 가짜 업스트림(tools.fake_servers)에 연결된 배포를 가정한다.
+
+    python -m tools.replay --target http://localhost:8000 \\
+        --start 2025-06-01T09:00:00 --end 2025-06-01T09:10:00 --speed 5 \\
+        --output reports/replay_$(git rev-parse --short HEAD).json
+
+- 원 사용자마다 재현용 사용자를 가입 / 로그인시키고, 원 chat_id 는 재현용 채팅으로 치환한다.
+- 로그인 / 가입 / 관리자 API 는 재현하지 않는다.
+- 원 지연(elapsed_ms)은 핸들러 반환까지의 시간이므로 재현의 응답 헤더 수신 시간과 비교한다.
+- --speed 0 은 간격 없이 최대 속도로 보낸다 (동시성은 --concurrency 로 제한).
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from tools.load_test import git_commit, percentiles
+
+SKIP_FUNCTIONS = {"signup", "login"}
+SKIP_PATH_PREFIXES = ("/api/admin",)
+BODY_METHODS = {"POST", "PUT", "PATCH"}
+
+
+@dataclass
+class LoggedRequest:
+    when: datetime
+    trace_id: str
+    function: str
+    user_id: str
+    method: str
+    path: str
+    path_params: Dict[str, str]
+    query: Dict[str, str]
+    body: Optional[dict]
+    original_ms: Optional[float] = None
+    original_error: bool = False
+
+
+@dataclass
+class ReplayResult:
+    function: str
+    status: int = 0
+    error: Optional[str] = None
+    offset: float = 0.0
+    lag: float = 0.0
+    headers_ms: Optional[float] = None
+    completed_ms: Optional[float] = None
+    original_ms: Optional[float] = None
+    original_error: bool = False
+
+
+def _parse_time(value: str) -> datetime:
+    when = datetime.fromisoformat(value)
+    return when if when.tzinfo else when.replace(tzinfo=UTC)
+
+
+def _body(args: dict) -> Optional[dict]:
+    """args 중 요청 본문 DTO (dict) 를 찾는다"""
+    bodies = [v for v in args.values() if isinstance(v, dict)]
+    return bodies[0] if len(bodies) == 1 else None
+
+
+async def load_requests(
+    mongo_uri: str,
+    db_name: str,
+    collection: str,
+    start: datetime,
+    end: datetime,
+    functions: List[str],
+    limit: int,
+) -> Tuple[List[LoggedRequest], int]:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    client = AsyncIOMotorClient(mongo_uri)
+    try:
+        coll = client[db_name][collection]
+        query = {
+            "state": "START",
+            "http": {"$exists": True},
+            "when": {"$gte": start.isoformat(), "$lt": end.isoformat()},
+        }
+        if functions:
+            query["functionName"] = {"$in": functions}
+
+        cursor = coll.find(query).sort("when", 1)
+        if limit:
+            cursor = cursor.limit(limit)
+
+        requests: List[LoggedRequest] = []
+        skipped = 0
+        async for doc in cursor:
+            http = doc["http"]
+            if doc.get("functionName") in SKIP_FUNCTIONS or http["path"].startswith(
+                SKIP_PATH_PREFIXES
+            ):
+                skipped += 1
+                continue
+            requests.append(
+                LoggedRequest(
+                    when=_parse_time(doc["when"]),
+                    trace_id=doc["trace_id"],
+                    function=doc.get("functionName") or "",
+                    user_id=doc.get("user_id") or "anonymous",
+                    method=http["method"],
+                    path=http["path"],
+                    path_params=http.get("path_params") or {},
+                    query=http.get("query") or {},
+                    body=(
+                        _body(doc.get("args") or {})
+                        if http["method"] in BODY_METHODS
+                        else None
+                    ),
+                )
+            )
+
+        # 원 실행 결과 (END / EXCEPTION)
+        by_trace = {r.trace_id: r for r in requests}
+        async for doc in coll.find(
+            {
+                "trace_id": {"$in": list(by_trace)},
+                "state": {"$in": ["END", "EXCEPTION"]},
+            },
+            {"trace_id": 1, "state": 1, "elapsed_ms": 1},
+        ):
+            request = by_trace[doc["trace_id"]]
+            request.original_ms = doc.get("elapsed_ms")
+            request.original_error = doc["state"] == "EXCEPTION"
+        return requests, skipped
+    finally:
+        client.close()
+
+
+class SessionMapper:
+    """원 사용자 / 채팅을 대상 배포의 재현용 사용자 / 채팅으로 치환"""
+
+    def __init__(self, client: httpx.AsyncClient, api_prefix: str, run_id: str):
+        self.client = client
+        self.api_prefix = api_prefix
+        self.run_id = run_id
+        self.tokens: Dict[str, str] = {}
+        self.chats: Dict[Tuple[str, str], str] = {}
+
+    async def prepare(self, requests: List[LoggedRequest]) -> None:
+        users = sorted({r.user_id for r in requests if r.user_id != "anonymous"})
+        await asyncio.gather(*(self._login(idx, u) for idx, u in enumerate(users)))
+
+        chat_keys = {
+            (r.user_id, r.path_params["chat_id"])
+            for r in requests
+            if "chat_id" in r.path_params and r.user_id in self.tokens
+        }
+        await asyncio.gather(*(self._create_chat(*key) for key in chat_keys))
+
+    async def _login(self, idx: int, original_user: str) -> None:
+        user_id = f"replay-{self.run_id}-{idx}"
+        password = "replay-password"
+        await self.client.post(
+            f"{self.api_prefix}/users/signup",
+            json={"user_id": user_id, "user_name": user_id, "password": password},
+        )
+        resp = await self.client.post(
+            f"{self.api_prefix}/users/login",
+            json={"userId": user_id, "password": password},
+        )
+        resp.raise_for_status()
+        self.tokens[original_user] = resp.json()["data"]["token"]
+
+    async def _create_chat(self, original_user: str, original_chat: str) -> None:
+        resp = await self.client.post(
+            f"{self.api_prefix}/v2/chats", headers=self.headers(original_user)
+        )
+        resp.raise_for_status()
+        self.chats[(original_user, original_chat)] = resp.json()["id"]
+
+    def headers(self, original_user: str) -> Dict[str, str]:
+        token = self.tokens.get(original_user)
+        return {"Authorization": f"Bearer {token}"} if token else {}
+
+    def path(self, request: LoggedRequest) -> str:
+        path = request.path
+        original_chat = request.path_params.get("chat_id")
+        mapped = self.chats.get((request.user_id, original_chat))
+        if original_chat and mapped:
+            path = path.replace(original_chat, mapped)
+        return path
+
+
+async def replay_one(
+    client: httpx.AsyncClient,
+    sessions: SessionMapper,
+    request: LoggedRequest,
+    offset: float,
+    started: float,
+) -> ReplayResult:
+    result = ReplayResult(
+        function=request.function,
+        offset=offset,
+        original_ms=request.original_ms,
+        original_error=request.original_error,
+    )
+    sent = time.perf_counter()
+    result.lag = sent - started - offset
+    try:
+        async with client.stream(
+            request.method,
+            sessions.path(request),
+            params=request.query,
+            json=request.body,
+            headers=sessions.headers(request.user_id),
+        ) as resp:
+            result.status = resp.status_code
+            result.headers_ms = (time.perf_counter() - sent) * 1000
+            async for line in resp.aiter_lines():
+                if '"error_occurred"' in line:
+                    result.error = "error_occurred"
+        result.completed_ms = (time.perf_counter() - sent) * 1000
+        if result.status >= 400:
+            result.error = f"HTTP {result.status}"
+    except httpx.HTTPError as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def summarize(results: List[ReplayResult]) -> dict:
+    original = [r.original_ms / 1000 for r in results if r.original_ms is not None]
+    replay = [r.headers_ms / 1000 for r in results if r.headers_ms is not None]
+    original_p95 = percentiles(original)["p95"]
+    replay_p95 = percentiles(replay)["p95"]
+    return {
+        "requests": len(results),
+        "original_errors": sum(1 for r in results if r.original_error),
+        "replay_errors": sum(1 for r in results if r.error),
+        "error_diff": [
+            {"function": r.function, "offset": round(r.offset, 3), "error": r.error}
+            for r in results
+            if bool(r.error) != r.original_error
+        ][:50],
+        "original_latency": percentiles(original),
+        "replay_latency": percentiles(replay),
+        "replay_completion": percentiles(
+            [r.completed_ms / 1000 for r in results if r.completed_ms is not None]
+        ),
+        "p95_change": (
+            round(replay_p95 / original_p95 - 1, 4)
+            if original_p95 and replay_p95
+            else None
+        ),
+        "schedule_lag": percentiles([max(0.0, r.lag) for r in results]),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    requests, skipped = await load_requests(
+        args.mongo_uri,
+        args.db,
+        args.collection,
+        _parse_time(args.start),
+        _parse_time(args.end),
+        [f for f in args.functions.split(",") if f],
+        args.limit,
+    )
+    if not requests:
+        raise SystemExit("재현할 요청이 없습니다")
+
+    run_id = uuid.uuid4().hex[:8]
+    limits = httpx.Limits(max_connections=args.concurrency + 10)
+    timeout = httpx.Timeout(args.timeout, connect=10)
+    async with httpx.AsyncClient(
+        base_url=args.target, limits=limits, timeout=timeout
+    ) as client:
+        sessions = SessionMapper(client, args.api_prefix, run_id)
+        await sessions.prepare(requests)
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        origin = requests[0].when
+
+        async def _one(request: LoggedRequest) -> ReplayResult:
+            offset = (
+                (request.when - origin).total_seconds() / args.speed
+                if args.speed > 0
+                else 0.0
+            )
+            delay = started + offset - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            async with semaphore:
+                return await replay_one(client, sessions, request, offset, started)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(_one(r) for r in requests))
+        elapsed = time.perf_counter() - started
+
+    by_function: Dict[str, List[ReplayResult]] = {}
+    for r in results:
+        by_function.setdefault(r.function, []).append(r)
+
+    return {
+        "run_id": run_id,
+        "commit": git_commit(),
+        "started_at": datetime.now(UTC).isoformat(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("mongo_uri",)},
+        "window": {
+            "first": requests[0].when.isoformat(),
+            "last": requests[-1].when.isoformat(),
+        },
+        "skipped": skipped,
+        "elapsed_seconds": round(elapsed, 3),
+        "summary": summarize(results),
+        "by_function": {
+            name: summarize(rs) for name, rs in sorted(by_function.items())
+        },
+        "raw": [asdict(r) for r in results] if args.raw else None,
+    }
+
+
+def print_summary(report: dict) -> None:
+    print(
+        f"replayed {report['summary']['requests']} (skipped {report['skipped']})"
+        f" in {report['elapsed_seconds']}s"
+    )
+    print(
+        f"{'function':<28} {'n':>5} {'orig p50':>10} {'orig p95':>10}"
+        f" {'replay p50':>11} {'replay p95':>11} {'p95 chg':>8} {'err o/r':>8}"
+    )
+    rows = list(report["by_function"].items()) + [("(total)", report["summary"])]
+    for name, row in rows:
+        change = row["p95_change"]
+        print(
+            f"{name:<28} {row['requests']:>5}"
+            f" {_ms(row['original_latency']['p50'])} {_ms(row['original_latency']['p95'])}"
+            f" {_ms(row['replay_latency']['p50'])} {_ms(row['replay_latency']['p95'])}"
+            f" {f'{change * 100:+.1f}%' if change is not None else '-':>8}"
+            f" {row['original_errors']:>3}/{row['replay_errors']:<4}"
+        )
+
+
+def _ms(value: Optional[float]) -> str:
+    return f"{value * 1000:>9.1f}ms" if value is not None else f"{'-':>11}"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="replay logged requests")
+    parser.add_argument("--target", default="http://localhost:8000")
+    parser.add_argument("--api-prefix", default="/api")
+    parser.add_argument("--start", required=True, help="ISO 시각 (UTC 기본)")
+    parser.add_argument("--end", required=True, help="ISO 시각 (UTC 기본)")
+    parser.add_argument("--speed", type=float, default=1.0, help="0 = 최대 속도")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--functions", default="", help="쉼표 구분 functionName")
+    parser.add_argument("--limit", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--mongo-uri", default="", help="기본: 서비스 설정의 Mongo")
+    parser.add_argument("--db", default="")
+    parser.add_argument("--collection", default="")
+    parser.add_argument("--output", default="")
+    parser.add_argument("--raw", action="store_true", help="요청별 원자료 포함")
+    args = parser.parse_args()
+
+    if not (args.mongo_uri and args.db and args.collection):
+        from config import get_settings
+
+        mongo = get_settings().mongo
+        args.mongo_uri = args.mongo_uri or (
+            f"mongodb://{mongo.mongodb_id}:{mongo.mongodb_pw}"
+            f"@{mongo.mongodb_host}:{mongo.mongodb_port}/?{mongo.query_string}"
+        )
+        args.db = args.db or mongo.mongodb_db
+        args.collection = args.collection or mongo.mongodb_log
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    print_summary(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"report: {args.output}")
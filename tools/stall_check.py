@@ -0,0 +1,146 @@
+"""
+중단(stalled) 저장 내용 점검
+
+GeneratorService.stream_answer 를 가짜 LLM / 저장소로 실행하면서
+토큰 수신 중, 중간 flush 저장 중, 마지막 flush 저장 중에 취소를 넣고,
+stalled 로 저장된 content 가 실제로 받은 토큰과 정확히 같은지(중복 / 누락 없음)와
+resume_offset 이 그 길이인지 확인한다. 불일치가 있으면 exit 1.
+드레인 timeout 과 같은 경로(coalesce 의 pump 태스크 취소)로 실행한다.
+
+    python -m tools.stall_check
+    python -m tools.stall_check --tokens 50 --flush-every 2
+"""
+
+import argparse
+import asyncio
+import sys
+from types import SimpleNamespace
+from typing import List, Optional
+
+from application.messages.frames import coalesce_tokens
+from application.service.generator import GeneratorService
+from application.service.handler import HandlerService
+from domain.chats.models.stream_options import StreamOptions
+from domain.messages.models.message import AIMessage, HumanMessage
+from domain.plans.plan import PlanInfo
+
+
+class FakeRepository:
+    """block_on_call 번째 update 에서 멈춤 (저장 중 취소 재현)"""
+
+    def __init__(self, block_on_call: Optional[int]):
+        self.block_on_call = block_on_call
+        self.calls = 0
+        self.blocked = asyncio.Event()
+
+    async def update(self, message) -> bool:
+        self.calls += 1
+        if self.calls == self.block_on_call:
+            self.blocked.set()
+            await asyncio.Event().wait()
+        await asyncio.sleep(0)
+        return True
+
+
+class FakeLLM:
+    def __init__(self, tokens: int, received: List[str]):
+        self.tokens = tokens
+        self.received = received
+
+    async def astream(self, messages):
+        for i in range(self.tokens):
+            await asyncio.sleep(0.001)
+            token = f"t{i} "
+            self.received.append(token)
+            yield SimpleNamespace(content=token)
+
+
+class FakePrompts:
+    async def get_prompt(self, name: str) -> str:
+        return "prompt"
+
+    async def make_tool_prompt(self, **kwargs) -> str:
+        return ""
+
+
+async def run_case(
+    tokens: int, flush_every: int, block_on_call: Optional[int], cancel_after: int
+) -> Optional[str]:
+    """실패 시 사유를 반환"""
+    repository = FakeRepository(block_on_call)
+    handler = HandlerService(repository)
+    received: List[str] = []
+    generator = GeneratorService(handler, FakePrompts(), FakeLLM(tokens, received))
+    assistant_msg = AIMessage(chat_id="chat", status="progressing")
+
+    async def consume() -> None:
+        async for _ in coalesce_tokens(
+            generator.stream_answer(
+                app_id="app",
+                user_id="user",
+                chat_history=[],
+                user_msg=HumanMessage(chat_id="chat", content="query"),
+                assistant_msg=assistant_msg,
+                plan=PlanInfo(),
+                flush_every=flush_every,
+            ),
+            StreamOptions(token_window_ms=5),
+        ):
+            pass
+
+    task = asyncio.create_task(consume())
+    if block_on_call is not None:
+        await repository.blocked.wait()
+    else:
+        while len(received) < cancel_after and not task.done():
+            await asyncio.sleep(0.001)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    if assistant_msg.status == "complete":
+        return "취소 전에 완료됨 (--tokens 를 늘릴 것)"
+    await handler.mark_stalled(assistant_msg, "shutdown")
+
+    expected = "".join(received)
+    content = assistant_msg.content or ""
+    if content != expected:
+        return f"content 불일치: saved={content!r} received={expected!r}"
+    if assistant_msg.metadata["resume_offset"] != str(len(expected)):
+        return f"resume_offset {assistant_msg.metadata['resume_offset']} != {len(expected)}"
+    return None
+
+
+async def main(args: argparse.Namespace) -> int:
+    # (이름, 막을 update 호출 순번, 토큰 수신 후 취소 시점)
+    cases = [
+        ("token 수신 중", None, args.flush_every * 2 + 1),
+        ("첫 flush 저장 중", 1, 0),
+        ("중간 flush 저장 중", 3, 0),
+    ]
+    failures = 0
+    for name, block_on_call, cancel_after in cases:
+        reason = await run_case(
+            args.tokens, args.flush_every, block_on_call, cancel_after
+        )
+        print(f"{name:<20} {'OK' if reason is None else 'FAILED ' + reason}")
+        failures += reason is not None
+
+    # 마지막 flush(토큰 수가 flush_every 배수가 아닐 때 남은 buffer) 저장 중 취소
+    tokens = args.tokens // args.flush_every * args.flush_every + 1
+    reason = await run_case(tokens, args.flush_every, tokens // args.flush_every + 1, 0)
+    print(
+        f"{'마지막 flush 저장 중':<20} {'OK' if reason is None else 'FAILED ' + reason}"
+    )
+    failures += reason is not None
+    return 1 if failures else 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="stalled content check")
+    parser.add_argument("--tokens", type=int, default=30)
+    parser.add_argument("--flush-every", type=int, default=2)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
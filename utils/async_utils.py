@@ -1,4 +1,7 @@
-from typing import AsyncIterator, TypeVar
+import asyncio
+import math
+from contextlib import aclosing
+from typing import AsyncGenerator, AsyncIterator, Callable, List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -9,3 +12,80 @@ async def aenumerate(aiter: AsyncIterator[T], start: int = 0):
     async for item in aiter:
         yield idx, item
         idx += 1
+
+
+async def coalesce(
+    source: AsyncGenerator[T, None],
+    window: float,
+    max_size: int = 0,
+    size: Optional[Callable[[T], int]] = None,
+) -> AsyncGenerator[List[T], None]:
+    """
+    source 의 항목을 시간 / 크기 기준으로 묶어 배치(List)로 전달한다. (SSE 프레임 수 절감)
+
+    - 직전 배치 후 window 초가 지났으면 즉시, 아니면 window 가 끝날 때 그동안 모인 항목을 전달
+      (첫 항목은 바로 전달되므로 첫 토큰 지연은 늘지 않는다)
+    - max_size > 0 이면 size(항목) 합이 max_size 이상이 되는 즉시 전달
+    - window <= 0 이면 항목마다 전달
+
+    source 는 별도 태스크 하나에서 끝까지 소비되고(그 안의 span 이 한 컨텍스트에 유지됨),
+    source 의 예외는 모인 항목을 모두 전달한 뒤 그대로 전파된다.
+    소비가 중단되면 source 에 취소가 전달되며 정리가 끝날 때까지 기다린다.
+    """
+    if window <= 0:
+        async with aclosing(source):
+            async for item in source:
+                yield [item]
+        return
+
+    loop = asyncio.get_running_loop()
+    ready = asyncio.Event()
+    batch: List[T] = []
+    batch_size = 0
+    last_emit = -math.inf
+    timer: Optional[asyncio.TimerHandle] = None
+    done = False
+    error: Optional[Exception] = None
+
+    async def _pump() -> None:
+        nonlocal batch_size, timer, done, error
+        try:
+            async with aclosing(source):
+                async for item in source:
+                    batch.append(item)
+                    if size is not None:
+                        batch_size += size(item)
+                    if ready.is_set():
+                        continue
+                    due = last_emit + window - loop.time()
+                    if due <= 0 or (max_size and batch_size >= max_size):
+                        ready.set()
+                    elif timer is None:
+                        timer = loop.call_later(due, ready.set)
+        except Exception as e:
+            error = e
+        finally:
+            done = True
+            ready.set()
+
+    pump = asyncio.create_task(_pump())
+    try:
+        while True:
+            await ready.wait()
+            ready.clear()
+            if timer is not None:
+                timer.cancel()
+                timer = None
+            if batch:
+                items, batch = batch, []
+                batch_size = 0
+                last_emit = loop.time()
+                yield items
+            if done and not batch:
+                break
+        if error is not None:
+            raise error
+    finally:
+        if not pump.done():
+            pump.cancel()
+            await asyncio.wait({pump})
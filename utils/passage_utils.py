@@ -0,0 +1,142 @@
+import logging
+import math
+import re
+from functools import lru_cache
+from typing import Callable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?。？！])\s+|\n+")
+
+
+@lru_cache(maxsize=4)
+def get_tokenizer(name: str):
+    """프로세스당 한 번만 로드되는 HuggingFace tokenizer"""
+    from transformers import AutoTokenizer
+
+    return AutoTokenizer.from_pretrained(name)
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in _SENTENCE_RE.split(text) if s and s.strip()]
+
+
+class PassageSlicer:
+    """
+    리랭크용 passage 분할기
+
+    - 문장 경계 기준으로 max_tokens 이하가 되도록 묶고, 이전 passage 끝 문장을
+      overlap 토큰 이내로 다음 passage 앞에 겹쳐 붙인다.
+    - tokenizer_name 이 없거나 로드에 실패하면 글자 수를 토큰 수로 사용한다.
+    - 요청당 passage 수는 max_passages 로 제한하되, 문서마다 최소 1 개는 유지한다.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        overlap: int = 0,
+        max_passages: int = 0,
+        tokenizer_name: str = "",
+        cache_size: int = 4096,
+    ):
+        self.max_tokens = max_tokens
+        self.overlap = overlap
+        self.max_passages = max_passages
+        self.count_tokens = self._load_counter(tokenizer_name)
+        self.split = lru_cache(maxsize=cache_size)(self._split)
+
+    @staticmethod
+    def _load_counter(tokenizer_name: str) -> Callable[[List[str]], List[int]]:
+        if tokenizer_name:
+            try:
+                tokenizer = get_tokenizer(tokenizer_name)
+            except Exception as e:
+                logger.warning(
+                    f"tokenizer '{tokenizer_name}' 로드 실패, 글자 수 기준으로 분할합니다: {e}"
+                )
+            else:
+                return lambda texts: [
+                    len(ids)
+                    for ids in tokenizer(list(texts), add_special_tokens=False)[
+                        "input_ids"
+                    ]
+                ]
+        return lambda texts: [len(t) for t in texts]
+
+    def slice_documents(self, texts: Sequence[str]) -> Tuple[List[str], List[int]]:
+        """문서 목록을 passage 목록과 passage → 문서 인덱스 매핑으로 변환"""
+        per_doc = [self.split(text) for text in texts]
+
+        passages: List[str] = []
+        origin_map: List[int] = []
+        budget = self.max_passages or sum(len(p) for p in per_doc)
+
+        # 문서별로 돌아가며 하나씩 채워 상한 내에서 문서 간 균형 유지
+        for rank in range(max((len(p) for p in per_doc), default=0)):
+            for idx, doc_passages in enumerate(per_doc):
+                if rank >= len(doc_passages):
+                    continue
+                if rank > 0 and len(passages) >= budget:
+                    continue
+                passages.append(doc_passages[rank])
+                origin_map.append(idx)
+        return passages, origin_map
+
+    def _split(self, text: str) -> Tuple[str, ...]:
+        sentences = split_sentences(text)
+        if not sentences:
+            return ("",)
+
+        units: List[str] = []
+        counts: List[int] = []
+        for sentence, count in zip(sentences, self.count_tokens(sentences)):
+            if count <= self.max_tokens:
+                units.append(sentence)
+                counts.append(count)
+                continue
+            pieces = self._hard_split(sentence, count)
+            units.extend(pieces)
+            counts.extend(self.count_tokens(pieces))
+
+        passages: List[str] = []
+        current: List[int] = []
+        size = 0
+        for i, count in enumerate(counts):
+            if current and size + count > self.max_tokens:
+                passages.append(" ".join(units[j] for j in current))
+                # 끝 문장들을 overlap 이내로 다음 passage 에 이어 붙임
+                carried: List[int] = []
+                carried_size = 0
+                for j in reversed(current):
+                    if carried_size + counts[j] > self.overlap:
+                        break
+                    if carried_size + counts[j] + count > self.max_tokens:
+                        break
+                    carried.insert(0, j)
+                    carried_size += counts[j]
+                current, size = carried, carried_size
+            current.append(i)
+            size += count
+        passages.append(" ".join(units[j] for j in current))
+        return tuple(passages)
+
+    def _hard_split(self, sentence: str, count: int) -> List[str]:
+        """max_tokens 보다 긴 문장은 공백 위치를 우선하여 비슷한 길이로 자름"""
+        n_pieces = math.ceil(count / self.max_tokens)
+        target = math.ceil(len(sentence) / n_pieces)
+        # 토큰/글자 비율 추정 오차를 고려해 조금 짧게 자름
+        target = max(1, int(target * 0.9))
+
+        pieces: List[str] = []
+        start = 0
+        while start < len(sentence):
+            end = min(len(sentence), start + target)
+            if end < len(sentence):
+                space = sentence.rfind(" ", start + target // 2, end)
+                if space > start:
+                    end = space
+            piece = sentence[start:end].strip()
+            if piece:
+                pieces.append(piece)
+            start = end
+        return pieces
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+import zlib
+from typing import TYPE_CHECKING, List, Literal, Sequence
+
+# numpy 는 리랭크 경로에서만 필요하므로 함수 안에서 import (기동 시 로드하지 않음)
+if TYPE_CHECKING:
+    import numpy as np
+
+Aggregation = Literal["max", "mean_top_k"]
+Normalization = Literal["none", "minmax", "sigmoid"]
+
+_WORD_RE = re.compile(r"\w+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 질의 정규화 (NFKC, 소문자, 공백 정리, 끝 문장부호 제거)"""
+    query = unicodedata.normalize("NFKC", query).lower()
+    return _SPACE_RE.sub(" ", query).strip().rstrip("?!.。？！ ")
+
+
+def score_cache_key(normalized_query: str, passage: str) -> str:
+    content_hash = hashlib.sha1(passage.encode()).hexdigest()
+    return hashlib.sha1(f"{normalized_query}\x00{content_hash}".encode()).hexdigest()
+
+
+def aggregate_scores(
+    scores: Sequence[float],
+    origin_map: Sequence[int],
+    n_docs: int,
+    method: Aggregation = "max",
+    top_k: int = 2,
+) -> np.ndarray:
+    """
+    passage 점수를 문서 단위로 집계
+    - max: 문서 내 최고 점수
+    - mean_top_k: 문서 내 상위 top_k passage 점수 평균
+    """
+    import numpy as np
+
+    scores = np.asarray(scores, dtype=np.float64)
+    origin = np.asarray(origin_map, dtype=np.intp)
+    doc_scores = np.full(n_docs, -np.inf)
+    if scores.size == 0:
+        return doc_scores
+
+    if method == "max":
+        np.maximum.at(doc_scores, origin, scores)
+        return doc_scores
+
+    if method == "mean_top_k":
+        # 문서 순, 점수 내림차순 정렬 후 문서 내 순위가 top_k 미만인 것만 평균
+        order = np.lexsort((-scores, origin))
+        sorted_origin = origin[order]
+        starts = np.searchsorted(sorted_origin, sorted_origin, side="left")
+        keep = (np.arange(order.size) - starts) < top_k
+        sums = np.bincount(sorted_origin[keep], scores[order][keep], minlength=n_docs)
+        counts = np.bincount(sorted_origin[keep], minlength=n_docs)
+        has = counts > 0
+        doc_scores[has] = sums[has] / counts[has]
+        return doc_scores
+
+    raise ValueError(f"지원하지 않는 집계 방식: {method}")
+
+
+def normalize_scores(scores: np.ndarray, method: Normalization = "none") -> np.ndarray:
+    """
+    문서 점수 정규화 (-inf 는 점수 없음으로 보고 0 처리)
+    - minmax: 후보 내 상대 점수 [0, 1]
+    - sigmoid: logit 형태 점수를 절대 척도 [0, 1] 로 변환
+    """
+    import numpy as np
+
+    if method == "none":
+        return scores
+
+    finite = np.isfinite(scores)
+    out = np.zeros_like(scores)
+    if not finite.any():
+        return out
+
+    if method == "minmax":
+        lo, hi = scores[finite].min(), scores[finite].max()
+        out[finite] = (scores[finite] - lo) / (hi - lo) if hi > lo else 1.0
+        return out
+
+    if method == "sigmoid":
+        out[finite] = 1.0 / (1.0 + np.exp(-scores[finite]))
+        return out
+
+    raise ValueError(f"지원하지 않는 정규화 방식: {method}")
+
+
+def top_n_indices(scores: np.ndarray, n: int) -> np.ndarray:
+    """점수 상위 n 개의 인덱스 (내림차순). 전체 정렬 대신 argpartition 사용"""
+    import numpy as np
+
+    n = min(n, scores.size)
+    if n <= 0:
+        return np.empty(0, dtype=np.intp)
+    if n < scores.size:
+        part = np.argpartition(-scores, n - 1)[:n]
+    else:
+        part = np.arange(scores.size)
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+def lexical_vectors(texts: Sequence[str], dim: int = 1024) -> np.ndarray:
+    """
+    단어 + 문자 bigram 을 해싱한 L2 정규화 벡터 (문서 간 유사도 계산용)
+    한국어는 조사 결합으로 단어가 달라지므로 문자 bigram 을 함께 사용한다.
+    """
+    import numpy as np
+
+    rows: List[int] = []
+    cols: List[int] = []
+    for row, text in enumerate(texts):
+        for word in _WORD_RE.findall(text.lower()):
+            rows.append(row)
+            cols.append(zlib.crc32(word.encode()) % dim)
+            for i in range(len(word) - 1):
+                rows.append(row)
+                cols.append(zlib.crc32(word[i : i + 2].encode()) % dim)
+
+    vectors = np.zeros((len(texts), dim), dtype=np.float32)
+    np.add.at(vectors, (rows, cols), 1.0)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+def mmr_select(
+    relevance: np.ndarray,
+    vectors: np.ndarray,
+    n: int,
+    lambda_: float = 0.7,
+) -> List[int]:
+    """
+    Maximal Marginal Relevance 선택
+    lambda_ * 관련도 - (1 - lambda_) * 이미 선택된 문서와의 최대 유사도 가 큰 순으로 n 개
+    """
+    import numpy as np
+
+    n = min(n, relevance.size)
+    if n <= 0:
+        return []
+
+    similarity = vectors @ vectors.T
+    max_sim = np.zeros(relevance.size)
+    available = np.ones(relevance.size, dtype=bool)
+    selected: List[int] = []
+
+    for _ in range(n):
+        mmr = lambda_ * relevance - (1 - lambda_) * max_sim
+        mmr[~available] = -np.inf
+        best = int(np.argmax(mmr))
+        selected.append(best)
+        available[best] = False
+        np.maximum(max_sim, similarity[best], out=max_sim)
+
+    return selected
@@ -1,4 +1,6 @@
 import re
+import unicodedata
+from typing import List
 
 
 def extract_json_array(text: str) -> str:
@@ -7,3 +9,24 @@ def extract_json_array(text: str) -> str:
     if match:
         return match.group(0)
     return "[]"
+
+
+def normalize_keyword(keyword: str) -> str:
+    """검색 키워드 정규화 (NFKC, 공백 정리, 앞뒤 따옴표/문장부호 제거)"""
+    keyword = unicodedata.normalize("NFKC", keyword)
+    return re.sub(r"\s+", " ", keyword).strip(" \"'`.,;:!?")
+
+
+def keyword_key(keyword: str) -> str:
+    """대소문자와 띄어쓰기만 다른 키워드를 같은 것으로 보는 비교/캐시 키"""
+    return normalize_keyword(keyword).casefold().replace(" ", "")
+
+
+def dedupe_keywords(keyword_list: List[str]) -> List[str]:
+    """정규화 후 중복 키워드 제거 (처음 나온 표기 유지)"""
+    seen = {}
+    for keyword in keyword_list:
+        key = keyword_key(keyword)
+        if key and key not in seen:
+            seen[key] = normalize_keyword(keyword)
+    return list(seen.values())